@@ -0,0 +1,183 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import math
+import os
+import random
+import string
+import time
+from typing import Dict, List, Optional
+
+from checker import InstagramUsernameChecker, INSTAGRAM_URL
+from utils import RateLimiter, print_colored_message
+
+DEFAULT_PROFILE_PATH = os.path.join(os.path.expanduser("~"), ".config", "instagram_checker", "profile.json")
+
+
+def load_profile(path: Optional[str] = None) -> Dict:
+    """
+    Load a saved throughput profile
+
+    Args:
+        path: Profile path (default: DEFAULT_PROFILE_PATH)
+
+    Returns:
+        Profile dictionary, or an empty dict when none is saved
+    """
+    path = path or DEFAULT_PROFILE_PATH
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_profile(profile: Dict, path: Optional[str] = None):
+    """Write a throughput profile to disk"""
+    path = path or DEFAULT_PROFILE_PATH
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2)
+
+
+def calibration_usernames(count: int) -> List[str]:
+    """Random, valid, almost certainly unregistered names for calibration trials"""
+    alphabet = string.ascii_lowercase + string.digits
+    return ["tune" + ''.join(random.choice(alphabet) for _ in range(10)) for _ in range(count)]
+
+
+class AutoTuner:
+    """
+    Searches for the worker count and request rate that maximize successful
+    checks per minute while keeping the throttling (403/429) rate under a threshold
+
+    The request rate is raised geometrically between short trials, with enough
+    workers to keep the rate busy given the round-trip time measured in the
+    previous trial, until throttling exceeds the threshold, throughput stops improving
+    or the request cap is spent.
+    """
+
+    def __init__(self, base_url: str = INSTAGRAM_URL, proxy: Optional[str] = None,
+                 max_requests: int = 300, max_throttle_rate: float = 0.02,
+                 trial_checks: int = 30, trial_seconds: float = 20.0, start_rate: float = 0.5, max_workers: int = 32,
+                 safety_margin: float = 0.8):
+        """
+        Args:
+            base_url: Endpoint to calibrate against (Instagram or a local stand-in)
+            proxy: Proxy URL used for calibration traffic
+            max_requests: Hard cap on requests sent during the whole calibration
+            max_throttle_rate: Highest acceptable share of throttled responses
+            trial_checks: Most usernames checked per trial
+            trial_seconds: Target trial duration; slow rates use fewer names
+            start_rate: First request rate tried (requests/second)
+            max_workers: Upper bound for the worker count
+            safety_margin: Fraction of the best measured rate written to the profile
+        """
+        self.base_url = base_url
+        self.proxy = proxy
+        self.max_requests = max_requests
+        self.max_throttle_rate = max_throttle_rate
+        self.trial_checks = trial_checks
+        self.trial_seconds = trial_seconds
+        self.start_rate = start_rate
+        self.max_workers = max_workers
+        self.safety_margin = safety_margin
+        self.requests_used = 0
+        self.trials: List[Dict] = []
+
+    def run_trial(self, workers: int, rate: float, checks: int) -> Dict:
+        """
+        Check a batch of calibration names with the given settings
+
+        Returns:
+            Trial measurements (throughput, throttle rate, latency)
+        """
+        checker = InstagramUsernameChecker(
+            proxy=self.proxy,
+            max_workers=workers,
+            rate_limiter=RateLimiter(rate),
+            base_url=self.base_url,
+            deadline=20.0,
+            max_retries=0,
+            max_attempts=1
+        )
+        round_trips = []
+        checker.session.hooks['response'].append(lambda r, *args, **kwargs: round_trips.append(r.elapsed.total_seconds()))
+        
+        started = time.monotonic()
+        for _ in checker.iter_check(calibration_usernames(checks)):
+            pass
+        elapsed = time.monotonic() - started
+
+        stats = checker.get_stats()
+        counts = checker.get_http_status_counts()
+        requests_sent = sum(counts.values())
+        throttled = counts.get(429, 0) + counts.get(403, 0)
+        self.requests_used += requests_sent
+
+        trial = {
+            'workers': workers,
+            'rate': round(rate, 3),
+            'requests': requests_sent,
+            'elapsed': round(elapsed, 2),
+            'checks_per_minute': round((stats['available'] + stats['unavailable']) / elapsed * 60, 1) if elapsed else 0.0,
+            'throttle_rate': round(throttled / requests_sent, 4) if requests_sent else 0.0,
+            'latency_p50': checker.get_latency_stats()['p50'],
+            'round_trip': round(sum(round_trips) / len(round_trips), 3) if round_trips else 0.0
+        }
+        self.trials.append(trial)
+        color = "green" if trial['throttle_rate'] <= self.max_throttle_rate else "red"
+        print_colored_message(
+            f"🧪 workers={workers:<3} rate={trial['rate']:<6} -> {trial['checks_per_minute']} checks/min, "
+            f"{trial['throttle_rate'] * 100:.1f}% throttled, p50 {trial['latency_p50']:.2f}s", color)
+        return trial
+
+    def tune(self) -> Dict:
+        """
+        Run the calibration search
+
+        Returns:
+            Profile with the chosen workers and rate
+        """
+        rate = self.start_rate
+        round_trip = 1.0
+        best = None
+
+        while True:
+            # Each trial's fresh checker fetches a CSRF token once, then a check
+            # sends at most 3 requests (token refresh, API, profile fallback)
+            remaining = self.max_requests - self.requests_used
+            checks = min(self.trial_checks, (remaining - 1) // 3, max(5, math.ceil(rate * self.trial_seconds)))
+            if checks < 5:
+                print_colored_message("⏹️  Request cap reached", "yellow")
+                break
+
+            workers = min(self.max_workers, max(1, math.ceil(rate * round_trip * 1.5)))
+            trial = self.run_trial(workers, rate, checks)
+            round_trip = max(trial['round_trip'], 0.01)
+
+            if trial['throttle_rate'] > self.max_throttle_rate:
+                break
+            if best and trial['checks_per_minute'] < best['checks_per_minute'] * 1.05:
+                break
+            best = trial
+            if workers >= self.max_workers:
+                break
+            rate *= 2
+
+        if best is None:
+            raise RuntimeError("No trial stayed under the throttle threshold; lower --tune-start-rate")
+
+        return {
+            'workers': best['workers'],
+            'rate': round(best['rate'] * self.safety_margin, 3),
+            'measured_checks_per_minute': best['checks_per_minute'],
+            'max_throttle_rate': self.max_throttle_rate,
+            'target': 'local' if self.base_url != INSTAGRAM_URL else 'instagram',
+            'requests_used': self.requests_used,
+            'tuned_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'trials': self.trials
+        }
@@ -0,0 +1,395 @@
+# By Moh0py dev github.com/Moh0py
+import argparse
+import contextlib
+import gc
+import io
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from checker import InstagramUsernameChecker
+from mock_server import MockInstagramServer
+from profile_parser import classify_profile_content
+from results import CheckResult, ResultStore, Verdict, Method
+from utils import print_colored_message, validate_username, format_bytes
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks_baseline.json")
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+PROFILE_PAGE_SIZE = 16 * 1024
+MIN_TIMED_SECONDS = 0.2
+SATURATION_WORKERS = (1, 2, 4, 8, 16, 32)
+
+
+def make_usernames(count: int, seed: int = 7) -> List[str]:
+    """Deterministic mix of plausible usernames, about 10% of them invalid"""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + string.digits
+    names = []
+    for i in range(count):
+        name = ''.join(rng.choice(alphabet) for _ in range(rng.randint(5, 16)))
+        if i % 10 == 0:
+            name = rng.choice(['_', '.', 'a..b', 'bad-', 'x' * 31]) + name
+        elif i % 3 == 0:
+            name = f"{name}{rng.choice('._')}{rng.randint(1, 99)}"
+        names.append(name)
+    return names
+
+
+def make_profile_pages(count: int) -> List[Tuple[bytes, str]]:
+    """Taken profile pages and "not found" pages, one streamed chunk each"""
+    pages = []
+    for i in range(count):
+        username = f"bench{i:07d}"
+        if i % 5 == 0:
+            body = "<html><head><title>Page not found</title></head><body>Sorry, this page isn't available."
+        else:
+            body = (f'<html><head><title>@{username}</title></head><body><script>'
+                    f'{{"graphql":{{"user":{{"id":"{i}","full_name":"Bench","biography":"",'
+                    f'"profile_pic_url":"x","username":"{username}"}}}}}}</script>')
+        body += '<div class="post"></div>' * max(0, (PROFILE_PAGE_SIZE - len(body)) // 24)
+        pages.append((body.encode('utf-8'), username))
+    return pages
+
+
+def quiet_checker() -> InstagramUsernameChecker:
+    checker = InstagramUsernameChecker()
+    logging.getLogger().setLevel(logging.WARNING)
+    return checker
+
+
+def bench_validate_username(n: int) -> Tuple[Callable, int]:
+    names = make_usernames(n)
+
+    def run():
+        for name in names:
+            validate_username(name)
+    return run, n
+
+
+def bench_generate_variations(n: int) -> Tuple[Callable, int]:
+    checker = quiet_checker()
+
+    def run():
+        random.seed(n)
+        with contextlib.redirect_stdout(io.StringIO()):
+            checker.generate_username_variations("benchmark", n)
+    return run, n
+
+
+def bench_profile_matching(n: int) -> Tuple[Callable, int]:
+    # One page per 100 names keeps the 1M tier at ~160 MB of HTML scanned
+    pages = make_profile_pages(max(10, n // 100))
+
+    def run():
+        for content, username in pages:
+            classify_profile_content(content, username)
+    return run, len(pages)
+
+
+def bench_result_construction(n: int) -> Tuple[Callable, int]:
+    names = make_usernames(n)
+
+    def run():
+        store = ResultStore()
+        for i, name in enumerate(names):
+            if i % 20 == 0:
+                store.add(CheckResult(name, Verdict.AVAILABLE, "Available (API ✅)", Method.API))
+            else:
+                store.add(CheckResult(name, Verdict.TAKEN, "Taken (API error ❌)", Method.API))
+    return run, n
+
+
+def bench_save_results(n: int) -> Tuple[Callable, int]:
+    checker = quiet_checker()
+    for i, name in enumerate(make_usernames(n)):
+        if i % 50 == 0:
+            verdict, status = Verdict.ERROR, "HTTP 429 (API)"
+        elif i % 20 == 0:
+            verdict, status = Verdict.AVAILABLE, "Available (API ✅)"
+        else:
+            verdict, status = Verdict.TAKEN, "Taken (API error ❌)"
+        checker.results.add(CheckResult(name, verdict, status, Method.API))
+
+    def run():
+        output_dir = tempfile.mkdtemp(prefix="ig_bench_")
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                checker.save_results(output_dir)
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+    return run, n
+
+
+BENCHMARKS: Dict[str, Callable[[int], Tuple[Callable, int]]] = {
+    'validate_username': bench_validate_username,
+    'generate_variations': bench_generate_variations,
+    'profile_matching': bench_profile_matching,
+    'result_construction': bench_result_construction,
+    'save_results': bench_save_results
+}
+
+
+def measure(name: str, size: int, repeat: int, memory: bool = True) -> Dict:
+    """
+    Time one benchmark at one size
+
+    Args:
+        name: Benchmark name from BENCHMARKS
+        size: Number of names
+        repeat: Minimum timed runs; the fastest one counts
+        memory: Also record peak traced memory (one extra, slower run)
+
+    Returns:
+        Measurement with items, seconds, items_per_second and peak_memory_bytes
+    """
+    run, items = BENCHMARKS[name](size)
+    timings = []
+    # Fast tiers keep repeating until there is enough timed work to be stable
+    while len(timings) < repeat or (sum(timings) < MIN_TIMED_SECONDS and len(timings) < 1000):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'items': items,
+        'seconds': round(best, 4),
+        'items_per_second': round(items / best, 1) if best else 0.0,
+        'peak_memory_bytes': peak
+    }
+
+
+def machine_fingerprint() -> Dict:
+    """Interpreter and hardware a baseline was recorded on; numbers only compare on a match"""
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'system': platform.system(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def same_machine(stored: Dict) -> bool:
+    """Whether a stored baseline was recorded with this interpreter on this kind of machine"""
+    return all(stored.get(key) == value for key, value in machine_fingerprint().items())
+
+
+def load_baseline(path: str) -> Optional[Dict]:
+    """Stored baseline (fingerprint plus results), or None when there is none"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_key(key: str) -> Tuple[str, int]:
+    """Split a measurement key such as 'validate_username[1000]' into (name, size)"""
+    name, size = key.rstrip(']').split('[', 1)
+    return name, int(size)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Find measurements that regressed against the baseline
+
+    Args:
+        results: Measurements keyed by "name[size]"
+        baseline: Stored measurements with the same keys
+        tolerance: Allowed relative slowdown / memory growth (0.25 = 25%)
+
+    Returns:
+        Human readable regression descriptions
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        floor = previous['items_per_second'] * (1 - tolerance)
+        if current['items_per_second'] < floor:
+            regressions.append(f"{key}: {current['items_per_second']:,.0f}/s vs baseline "
+                               f"{previous['items_per_second']:,.0f}/s")
+        if current.get('peak_memory_bytes') is not None and previous.get('peak_memory_bytes') is not None:
+            # Small absolute slack so tiny tiers do not flap on allocator noise
+            ceiling = max(previous['peak_memory_bytes'] * (1 + tolerance), previous['peak_memory_bytes'] + 64 * 1024)
+            if current['peak_memory_bytes'] > ceiling:
+                regressions.append(f"{key}: peak memory {format_bytes(current['peak_memory_bytes'])} vs baseline "
+                                   f"{format_bytes(previous['peak_memory_bytes'])}")
+    return regressions
+
+
+def _serve_mock(conn, options: Dict):
+    """Run the mock server in its own process until the parent sends anything"""
+    with MockInstagramServer(**options) as mock:
+        conn.send(mock.base_url)
+        conn.recv()
+
+
+def measure_saturation(parse_processes: int, workers: Tuple[int, ...] = SATURATION_WORKERS,
+                       checks: int = 200, profile_size: int = 300_000, latency: float = 0.02) -> List[Dict]:
+    """
+    Profile-page throughput against the mock server at rising worker counts
+
+    The mock server runs in a separate process and puts the user data at the
+    end of each page, so every taken page is scanned in full.
+
+    Args:
+        parse_processes: Checker parse pool size (0 parses on the worker threads)
+        workers: Worker counts to sweep
+        checks: Usernames checked per worker count
+        profile_size: Bytes per taken profile page
+        latency: Seconds the mock server adds to every response
+
+    Returns:
+        One row per worker count with checks_per_second and the checker
+        process's CPU use (cores busy and milliseconds per check)
+    """
+    parent, child = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve_mock, args=(child, {
+        'capacity': 1e9, 'burst': 10 ** 6, 'latency': latency, 'taken_ratio': 0.9,
+        'profile_size': profile_size, 'late_markers': True}), daemon=True)
+    server.start()
+    base_url = parent.recv()
+    rows = []
+    try:
+        for count in workers:
+            checker = InstagramUsernameChecker(max_workers=count, min_delay=0, max_delay=0, base_url=base_url,
+                                               parse_processes=parse_processes)
+            checker.echo = False
+            logging.getLogger().setLevel(logging.WARNING)
+            # Warm-up starts the parse pool and the connection pool outside the timing
+            for _ in checker.iter_check([f"warm{count}x{i}" for i in range(count)], use_api=False):
+                pass
+            names = [f"sat{count}x{i}" for i in range(checks)]
+            cpu_before = time.process_time()
+            started = time.perf_counter()
+            for _ in checker.iter_check(names, use_api=False):
+                pass
+            elapsed = time.perf_counter() - started
+            cpu = time.process_time() - cpu_before
+            checker.close()
+            rows.append({
+                'workers': count,
+                'checks_per_second': round(checks / elapsed, 1),
+                'cpu_cores': round(cpu / elapsed, 2),
+                'cpu_ms_per_check': round(cpu / checks * 1000, 2)
+            })
+    finally:
+        parent.send('stop')
+        server.join(5)
+    return rows
+
+
+def saturation_point(rows: List[Dict], gain: float = 0.1) -> int:
+    """Worker count after which adding workers improves throughput by less than `gain`"""
+    for previous, current in zip(rows, rows[1:]):
+        if current['checks_per_second'] < previous['checks_per_second'] * (1 + gain):
+            return previous['workers']
+    return rows[-1]['workers']
+
+
+def run_saturation(parse_processes: int):
+    """Compare inline parsing with the parse pool and print both saturation points"""
+    print_colored_message(f"{'parsing':<12}{'workers':>8}{'checks/s':>12}{'cpu cores':>12}{'cpu ms/check':>14}", "white")
+    for processes in (0, parse_processes):
+        label = f"{processes} procs" if processes else "inline"
+        rows = measure_saturation(processes)
+        for row in rows:
+            print_colored_message(f"{label:<12}{row['workers']:>8}{row['checks_per_second']:>12,.1f}"
+                                  f"{row['cpu_cores']:>12.2f}{row['cpu_ms_per_check']:>14.2f}", "cyan")
+        peak = max(row['checks_per_second'] for row in rows)
+        print_colored_message(f"   {label}: saturates at {saturation_point(rows)} workers, "
+                              f"peak {peak:,.1f} checks/s\n", "magenta")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks for the checker's CPU-side hot paths",
+        epilog="Baselines are machine specific; record one with --save-baseline on the machine that compares."
+    )
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma separated name counts (default: 1000,100000,1000000)')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Run only these benchmarks')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed runs per measurement, fastest counts; 1M tiers run once (default: 3)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file (default: benchmarks_baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these measurements as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed throughput drop / memory growth before failing (default: 0.25)')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run')
+    parser.add_argument('--saturation', type=int, metavar='PROCESSES', nargs='?', const=os.cpu_count() or 1,
+                        help='Instead of the micro-benchmarks, sweep workers against the mock server with '
+                             'inline parsing and with a parse pool of PROCESSES (default: CPU count)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    if args.saturation is not None:
+        run_saturation(args.saturation)
+        return
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    names = args.only or list(BENCHMARKS)
+
+    results = {}
+    print_colored_message(f"{'benchmark':<32}{'items':>10}{'seconds':>10}{'items/s':>14}{'peak mem':>12}", "white")
+    for name in names:
+        for size in sizes:
+            repeat = 1 if size >= 1_000_000 else max(1, args.repeat)
+            result = measure(name, size, repeat, memory=not args.no_memory)
+            key = f"{name}[{size}]"
+            results[key] = result
+            peak = format_bytes(result['peak_memory_bytes']) if result['peak_memory_bytes'] is not None else '-'
+            print_colored_message(f"{key:<32}{result['items']:>10}{result['seconds']:>10.3f}"
+                                  f"{result['items_per_second']:>14,.0f}{peak:>12}", "cyan")
+
+    if args.save_baseline:
+        stored = load_baseline(args.baseline)
+        # Measurements from another machine cannot be mixed into this one's baseline
+        baseline = stored.get('results', {}) if stored and same_machine(stored) else {}
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(dict(machine_fingerprint(), recorded_at=time.strftime('%Y-%m-%dT%H:%M:%S'),
+                           results=baseline), f, indent=2)
+        print_colored_message(f"\n💾 Saved baseline to: {args.baseline}", "green")
+        return
+
+    stored = load_baseline(args.baseline)
+    if stored is None:
+        print_colored_message("\n💡 No baseline yet; run with --save-baseline to record one", "yellow")
+        return
+    if not same_machine(stored):
+        print_colored_message(f"⚠️  Baseline was recorded on {stored.get('machine')} / Python {stored.get('python')} "
+                              f"with {stored.get('cpu_count')} CPUs; re-record it with --save-baseline", "yellow")
+
+    regressions = compare(results, stored.get('results', {}), args.tolerance)
+    if regressions:
+        print_colored_message(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:", "red")
+        for regression in regressions:
+            print_colored_message(f"   {regression}", "red")
+        sys.exit(1)
+    print_colored_message(f"\n✅ No regressions beyond {args.tolerance:.0%}", "green")
+
+
+if __name__ == "__main__":
+    main()
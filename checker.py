@@ -2,18 +2,371 @@
 import requests
 import json
 import os
+import asyncio
+import inspect
+import contextlib
 import csv
+import heapq
 import random
 import logging
-from typing import List, Dict, Tuple, Optional
+import multiprocessing
+import queue
+import threading
+import time
+from array import array
+from collections import Counter
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterable, Iterator, AsyncIterable, AsyncIterator, Union
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from tqdm import tqdm
 from colorama import init, Fore, Style
+from urllib3.util.request import ACCEPT_ENCODING
 
 init(autoreset=True)
 
-from utils import setup_logging, random_delay, validate_username, print_colored_message, format_results_summary
+from notify import Notifier
+from profile_parser import ProfileScanner, classify_profile_content
+from results import CheckResult, ResultStore, Verdict, Method, RESULT_FIELDS
+from scheduler import PriorityScheduler
+from tracer import Tracer
+from utils import setup_logging, random_delay, validate_username, print_colored_message, format_results_summary, summarize_latencies, RateLimiter
+from wordlist import Wordlist
+
+INSTAGRAM_URL = "https://www.instagram.com"
+
+# Unread streamed bodies up to this size are drained so the connection is reused
+STREAM_DRAIN_LIMIT = 16 * 1024
+
+# Shared no-op span used when tracing is off
+_NO_SPAN = contextlib.nullcontext()
+
+
+def _request_size(request: requests.PreparedRequest) -> int:
+    """Approximate bytes sent for a request (request line, headers, body)"""
+    size = len(request.method) + len(request.path_url) + 12
+    size += len(urlsplit(request.url).netloc) + 8
+    size += sum(len(k) + len(v) + 4 for k, v in request.headers.items()) + 2
+    body = request.body or b''
+    return size + len(body.encode('utf-8') if isinstance(body, str) else body)
+
+
+def _response_size(response: requests.Response) -> int:
+    """Approximate bytes received for a response (status line, headers, wire body)"""
+    size = len(str(response.status_code)) + len(response.reason or '') + 12
+    size += sum(len(k) + len(v) + 4 for k, v in response.headers.items()) + 2
+    try:
+        # Bytes read off the socket, i.e. before decompression
+        return size + response.raw.tell()
+    except AttributeError:
+        content = response.__dict__.get('_content')
+        return size + (len(content) if isinstance(content, bytes) else 0)
+
+
+def classify_api_body(content: bytes) -> Tuple[Optional[bool], str]:
+    """
+    Verdict from a check_username API response body (pure, so it can run in the parse pool)
+    
+    Args:
+        content: Raw JSON body of a 200 response
+        
+    Returns:
+        Tuple of (availability_status, status_message); None with the reason when unclear
+    """
+    try:
+        result = json.loads(content)
+    except ValueError:
+        return None, f"JSON decode failed: {content[:100].decode('utf-8', errors='replace')}"
+    if not isinstance(result, dict):
+        return None, f"Unclear API response: {result}"
+    if result.get('available', False):
+        return True, "Available (API ✅)"
+    elif 'errors' in result and 'username' in result.get('errors', {}):
+        return False, "Taken (API error ❌)"
+    elif 'available' in result and not result['available']:
+        return False, "Taken (API ❌)"
+    return None, f"Unclear API response: {result}"
+
+
+def get_verdict(result: Dict) -> str:
+    """
+    Classify a result as 'available', 'taken' or 'error'
+    
+    Args:
+        result: CheckResult or result dictionary
+        
+    Returns:
+        Verdict string
+    """
+    if isinstance(result, CheckResult):
+        return result.verdict.label
+    if result['available']:
+        return 'available'
+    if result['status'].startswith('Taken'):
+        return 'taken'
+    return 'error'
+
+
+def describe_result(result: CheckResult) -> Tuple[str, str]:
+    """
+    Console line and color for a check result
+    
+    Args:
+        result: Result to describe
+        
+    Returns:
+        Tuple of (message, color)
+    """
+    if result.verdict == Verdict.AVAILABLE:
+        return f"✅ + {result.username} - AVAILABLE {result.status}", "green"
+    if result.verdict == Verdict.TAKEN:
+        return f"❌ - {result.username} - TAKEN {result.status}", "red"
+    if result.method == Method.VALIDATION:
+        return f"❓ {result.username} - ERROR: Invalid format", "yellow"
+    if result.method == Method.ERROR:
+        return f"⚠️  ? {result.username} - THREAD ERROR: {result.status[len('Thread error: '):]}", "yellow"
+    return f"⚠️  ? {result.username} - ERROR: {result.status}", "yellow"
+
+
+class BackgroundChecker:
+    """
+    Checks usernames on a warm checker as soon as they are submitted
+    
+    Used by interactive input: each name starts checking the moment it is
+    entered and its result is handed to on_result while the user keeps typing.
+    """
+    
+    def __init__(self, checker: 'InstagramUsernameChecker', use_api: bool = True,
+                 on_result: Optional[Callable[[CheckResult], Any]] = None):
+        """
+        Args:
+            checker: Checker whose session is reused for every name
+            use_api: Whether to use API method first
+            on_result: Called from a worker thread with each finished result
+        """
+        self.checker = checker
+        self.use_api = use_api
+        self.on_result = on_result
+        self.executor = ThreadPoolExecutor(max_workers=checker.max_workers)
+        self._outstanding = 0
+        self._idle = threading.Condition()
+    
+    def submit(self, username: str) -> Future:
+        """Start checking a username in the background"""
+        with self._idle:
+            self._outstanding += 1
+        future = self.checker.submit_check(self.executor, username, self.use_api, record=False)
+        future.add_done_callback(lambda f: self._done(f, username))
+        return future
+    
+    def _done(self, future: Future, username: str):
+        try:
+            self.checker._collect(future, username, self.on_result)
+        finally:
+            with self._idle:
+                self._outstanding -= 1
+                self._idle.notify_all()
+    
+    def pending(self) -> int:
+        """Number of submitted names whose result has not been delivered yet"""
+        with self._idle:
+            return self._outstanding
+    
+    def join(self):
+        """Wait until every submitted name's result has been delivered"""
+        with self._idle:
+            while self._outstanding:
+                self._idle.wait()
+    
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+class CheckBudget:
+    """
+    Wall-clock deadline and retry allowance for one username check
+    
+    The budget is shared by the API and profile methods, so a single slow
+    or failing name can never hold a worker longer than the deadline.
+    """
+    
+    def __init__(self, deadline: float, max_retries: int,
+                 connect_timeout: float, read_timeout: float):
+        """
+        Args:
+            deadline: Total seconds allowed for the check
+            max_retries: Extra attempts allowed across all methods
+            connect_timeout: Seconds allowed to establish a connection
+            read_timeout: Seconds allowed between bytes of a response
+        """
+        self.deadline = deadline
+        self.retries_left = max_retries
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.started = time.monotonic()
+        self.bytes_up = 0
+        self.bytes_down = 0
+    
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+    
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - self.elapsed())
+    
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+    
+    def use_retry(self) -> bool:
+        """Consume one retry; False when the budget has none left or time is up"""
+        if self.retries_left <= 0 or self.expired():
+            return False
+        self.retries_left -= 1
+        return True
+    
+    def timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeouts clipped to the time left"""
+        remaining = max(self.remaining(), 0.001)
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+    
+    def timeout_status(self) -> str:
+        return f"Timed out after {self.deadline:g}s deadline"
+
+
+class RetryQueue:
+    """
+    Deferred re-checks for names whose attempt ended in a transient error
+    
+    Instead of a worker sleeping through a backoff, the failed name is parked
+    here until its exponential backoff (with jitter) has passed, and is picked
+    up again once the healthy work has been handed out.
+    """
+    
+    def __init__(self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0):
+        """
+        Args:
+            max_attempts: Most attempts per name, including the first one
+            base_delay: Backoff before the second attempt; doubles per attempt
+            max_delay: Upper bound for a single backoff
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._seq = 0
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    def should_retry(self, result: CheckResult, attempt: int) -> bool:
+        """Whether a result is a transient error worth another attempt"""
+        return (result.verdict == Verdict.ERROR and result.method != Method.VALIDATION
+                and attempt < self.max_attempts)
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay after the given failed attempt: half fixed, half random"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+    
+    def push(self, username: str, attempt: int):
+        """Park a name after its failed attempt number `attempt`"""
+        ready_at = time.monotonic() + self.backoff(attempt)
+        heapq.heappush(self._heap, (ready_at, self._seq, username, attempt + 1))
+        self._seq += 1
+    
+    def pop_due(self) -> Optional[Tuple[str, int]]:
+        """Next (username, attempt) whose backoff has passed, or None"""
+        if self._heap and self._heap[0][0] <= time.monotonic():
+            _, _, username, attempt = heapq.heappop(self._heap)
+            return username, attempt
+        return None
+    
+    def wait_time(self) -> Optional[float]:
+        """Seconds until the next parked name is due (None when empty)"""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+
+class RetryTimer:
+    """
+    One daemon thread that runs callbacks once their delay has passed
+    
+    Single-name checks on a pool (serve, watch, interactive input) have no
+    batch to defer a failed name behind. Their retries wait here instead of
+    in a worker, which stays free for other names until the retry is
+    re-submitted.
+    """
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Callable[[], Any]]] = []
+        self._seq = 0
+        self._wakeup = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+    
+    def __len__(self) -> int:
+        with self._wakeup:
+            return len(self._heap)
+    
+    def call_later(self, delay: float, callback: Callable[[], Any]):
+        """Run callback on the timer thread after `delay` seconds"""
+        with self._wakeup:
+            heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, callback))
+            self._seq += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='retry-timer', daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+    
+    def _run(self):
+        while True:
+            with self._wakeup:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._wakeup.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception:
+                logging.getLogger(__name__).exception("Retry callback failed")
+
+
+class SourceReader:
+    """
+    Pulls names from an input iterator on a daemon thread, one per request
+    
+    iter_check waits on the pending read together with the running checks,
+    so a slow source (a pipe, a network feed) never holds back results that
+    are already finished. Names are still pulled only when a slot is free.
+    """
+    
+    EXHAUSTED = object()
+    
+    def __init__(self, source: Iterator[str]):
+        self.source = source
+        self._requests: 'queue.Queue[Optional[Future]]' = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='source-reader', daemon=True)
+        self._thread.start()
+    
+    def read(self) -> Future:
+        """Future resolving to the next name, or EXHAUSTED once the source ends"""
+        future = Future()
+        self._requests.put(future)
+        return future
+    
+    def close(self):
+        """Stop the reader after any read in progress (a blocked source is abandoned)"""
+        self._requests.put(None)
+    
+    def _run(self):
+        while True:
+            future = self._requests.get()
+            if future is None or not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(next(self.source, self.EXHAUSTED))
+            except BaseException as e:
+                future.set_exception(e)
 
 
 class InstagramUsernameChecker:
@@ -30,7 +383,15 @@ class InstagramUsernameChecker:
     """
     
     def __init__(self, proxy: Optional[str] = None, max_workers: int = 3,
-                 min_delay: float = 2.0, max_delay: float = 5.0, verbose: bool = False):
+                 min_delay: float = 2.0, max_delay: float = 5.0, verbose: bool = False,
+                 rate_limiter: Optional[RateLimiter] = None, token_ttl: float = 600.0,
+                 transport: Optional[requests.adapters.BaseAdapter] = None,
+                 deadline: float = 30.0, max_retries: int = 2,
+                 connect_timeout: float = 5.0, read_timeout: float = 10.0,
+                 base_url: str = INSTAGRAM_URL, max_attempts: int = 3, retry_backoff: float = 2.0,
+                 profile_max_bytes: int = 512 * 1024, notifier: Optional['Notifier'] = None,
+                 parse_processes: int = 0, parse_offload_bytes: int = 64 * 1024,
+                 tracer: Optional[Tracer] = None):
         """
         Initialize Instagram Username Checker
         
@@ -40,6 +401,21 @@ class InstagramUsernameChecker:
             min_delay: Minimum delay between requests
             max_delay: Maximum delay between requests
             verbose: Enable verbose logging
+            rate_limiter: Shared request budget; replaces the post-check delay when set
+            token_ttl: Seconds a CSRF token is reused before it is fetched again
+            transport: Adapter from transport.create_transport to record or replay traffic
+            deadline: Total seconds allowed per username before it is marked timed out
+            max_retries: Immediate retries within one attempt (e.g. after a rejected CSRF token)
+            connect_timeout: Seconds allowed to establish a connection
+            read_timeout: Seconds allowed between bytes of a response
+            base_url: Site root to check against (a local stand-in for calibration)
+            max_attempts: Attempts per username in batch runs; failed ones are deferred and retried
+            retry_backoff: Backoff in seconds before the first deferred retry (doubles per attempt)
+            profile_max_bytes: Most profile page bytes read; an undecided page cut at the cap is an error
+            notifier: Sinks (notify.create_notifier) told about every available verdict as it is recorded
+            parse_processes: Worker processes for classifying large response bodies (0 parses inline)
+            parse_offload_bytes: Smallest body handed to the parse processes; smaller ones stay inline
+            tracer: Records per-thread spans (token fetch, requests, parsing, sleeps, result writes)
         """
         self.session = requests.Session()
         self.proxy = {'http': proxy, 'https': proxy} if proxy else None
@@ -47,13 +423,41 @@ class InstagramUsernameChecker:
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.verbose = verbose
+        self.rate_limiter = rate_limiter
+        self.token_ttl = token_ttl
+        self.transport = transport
+        self.deadline = deadline
+        self.max_retries = max_retries
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.base_url = base_url.rstrip('/')
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.profile_max_bytes = profile_max_bytes
+        self.notifier = notifier
+        self.parse_processes = max(0, parse_processes)
+        self.parse_offload_bytes = parse_offload_bytes
+        self.tracer = tracer
+        self.echo = True
+        self.keep_results = True
+        self.sample_window: Optional[int] = None
+        
+        self._csrf_token = None
+        self._csrf_fetched_at = 0.0
+        self._csrf_lock = threading.Lock()
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._retry_timer = RetryTimer()
         
         level = logging.DEBUG if verbose else logging.INFO
         self.logger = setup_logging(level=level)
         
-        self.available_usernames = []
-        self.unavailable_usernames = []
-        self.errors = []
+        self.results = ResultStore()
+        self.check_durations = array('d')
+        self._metrics_lock = threading.Lock()
+        self.http_status_counts = Counter()
+        self.check_bytes = array('d')
+        self.endpoint_traffic: Dict[str, Dict[str, int]] = {}
         
         self.setup_session()
         
@@ -71,7 +475,7 @@ class InstagramUsernameChecker:
             'User-Agent': random.choice(user_agents),  
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING.replace(',', ', '),
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -85,6 +489,16 @@ class InstagramUsernameChecker:
             'Sec-Ch-Ua-Platform': '"Windows"'
         })
         
+        if self.transport is not None:
+            self.session.mount('https://', self.transport)
+            self.session.mount('http://', self.transport)
+            self.logger.info(f"Using {type(self.transport).__name__} transport")
+        else:
+            # One pooled connection per worker, so high concurrency reuses connections
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(10, self.max_workers))
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
         if self.proxy:
             self.session.proxies.update(self.proxy)
             self.logger.info(f"Proxy configured: {list(self.proxy.values())[0]}")
@@ -95,260 +509,765 @@ class InstagramUsernameChecker:
         
         self.logger.info("Session setup completed with dynamic User-Agent")
     
-    def random_delay(self, min_seconds: Optional[float] = None, max_seconds: Optional[float] = None):
-        """Apply random delay using class defaults"""
-        random_delay(min_seconds, max_seconds, self.logger, self.min_delay, self.max_delay)
+    def _echo(self, message: str, color: str):
+        """Print per-check progress unless console echo is turned off"""
+        if self.echo:
+            print_colored_message(message, color)
+    
+    def random_delay(self, min_seconds: Optional[float] = None, max_seconds: Optional[float] = None,
+                     budget: Optional[CheckBudget] = None):
+        """Apply random delay using class defaults (skipped when replaying offline)"""
+        if getattr(self.transport, 'offline', False):
+            return
+        if budget is not None:
+            remaining = budget.remaining()
+            min_seconds = min(self.min_delay if min_seconds is None else min_seconds, remaining)
+            max_seconds = min(self.max_delay if max_seconds is None else max_seconds, remaining)
+        with self._span('sleep', 'sleep'):
+            random_delay(min_seconds, max_seconds, self.logger, self.min_delay, self.max_delay)
+    
+    def _span(self, name: str, category: str = 'check', **args):
+        """Tracer span, or a shared no-op context when tracing is off"""
+        if self.tracer is None:
+            return _NO_SPAN
+        return self.tracer.span(name, category, **args)
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        with self._parse_pool_lock:
+            if self.parse_processes <= 0:
+                raise BrokenProcessPool("Parse pool was disabled")
+            if self._parse_pool is None:
+                # spawn: forking a process that already runs checking threads is unsafe
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes,
+                                                       mp_context=multiprocessing.get_context('spawn'))
+            return self._parse_pool
+    
+    def _parse(self, parser: Callable[..., Tuple[Optional[bool], str]], content: bytes, *args,
+               budget: CheckBudget) -> Tuple[Optional[bool], str]:
+        """
+        Run a pure body classifier inline, or in the parse pool for large bodies
+        
+        Only the compact (availability_status, status_message) verdict comes back
+        from the worker process.
+        """
+        if self.parse_processes <= 0 or len(content) < self.parse_offload_bytes:
+            return parser(content, *args)
+        try:
+            return self._get_parse_pool().submit(parser, content, *args).result(timeout=budget.remaining())
+        except FutureTimeoutError:
+            return None, budget.timeout_status()
+        except BrokenProcessPool as e:
+            self._disable_parse_pool(e)
+            return parser(content, *args)
+    
+    def _disable_parse_pool(self, error: Exception):
+        """Shut down a broken parse pool and parse inline from now on (warns once)"""
+        with self._parse_pool_lock:
+            if self.parse_processes <= 0:
+                return
+            self.parse_processes = 0
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.logger.warning(f"Parse pool failed, parsing inline from now on: {error}")
     
-    def check_username_via_profile(self, username: str) -> Tuple[Optional[bool], str]:
+    def close(self):
+        """Shut down the parse pool (if one was started)"""
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=True)
+                self._parse_pool = None
+    
+    def retain_recent(self, samples: int = 10_000):
+        """
+        Keep counters and recent metrics only, for processes that check indefinitely
+        
+        Results are counted but no longer stored, and the latency and
+        bytes-per-check samples are trimmed to roughly the last `samples` checks,
+        so watch and serve processes run in constant memory.
+        
+        Args:
+            samples: Checks kept in the latency and traffic distributions
+        """
+        self.keep_results = False
+        self.sample_window = samples
+    
+    def _add_sample(self, samples: array, value: float):
+        """Append a metric sample, trimming to the sample window (caller holds the metrics lock)"""
+        samples.append(value)
+        # Trimming only at twice the window keeps appends amortized O(1)
+        if self.sample_window and len(samples) >= 2 * self.sample_window:
+            del samples[:-self.sample_window]
+    
+    def new_budget(self) -> CheckBudget:
+        """Create the deadline and retry budget for one username check"""
+        return CheckBudget(self.deadline, self.max_retries, self.connect_timeout, self.read_timeout)
+    
+    def new_retry_queue(self) -> RetryQueue:
+        """Create the deferred retry queue for one batch (no backoff when replaying offline)"""
+        offline = getattr(self.transport, 'offline', False)
+        return RetryQueue(self.max_attempts, base_delay=0.0 if offline else self.retry_backoff)
+    
+    def _request(self, method: str, url: str, budget: Optional[CheckBudget] = None,
+                 endpoint: str = 'other', **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session, honouring the rate budget and deadline
+        
+        Traffic is accounted per endpoint and on the budget of the check. With
+        stream=True the download is accounted when the response is handed to
+        _release_stream.
+        """
+        if self.rate_limiter and not getattr(self.transport, 'offline', False):
+            with self._span('rate_wait', 'sleep'):
+                self.rate_limiter.acquire()
+        if 'timeout' not in kwargs:
+            budget = budget or self.new_budget()
+            kwargs['timeout'] = budget.timeout()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._metrics_lock:
+                self.http_status_counts['network_error'] += 1
+            raise
+        with self._metrics_lock:
+            self.http_status_counts[response.status_code] += 1
+        
+        up = sum(_request_size(r.request) for r in response.history) + _request_size(response.request)
+        down = sum(_response_size(r) for r in response.history)
+        if not kwargs.get('stream'):
+            down += _response_size(response)
+        self._count_traffic(endpoint, budget, up, down, requests_sent=len(response.history) + 1)
+        return response
+    
+    def _count_traffic(self, endpoint: str, budget: Optional[CheckBudget], up: int, down: int,
+                       requests_sent: int = 0):
+        if budget is not None:
+            budget.bytes_up += up
+            budget.bytes_down += down
+        with self._metrics_lock:
+            traffic = self.endpoint_traffic.setdefault(endpoint, {'requests': 0, 'bytes_up': 0, 'bytes_down': 0})
+            traffic['requests'] += requests_sent
+            traffic['bytes_up'] += up
+            traffic['bytes_down'] += down
+    
+    def _release_stream(self, response: requests.Response, endpoint: str, budget: Optional[CheckBudget] = None):
+        """Account a streamed response's download and give back its connection"""
+        try:
+            length = int(response.headers.get('Content-Length', -1))
+        except ValueError:
+            length = -1
+        unread = getattr(response.raw, 'tell', lambda: 0)() == 0
+        if unread and 0 <= length <= STREAM_DRAIN_LIMIT:
+            try:
+                response.content
+            except requests.exceptions.RequestException:
+                pass
+        self._count_traffic(endpoint, budget, 0, _response_size(response))
+        response.close()
+    
+    def get_csrf_token(self, force_refresh: bool = False, budget: Optional[CheckBudget] = None) -> Optional[str]:
+        """
+        Return a cached CSRF token, fetching a new one when missing or expired
+        
+        Args:
+            force_refresh: Discard the cached token and fetch a new one
+            budget: Deadline of the check that needs the token
+            
+        Returns:
+            CSRF token string, or None if Instagram did not set one
+        """
+        # The outer span includes waiting for another thread's fetch
+        with self._span('token', 'token'), self._csrf_lock:
+            age = time.monotonic() - self._csrf_fetched_at
+            if not force_refresh and self._csrf_token and age < self.token_ttl:
+                return self._csrf_token
+            
+            # Only the Set-Cookie header is needed, so the page body is never downloaded
+            with self._span('token_fetch', 'http'):
+                csrf_resp = self._request('GET', f"{self.base_url}/", budget=budget, endpoint='homepage', stream=True)
+                self._release_stream(csrf_resp, 'homepage', budget)
+            self._csrf_token = csrf_resp.cookies.get('csrftoken') or self.session.cookies.get('csrftoken')
+            self._csrf_fetched_at = time.monotonic()
+            self.logger.debug(f"Fetched CSRF token: {self._csrf_token}")
+            return self._csrf_token
+    
+    def invalidate_csrf_token(self):
+        """Forget the cached CSRF token so the next check fetches a fresh one"""
+        with self._csrf_lock:
+            self._csrf_token = None
+    
+    def check_username_via_profile(self, username: str, budget: Optional['CheckBudget'] = None) -> Tuple[Optional[bool], str]:
         """
         Check username availability via Instagram profile page
         This is used as a fallback method when API fails
         
         Args:
             username: Username to check
+            budget: Deadline and retry budget shared with the API method
             
         Returns:
             Tuple of (availability_status, status_message)
         """
+        budget = budget or self.new_budget()
+        url = f"{self.base_url}/{username}/"
+        
+        if budget.expired():
+            return None, budget.timeout_status()
         try:
-            url = f"https://www.instagram.com/{username}/"
-            response = self.session.get(url, timeout=15, allow_redirects=True)
-            
-            if response.status_code == 404:
-                return True, "Available (404 - Profile)"
-            elif response.status_code == 200:
-                content = response.text.lower()
-                
-                taken_indicators = [
-                    f'"username":"{username.lower()}"',
-                    '"id":"',
-                    '"edge_owner_to_timeline_media":{',
-                    '"biography":',
-                    '"profile_pic_url":'
-                ]
-                
-                not_found_indicators = [
-                    "sorry, this page isn't available",
-                    "the link you followed may be broken",
-                    "page not found",
-                    '"graphql":{"user":null}',
-                    "this page isn't available"
-                ]
-                
-                has_user_data = any(ind in content for ind in taken_indicators)
-                has_not_found = any(ind in content for ind in not_found_indicators)
+            with self._span('profile_get', 'http', username=username):
+                response = self._request('GET', url, budget=budget, endpoint='profile', allow_redirects=True, stream=True)
+            try:
+                if response.status_code == 404:
+                    return True, "Available (404 - Profile)"
+                elif response.status_code == 200:
+                    # Stop downloading as soon as the page is decisive, or at the byte cap.
+                    # With a parse pool, pages still undecided after parse_offload_bytes
+                    # are read to the cap and classified in a worker process.
+                    # A page cut at the cap without a marker is an error, never available.
+                    # The span covers the streamed body download and the scan
+                    with self._span('parse', 'parse', username=username):
+                        scanner = ProfileScanner(username)
+                        offload = self.parse_processes > 0
+                        chunks = []
+                        received = 0
+                        truncated = False
+                        for chunk in response.iter_content(chunk_size=16 * 1024):
+                            # read_timeout only bounds each socket read; a trickling page
+                            # must not outlive the check's deadline
+                            if budget.expired():
+                                return None, budget.timeout_status()
+                            received += len(chunk)
+                            if offload:
+                                chunks.append(chunk)
+                                if scanner.bytes_scanned >= self.parse_offload_bytes:
+                                    if received >= self.profile_max_bytes:
+                                        truncated = True
+                                        break
+                                    continue
+                            verdict = scanner.feed(chunk)
+                            if verdict:
+                                return verdict
+                            if received >= self.profile_max_bytes:
+                                truncated = True
+                                break
+                        if received > scanner.bytes_scanned:
+                            return self._parse(classify_profile_content, b''.join(chunks), username, truncated,
+                                               budget=budget)
+                        return scanner.finish(truncated)
                 
-                if has_user_data and not has_not_found:
-                    return False, "Taken (Profile)"
-                elif has_not_found:
-                    return True, "Available (not found page)"
-                else:
-                    if '"user":{"id"' in content or ('"username"' in content and '"full_name"' in content):
-                        return False, "Taken (JSON user)"
-                    return True, "Available (unclear - small page)"
-            else:
                 return None, f"HTTP {response.status_code} (Profile)"
+            finally:
+                self._release_stream(response, 'profile', budget)
                 
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Network error for {username} in Profile: {e}")
+            if budget.expired():
+                return None, budget.timeout_status()
             return None, f"Network error: {str(e)}"
     
-    def check_username_via_signup_api(self, username: str) -> Tuple[Optional[bool], str]:
+    def check_username_via_signup_api(self, username: str, budget: Optional['CheckBudget'] = None) -> Tuple[Optional[bool], str]:
         """
         Check username availability via Instagram signup API
         This is the primary method with highest reliability
         
         Args:
             username: Username to check
+            budget: Deadline and retry budget shared with the profile method
             
         Returns:
             Tuple of (availability_status, status_message)
         """
-        for attempt in range(3):
+        budget = budget or self.new_budget()
+        attempt = 0
+        
+        while True:
+            if attempt > 0 and not budget.use_retry():
+                return None, "API exhausted - fallback to Profile"
+            if budget.expired():
+                return None, budget.timeout_status()
+            attempt += 1
+            
             try:
                 if self.proxy:
                     self.session.proxies.update(self.proxy)
                 
-                csrf_resp = self.session.get("https://www.instagram.com/", timeout=10)
-                csrf_token = csrf_resp.cookies.get('csrftoken', 'missing')
+                csrf_token = self.get_csrf_token(force_refresh=attempt > 1, budget=budget) or 'missing'
                 
                 if self.verbose:
                     self.logger.debug(f"CSRF Token for {username}: {csrf_token}")
                 
                 if csrf_token == 'missing':
-                    self.logger.warning(f"CSRF token missing for {username}, attempt {attempt+1}")
-                    if attempt == 2:
+                    self.logger.warning(f"CSRF token missing for {username}, attempt {attempt}")
+                    if budget.retries_left == 0:
                         return None, "CSRF token failed after retries"
                 
-                url = "https://www.instagram.com/api/v1/users/check_username/"
+                url = f"{self.base_url}/api/v1/users/check_username/"
                 headers = {
                     'X-Requested-With': 'XMLHttpRequest',
                     'X-CSRFToken': csrf_token,
                     'X-Instagram-AJAX': '1',
-                    'Referer': 'https://www.instagram.com/accounts/web_create_ajax/attempt/',
+                    'Referer': f'{self.base_url}/accounts/web_create_ajax/attempt/',
                     'Content-Type': 'application/x-www-form-urlencoded',
-                    'Origin': 'https://www.instagram.com',
+                    'Origin': self.base_url,
                     'Sec-Fetch-Mode': 'cors',
                     'Sec-Fetch-Site': 'same-origin'
                 }
                 data = {'username': username}
                 
-                response = self.session.post(url, data=data, headers=headers, timeout=10)
-                self.logger.debug(f"API Response for {username} (attempt {attempt+1}): Status {response.status_code}")
+                with self._span('api_post', 'http', username=username):
+                    response = self._request('POST', url, budget=budget, endpoint='check_username', data=data, headers=headers)
+                self.logger.debug(f"API Response for {username} (attempt {attempt}): Status {response.status_code}")
                 
                 if self.verbose and response.status_code == 200:
                     try:
                         result = response.json()
-                        print_colored_message(f"📊 API Response for {username}: {json.dumps(result, indent=2)}", "blue")
+                        self._echo(f"📊 API Response for {username}: {json.dumps(result, indent=2)}", "blue")
                     except:
                         pass
                 
                 if response.status_code == 200:
-                    try:
-                        result = response.json()
-                        if result.get('available', False):
-                            return True, "Available (API ✅)"
-                        elif 'errors' in result and 'username' in result.get('errors', {}):
-                            return False, "Taken (API error ❌)"
-                        elif 'available' in result and not result['available']:
-                            return False, "Taken (API ❌)"
-                        else:
-                            self.logger.warning(f"Unclear API response for {username}: {result}")
-                    except json.JSONDecodeError:
-                        self.logger.warning(f"JSON decode failed for {username}: {response.text[:100]}")
+                    with self._span('parse', 'parse', username=username):
+                        is_available, status = self._parse(classify_api_body, response.content, budget=budget)
+                    if is_available is not None:
+                        return is_available, status
+                    self.logger.warning(f"{status} (username: {username})")
                 elif response.status_code == 400:
                     return False, "Taken (400 - invalid/unavailable ❌)"
-                elif response.status_code in [403, 429]:
-                    self.logger.warning(f"API blocked for {username}: {response.status_code}")
-                    self.random_delay(3, 6)
+                elif response.status_code == 403:
+                    # Usually a stale token: refresh it and retry at once
+                    self.logger.warning(f"API blocked for {username}: 403")
+                    self.invalidate_csrf_token()
                     continue
+                elif response.status_code == 429:
+                    # Backing off is left to the deferred retry queue
+                    self.logger.warning(f"API rate limited for {username}: 429")
+                    self.invalidate_csrf_token()
+                    return None, "HTTP 429 (API)"
                 else:
                     self.logger.warning(f"Unexpected API status for {username}: {response.status_code}")
                     
             except requests.exceptions.ProxyError as e:
                 self.logger.error(f"Proxy error for {username}: {e}")
                 self.session.proxies.clear()  
-                if attempt < 2:
-                    self.random_delay(2, 4)
-                else:
-                    return None, f"Proxy failed: {str(e)}"
+                return None, f"Proxy failed: {str(e)}"
             except requests.exceptions.RequestException as e:
-                self.logger.error(f"API error for {username} (attempt {attempt+1}): {e}")
-                if attempt < 2:
-                    self.random_delay(2, 4)
-                else:
-                    return None, f"API failed after retries: {str(e)}"
-        
-        return None, "API exhausted - fallback to Profile"
+                self.logger.error(f"API error for {username} (attempt {attempt}): {e}")
+                if budget.expired():
+                    return None, budget.timeout_status()
+                return None, f"API failed: {str(e)}"
     
-    def check_single_username(self, username: str, use_api: bool = True) -> Dict:
+    def check_single_username(self, username: str, use_api: bool = True, notify: bool = True) -> CheckResult:
         """
         Check a single username availability
         
         Args:
             username: Username to check
             use_api: Whether to use API method first
+            notify: Tell the notifier about an available verdict (callers that
+                track verdict changes themselves, like the watchlist, pass False)
             
         Returns:
-            Dictionary with check results
+            CheckResult (readable like the result dictionary; see CheckResult.to_dict)
+        """
+        return self._record(self._check_with_retries(username, use_api), notify=notify)
+    
+    def _check_with_retries(self, username: str, use_api: bool = True) -> CheckResult:
+        """
+        Check one name, retrying transient errors inline up to max_attempts times
+        
+        The calling thread waits out the same exponential backoff the deferred
+        retry queue would use. Pools use submit_check, which frees the worker
+        during the backoff.
+        """
+        retries = self.new_retry_queue()
+        attempt = 1
+        while True:
+            result = self._check_username(username, use_api)
+            if not retries.should_retry(result, attempt):
+                return result
+            delay = retries.backoff(attempt)
+            self.logger.info(f"Retrying {username} in {delay:.1f}s after attempt {attempt}: {result.status}")
+            with self._span('retry_backoff', 'sleep'):
+                time.sleep(delay)
+            attempt += 1
+    
+    def submit_check(self, executor: ThreadPoolExecutor, username: str, use_api: bool = True,
+                     record: bool = True, notify: bool = True) -> Future:
+        """
+        Check one name on a pool, retrying transient errors without holding a worker
+        
+        A failed attempt is parked on the retry timer until its backoff has
+        passed and is then re-submitted to the pool, so the worker slot is free
+        for other names in between. The returned future resolves with the
+        final attempt only (with the last error if the pool shuts down first).
+        
+        Args:
+            executor: Pool the attempts run on
+            username: Username to check
+            use_api: Whether to use API method first
+            record: Store and echo the final result (False leaves it to the caller)
+            notify: Tell the notifier about an available final verdict (see check_single_username)
+            
+        Returns:
+            Future resolving to the final CheckResult
+        """
+        outcome = Future()
+        outcome.set_running_or_notify_cancel()
+        retries = self.new_retry_queue()
+        
+        def finish(result: CheckResult):
+            try:
+                outcome.set_result(self._record(result, notify=notify) if record else result)
+            except Exception as e:
+                outcome.set_exception(e)
+        
+        def attempted(future: Future, attempt: int):
+            try:
+                result = future.result()
+            except Exception as e:
+                outcome.set_exception(e)
+                return
+            if not retries.should_retry(result, attempt):
+                finish(result)
+                return
+            delay = retries.backoff(attempt)
+            self.logger.info(f"Retrying {username} in {delay:.1f}s after attempt {attempt}: {result.status}")
+            self._retry_timer.call_later(delay, lambda: start(attempt + 1, result))
+        
+        def start(attempt: int, previous: Optional[CheckResult] = None):
+            try:
+                future = executor.submit(self._check_username, username, use_api)
+            except RuntimeError:
+                if previous is None:
+                    raise
+                # The pool shut down during the backoff: the last error stands
+                finish(previous)
+                return
+            future.add_done_callback(lambda f: attempted(f, attempt))
+        
+        start(1)
+        return outcome
+    
+    def _record(self, result: CheckResult, notify: bool = True) -> CheckResult:
+        """Store a final result, echo it and queue notifications for available names"""
+        with self._span('result_write', 'io', username=result.username):
+            if self.keep_results:
+                self.results.add(result)
+            else:
+                self.results.tally(result)
+            if notify and self.notifier is not None and result.verdict == Verdict.AVAILABLE:
+                self.notifier.notify(result)
+            self._echo(*describe_result(result))
+        return result
+    
+    def _check_username(self, username: str, use_api: bool = True, fallback: bool = True) -> CheckResult:
+        """
+        One check attempt; the result is returned without being recorded
+        
+        Args:
+            username: Username to check
+            use_api: Whether to use API method first
+            fallback: Fall back to the profile page when the API gives no verdict
         """
         username = username.strip().lower()
         
         if not validate_username(username):
-            result = {
-                'username': username,
-                'available': False,
-                'status': 'Invalid format (1-30 chars, alphanumeric + _/. , no leading/trailing special)',
-                'method': 'validation',
-                'timestamp': datetime.now().isoformat()
-            }
-            self.errors.append(result)
-            print_colored_message(f"❓ {username} - ERROR: Invalid format", "yellow")
-            return result
+            return CheckResult(
+                username,
+                Verdict.ERROR,
+                'Invalid format (1-30 chars, alphanumeric + _/. , no leading/trailing special)',
+                Method.VALIDATION
+            )
         
-        print_colored_message(f"🔍 Checking: {username}", "cyan")
+        self._echo(f"🔍 Checking: {username}", "cyan")
         self.logger.info(f"Checking {username}")
         
+        started = time.perf_counter_ns()
+        budget = self.new_budget()
         is_available, status = None, ""
         
         if use_api:
-            is_available, status = self.check_username_via_signup_api(username)
-            if is_available is not None:
-                self.random_delay()
+            is_available, status = self.check_username_via_signup_api(username, budget)
         
-        if is_available is None:
-            is_available, status = self.check_username_via_profile(username)
+        if is_available is None and (fallback or not use_api) and not budget.expired():
+            is_available, status = self.check_username_via_profile(username, budget)
         
-        available = is_available if is_available is not None else False
+        timed_out = is_available is None and budget.expired()
+        if timed_out:
+            status = budget.timeout_status()
         
-        result = {
-            'username': username,
-            'available': available,
-            'status': status,
-            'method': 'API' if use_api and 'API' in status else 'Profile',
-            'timestamp': datetime.now().isoformat()
-        }
+        with self._metrics_lock:
+            self._add_sample(self.check_durations, budget.elapsed())
+            self._add_sample(self.check_bytes, budget.bytes_up + budget.bytes_down)
         
-        if available:
-            self.available_usernames.append(result)
-            print_colored_message(f"✅ + {username} - AVAILABLE {status}", "green")
-        elif not available and is_available is not None:
-            self.unavailable_usernames.append(result)
-            print_colored_message(f"❌ - {username} - TAKEN {status}", "red")
+        if use_api and is_available is not None and 'API' in status and not self.rate_limiter:
+            self.random_delay()
+        
+        if is_available is None:
+            verdict = Verdict.ERROR
+        else:
+            verdict = Verdict.AVAILABLE if is_available else Verdict.TAKEN
+        
+        if timed_out:
+            method = Method.TIMEOUT
         else:
-            self.errors.append(result)
-            print_colored_message(f"⚠️  ? {username} - ERROR: {status}", "yellow")
+            method = Method.API if use_api and 'API' in status else Method.PROFILE
         
+        if self.tracer is not None:
+            self.tracer.record('check', 'check', started, time.perf_counter_ns(),
+                               {'username': username, 'verdict': verdict.label, 'status': status})
+        return CheckResult(username, verdict, status, method)
+    
+    def _outcome(self, future: Future, username: str) -> CheckResult:
+        """Unrecorded result of a finished check future (thread errors become error results)"""
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.error(f"Thread error for {username}: {e}")
+            return CheckResult(username, Verdict.ERROR, f'Thread error: {str(e)}', Method.ERROR)
+    
+    def _finish(self, result: CheckResult,
+                on_result: Optional[Callable[[CheckResult], Any]] = None) -> CheckResult:
+        """Record a final result and run the per-result callback"""
+        self._record(result)
+        
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception as e:
+                self.logger.error(f"on_result callback failed for {result.username}: {e}")
         return result
     
-    def check_usernames_batch(self, usernames: List[str], use_api: bool = True) -> List[Dict]:
+    def _collect(self, future: Future, username: str,
+                 on_result: Optional[Callable[[CheckResult], Any]] = None) -> CheckResult:
+        """Record the result of a finished check future and run the per-result callback"""
+        return self._finish(self._outcome(future, username), on_result)
+    
+    def iter_check(self, usernames: Iterable[str], use_api: bool = True,
+                   on_result: Optional[Callable[[CheckResult], Any]] = None,
+                   max_pending: Optional[int] = None) -> Iterator[CheckResult]:
+        """
+        Check usernames concurrently and yield each result as soon as it completes
+        
+        The input is consumed lazily: at most max_pending checks are queued or
+        running at once, so generators and huge files never load fully into
+        memory and a slow consumer holds back new submissions. Iterators are
+        read on a SourceReader thread, so a slow source never delays results
+        that have already finished. Names whose attempt ends in a transient
+        error are deferred to a retry queue with exponential backoff and
+        rechecked after the fresh input, up to max_attempts times, so no
+        worker sleeps through a backoff.
+        
+        Args:
+            usernames: Any iterable of usernames
+            use_api: Whether to use API method first
+            on_result: Called with every result before it is yielded
+            max_pending: Cap on queued plus running checks (default: 2 x max_workers)
+            
+        Yields:
+            CheckResult records in completion order
+        """
+        max_pending = max_pending or self.max_workers * 2
+        source = iter(usernames)
+        retries = self.new_retry_queue()
+        pending = {}
+        exhausted = False
+        # Names are read off-thread so a slow source never delays finished
+        # results; in-memory sources are read inline
+        in_memory = isinstance(usernames, (list, tuple, PriorityScheduler))
+        reader = None if in_memory else SourceReader(source)
+        read = None
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while True:
+                while not exhausted and read is None and len(pending) < max_pending:
+                    if reader is not None:
+                        read = reader.read()
+                        if not read.done():
+                            break
+                        username, read = read.result(), None
+                    else:
+                        username = next(source, SourceReader.EXHAUSTED)
+                    if username is SourceReader.EXHAUSTED:
+                        exhausted = True
+                        break
+                    pending[executor.submit(self._check_username, username, use_api)] = (username, 1)
+                
+                # Deferred retries only run once the fresh input has been handed out
+                while exhausted and len(pending) < max_pending:
+                    due = retries.pop_due()
+                    if due is None:
+                        break
+                    pending[executor.submit(self._check_username, due[0], use_api)] = due
+                
+                if not pending and read is None:
+                    if not retries:
+                        break
+                    with self._span('retry_backoff', 'sleep'):
+                        time.sleep(retries.wait_time())
+                    continue
+                
+                with self._span('wait_results', 'sleep', pending=len(pending)):
+                    done, _ = wait([*pending, read] if read is not None else pending,
+                                   timeout=retries.wait_time() if exhausted else None,
+                                   return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future is read:
+                        username, read = read.result(), None
+                        if username is SourceReader.EXHAUSTED:
+                            exhausted = True
+                        else:
+                            pending[executor.submit(self._check_username, username, use_api)] = (username, 1)
+                        continue
+                    username, attempt = pending.pop(future)
+                    result = self._outcome(future, username)
+                    if retries.should_retry(result, attempt):
+                        self.logger.info(f"Deferring {username} after attempt {attempt}: {result.status}")
+                        retries.push(username, attempt)
+                        continue
+                    yield self._finish(result, on_result)
+        finally:
+            if reader is not None:
+                reader.close()
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    async def aiter_check(self, usernames: Union[Iterable[str], AsyncIterable[str]], use_api: bool = True,
+                          on_result: Optional[Callable[[CheckResult], Any]] = None,
+                          max_pending: Optional[int] = None) -> AsyncIterator[CheckResult]:
+        """
+        Async variant of iter_check for asyncio services
+        
+        Checks run on a worker thread pool; the event loop is never blocked.
+        An async iterable is read in its own task, awaited together with the
+        running checks, so a slow source never delays finished results.
+        
+        Args:
+            usernames: Iterable or async iterable of usernames
+            use_api: Whether to use API method first
+            on_result: Called with every result; may be a coroutine function
+            max_pending: Cap on queued plus running checks (default: 2 x max_workers)
+            
+        Yields:
+            CheckResult records in completion order
+        """
+        loop = asyncio.get_running_loop()
+        max_pending = max_pending or self.max_workers * 2
+        is_async = hasattr(usernames, '__aiter__')
+        source = usernames.__aiter__() if is_async else iter(usernames)
+        retries = self.new_retry_queue()
+        pending = {}
+        exhausted = False
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        read = None
+        
+        def submit(username: str, attempt: int):
+            future = executor.submit(self._check_username, username, use_api)
+            pending[asyncio.wrap_future(future, loop=loop)] = (future, username, attempt)
+        
+        try:
+            while True:
+                if is_async:
+                    # The source is read in its own task and awaited together with
+                    # the checks, so finished results never wait for the next name
+                    if not exhausted and read is None and len(pending) < max_pending:
+                        read = asyncio.ensure_future(source.__anext__())
+                else:
+                    while not exhausted and len(pending) < max_pending:
+                        username = next(source, SourceReader.EXHAUSTED)
+                        if username is SourceReader.EXHAUSTED:
+                            exhausted = True
+                            break
+                        submit(username, 1)
+                
+                while exhausted and len(pending) < max_pending:
+                    due = retries.pop_due()
+                    if due is None:
+                        break
+                    submit(*due)
+                
+                if not pending and read is None:
+                    if not retries:
+                        break
+                    await asyncio.sleep(retries.wait_time())
+                    continue
+                
+                done, _ = await asyncio.wait([*pending, read] if read is not None else pending,
+                                             timeout=retries.wait_time() if exhausted else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is read:
+                        read = None
+                        try:
+                            submit(task.result(), 1)
+                        except StopAsyncIteration:
+                            exhausted = True
+                        continue
+                    future, username, attempt = pending.pop(task)
+                    result = self._outcome(future, username)
+                    if retries.should_retry(result, attempt):
+                        self.logger.info(f"Deferring {username} after attempt {attempt}: {result.status}")
+                        retries.push(username, attempt)
+                        continue
+                    result = self._finish(result)
+                    if on_result is not None:
+                        try:
+                            outcome = on_result(result)
+                            if inspect.isawaitable(outcome):
+                                await outcome
+                        except Exception as e:
+                            self.logger.error(f"on_result callback failed for {username}: {e}")
+                    yield result
+        finally:
+            if read is not None:
+                read.cancel()
+            for future, _, _ in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def check_usernames_batch(self, usernames: List[str], use_api: bool = True,
+                              scheduler: Optional['PriorityScheduler'] = None) -> List[CheckResult]:
         """
         Check multiple usernames in parallel
         
         Args:
             usernames: List of usernames to check
             use_api: Whether to use API method first
+            scheduler: Submit in the scheduler's priority order (and within its budget) instead of list order
             
         Returns:
-            List of result dictionaries
+            List of CheckResult records
         """
+        total, max_pending = len(usernames), None
+        if scheduler is not None:
+            scheduler.extend(usernames)
+            # Names are only handed out when a worker is free, so the budget and
+            # late high-priority pushes apply to everything not yet running
+            usernames, total, max_pending = scheduler, scheduler.expected(), self.max_workers
+        
         results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_username = {
-                executor.submit(self.check_single_username, username, use_api): username 
-                for username in usernames
-            }
-            
-            for future in tqdm(as_completed(future_to_username), total=len(usernames), desc="Progress", colour="blue"):
-                try:
-                    result = future.result()
-                    results.append(result)
-                    self.random_delay(0.5, 1.5)
-                except Exception as e:
-                    username = future_to_username[future]
-                    self.logger.error(f"Thread error for {username}: {e}")
-                    error_result = {
-                        'username': username,
-                        'available': False,
-                        'status': f'Thread error: {str(e)}',
-                        'method': 'error',
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    results.append(error_result)
-                    self.errors.append(error_result)
-                    print_colored_message(f"⚠️  ? {username} - THREAD ERROR: {str(e)}", "yellow")
+        for result in tqdm(self.iter_check(usernames, use_api, max_pending=max_pending), total=total,
+                           desc="Progress", colour="blue"):
+            results.append(result)
         
         return results
     
-    def check_usernames_from_file(self, filename: str) -> List[Dict]:
+    def check_usernames_from_file(self, filename: str, start_line: int = 1,
+                                  shard: Optional[Tuple[int, int]] = None) -> List[CheckResult]:
         """
         Load usernames from file and check them
         
         Args:
             filename: Path to file containing usernames (one per line)
+            start_line: 1-based line to start from, like --start-line and tail -n +N
+                (seeks via the cached line index)
+            shard: Optional (index, count) to check only one byte-range shard of the file
             
         Returns:
-            List of result dictionaries
+            List of CheckResult records
         """
         if not os.path.exists(filename):
             print_colored_message(f"Error: File '{filename}' not found.", "red")
@@ -356,8 +1275,11 @@ class InstagramUsernameChecker:
             return []
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                usernames = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+            with Wordlist(filename) as wordlist:
+                start, end = wordlist.shard(*shard) if shard else (0, wordlist.size)
+                if start_line > 1:
+                    start = max(start, wordlist.line_offset(start_line - 1))
+                usernames = list(wordlist.iter_names(start, end))
             print_colored_message(f"Loaded {len(usernames)} usernames from {filename}", "cyan")
             self.logger.info(f"Loaded {len(usernames)} usernames from {filename}")
         except Exception as e:
@@ -367,23 +1289,25 @@ class InstagramUsernameChecker:
         
         return self.check_usernames_batch(usernames)
     
-    def check_usernames_list(self, usernames: List[str], use_api: bool = True) -> List[Dict]:
+    def check_usernames_list(self, usernames: List[str], use_api: bool = True,
+                             scheduler: Optional['PriorityScheduler'] = None) -> List[CheckResult]:
         """
         Check a provided list of usernames
         
         Args:
             usernames: List of usernames to check
             use_api: Whether to use API method first
+            scheduler: Optional priority scheduler deciding the order and budget
             
         Returns:
-            List of result dictionaries
+            List of CheckResult records
         """
         if not usernames:
             print_colored_message("No usernames provided.", "yellow")
             return []
         
         print_colored_message(f"Checking {len(usernames)} provided usernames...", "cyan")
-        return self.check_usernames_batch(usernames, use_api)
+        return self.check_usernames_batch(usernames, use_api, scheduler=scheduler)
     
     def generate_username_variations(self, base: str, count: int = 10) -> List[str]:
         """
@@ -401,6 +1325,7 @@ class InstagramUsernameChecker:
             return []
         
         variations = [base]
+        seen = {base}
         suffixes = ['1', '2', '3', '4', '5', '_', '.', 'official', 'real', 'new', 'pro', 'hq', 'x', 'xx']
         prefixes = ['the', 'real', 'official', 'new', 'x']
         
@@ -421,7 +1346,8 @@ class InstagramUsernameChecker:
                 number = random.randint(1, 99)
                 variation = f"{base}{suffix}{number}"
             
-            if validate_username(variation) and variation not in variations:
+            if variation not in seen and validate_username(variation):
+                seen.add(variation)
                 variations.append(variation)
         
         print_colored_message(f"Generated {len(variations)} valid variations for base '{base}'", "cyan")
@@ -435,59 +1361,72 @@ class InstagramUsernameChecker:
             output_dir: Directory to save results
             save_csv: Whether to save CSV format
         """
+        started = time.perf_counter_ns()
         os.makedirs(output_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         prefix = f"instagram_check_{timestamp}"
         
-        if self.available_usernames:
+        available = self.available_usernames
+        unavailable = self.unavailable_usernames
+        errors = self.errors
+        
+        if available:
             avail_file = os.path.join(output_dir, f"{prefix}_available.txt")
             with open(avail_file, 'w', encoding='utf-8') as f:
                 f.write("AVAILABLE USERNAMES\n" + "="*50 + "\n\n")
-                for res in self.available_usernames:
+                for res in available:
                     f.write(f"{res['username']} - {res['status']} ({res['method']})\n")
-            print_colored_message(f"✅ Saved {len(self.available_usernames)} available usernames to: {avail_file}", "green")
+            print_colored_message(f"✅ Saved {len(available)} available usernames to: {avail_file}", "green")
         
-        if self.unavailable_usernames:
+        if unavailable:
             unavail_file = os.path.join(output_dir, f"{prefix}_unavailable.txt")
             with open(unavail_file, 'w', encoding='utf-8') as f:
                 f.write("UNAVAILABLE USERNAMES\n" + "="*50 + "\n\n")
-                for res in self.unavailable_usernames:
+                for res in unavailable:
                     f.write(f"{res['username']} - {res['status']} ({res['method']})\n")
-            print_colored_message(f"❌ Saved {len(self.unavailable_usernames)} unavailable usernames to: {unavail_file}", "red")
+            print_colored_message(f"❌ Saved {len(unavailable)} unavailable usernames to: {unavail_file}", "red")
         
-        if self.errors:
+        if errors:
             error_file = os.path.join(output_dir, f"{prefix}_errors.txt")
             with open(error_file, 'w', encoding='utf-8') as f:
                 f.write("ERRORS\n" + "="*50 + "\n\n")
-                for res in self.errors:
+                for res in errors:
                     f.write(f"{res['username']} - {res['status']} ({res['method']})\n")
-            print_colored_message(f"⚠️  Saved {len(self.errors)} errors to: {error_file}", "yellow")
+            print_colored_message(f"⚠️  Saved {len(errors)} errors to: {error_file}", "yellow")
         
         if save_csv:
             csv_file = os.path.join(output_dir, f"{prefix}_results.csv")
-            all_results = self.available_usernames + self.unavailable_usernames + self.errors
+            all_results = available + unavailable + errors
             if all_results:
                 with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['username', 'available', 'status', 'method', 'timestamp'])
+                    writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
                     writer.writeheader()
-                    writer.writerows(all_results)
+                    writer.writerows(res.to_dict() for res in all_results)
                 print_colored_message(f"📊 Saved CSV report to: {csv_file}", "cyan")
         
         json_file = os.path.join(output_dir, f"{prefix}_summary.json")
         summary = {
             'timestamp': datetime.now().isoformat(),
-            'total_checked': len(self.available_usernames) + len(self.unavailable_usernames) + len(self.errors),
-            'available_count': len(self.available_usernames),
-            'unavailable_count': len(self.unavailable_usernames),
-            'error_count': len(self.errors),
-            'available_usernames': [r['username'] for r in self.available_usernames],
-            'unavailable_usernames': [r['username'] for r in self.unavailable_usernames],
-            'error_usernames': [r['username'] for r in self.errors],
+            'total_checked': len(available) + len(unavailable) + len(errors),
+            'available_count': len(available),
+            'unavailable_count': len(unavailable),
+            'error_count': len(errors),
+            'available_usernames': [r.username for r in available],
+            'unavailable_usernames': [r.username for r in unavailable],
+            'error_usernames': [r.username for r in errors],
+            'latency_seconds': self.get_latency_stats(),
+            'traffic': self.get_traffic_stats(),
+            'notifications': self.notifier.get_stats() if self.notifier else None,
             'configuration': {
                 'proxy_used': self.proxy is not None,
                 'max_workers': self.max_workers,
                 'min_delay': self.min_delay,
                 'max_delay': self.max_delay,
+                'deadline': self.deadline,
+                'max_retries': self.max_retries,
+                'max_attempts': self.max_attempts,
+                'connect_timeout': self.connect_timeout,
+                'read_timeout': self.read_timeout,
                 'verbose': self.verbose
             }
         }
@@ -499,17 +1438,86 @@ class InstagramUsernameChecker:
         print_colored_message(f"\n🎉 All results saved to directory: {output_dir}", "green")
         
         format_results_summary(
-            len(self.available_usernames),
-            len(self.unavailable_usernames), 
-            len(self.errors)
+            len(available),
+            len(unavailable), 
+            len(errors),
+            self.get_latency_stats(),
+            self.get_traffic_stats()
         )
+        if self.tracer is not None:
+            self.tracer.record('save_results', 'io', started, time.perf_counter_ns(), {'output_dir': output_dir})
+    
+    @property
+    def available_usernames(self) -> List[CheckResult]:
+        """Snapshot of results with an available verdict"""
+        return self.results.by_verdict(Verdict.AVAILABLE)
+    
+    @property
+    def unavailable_usernames(self) -> List[CheckResult]:
+        """Snapshot of results with a taken verdict"""
+        return self.results.by_verdict(Verdict.TAKEN)
+    
+    @property
+    def errors(self) -> List[CheckResult]:
+        """Snapshot of results that ended in an error"""
+        return self.results.by_verdict(Verdict.ERROR)
     
-    def clear_results(self):
+    def clear_results(self, announce: bool = True):
         """Clear all stored results"""
-        self.available_usernames.clear()
-        self.unavailable_usernames.clear()
-        self.errors.clear()
-        print_colored_message("🧹 Results cleared", "yellow")
+        self.results.clear()
+        with self._metrics_lock:
+            del self.check_durations[:]
+            del self.check_bytes[:]
+            self.http_status_counts.clear()
+            self.endpoint_traffic.clear()
+        if announce:
+            print_colored_message("🧹 Results cleared", "yellow")
+    
+    def get_http_status_counts(self) -> Counter:
+        """Snapshot of responses per HTTP status ('network_error' for failed requests)"""
+        with self._metrics_lock:
+            return Counter(self.http_status_counts)
+    
+    def requests_sent(self) -> int:
+        """HTTP requests sent so far, including failed ones (safe to poll from any thread)"""
+        with self._metrics_lock:
+            return sum(self.http_status_counts.values())
+    
+    def get_latency_stats(self) -> Dict:
+        """
+        Get the per-check latency distribution
+        
+        Returns:
+            Dictionary with count, mean, p50, p90, p99 and max in seconds
+        """
+        with self._metrics_lock:
+            samples = list(self.check_durations)
+        return summarize_latencies(samples)
+    
+    def get_traffic_stats(self) -> Dict:
+        """
+        Get bytes transferred, per endpoint and per check
+        
+        Byte counts cover HTTP request/response lines, headers and bodies as
+        sent on the wire (compressed); TLS and TCP overhead is not included.
+        
+        Returns:
+            Dictionary with totals, per-endpoint counters, bytes per check
+            attempt and bytes per recorded username
+        """
+        with self._metrics_lock:
+            endpoints = {name: dict(traffic) for name, traffic in self.endpoint_traffic.items()}
+            per_check = list(self.check_bytes)
+        bytes_up = sum(t['bytes_up'] for t in endpoints.values())
+        bytes_down = sum(t['bytes_down'] for t in endpoints.values())
+        checked = self.results.total()
+        return {
+            'bytes_up': bytes_up,
+            'bytes_down': bytes_down,
+            'bytes_per_username': round((bytes_up + bytes_down) / checked, 1) if checked else 0.0,
+            'bytes_per_check': summarize_latencies(per_check),
+            'endpoints': endpoints
+        }
     
     def get_stats(self) -> Dict:
         """
@@ -518,13 +1526,14 @@ class InstagramUsernameChecker:
         Returns:
             Dictionary with current stats
         """
-        total = len(self.available_usernames) + len(self.unavailable_usernames) + len(self.errors)
+        counts = self.results.counts()
+        total = counts['available'] + counts['unavailable'] + counts['errors']
         return {
             'total_checked': total,
-            'available': len(self.available_usernames),
-            'unavailable': len(self.unavailable_usernames),
-            'errors': len(self.errors),
-            'success_rate': ((len(self.available_usernames) + len(self.unavailable_usernames)) / total * 100) if total > 0 else 0
+            'available': counts['available'],
+            'unavailable': counts['unavailable'],
+            'errors': counts['errors'],
+            'success_rate': ((counts['available'] + counts['unavailable']) / total * 100) if total > 0 else 0
         }
 
 
@@ -1,17 +1,25 @@
 # By Moh0py dev github.com/Moh0py
 import argparse
+import atexit
 import sys
 import os
 from typing import List
 
-from checker import InstagramUsernameChecker
+from checker import InstagramUsernameChecker, BackgroundChecker, describe_result
 from utils import (
     display_banner, 
     print_colored_message, 
+    print_above_prompt,
+    console_logging_paused,
     get_user_input_usernames, 
     create_sample_usernames_file,
-    validate_username
+    validate_username,
+    format_bytes,
+    RateLimiter
 )
+from transport import create_transport
+from notify import create_notifier
+from tracer import Tracer
 
 
 def parse_arguments():
@@ -26,6 +34,11 @@ Examples:
   %(prog)s --generate myname --count 15
   %(prog)s --interactive --verbose
   %(prog)s --create-sample --sample-count 25
+  %(prog)s --serve --port 8765 --rate 2
+  %(prog)s --watch watchlist.txt --rate 0.5 --events events.jsonl
+  %(prog)s --autotune --max-requests 300
+  %(prog)s --file usernames.txt --record run.json.gz
+  %(prog)s --file usernames.txt --replay run.json.gz --no-save
         """
     )
     
@@ -55,6 +68,54 @@ Examples:
         action='store_true',
         help='Create a sample usernames file for testing'
     )
+    input_group.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run a long-lived local JSON API (POST /check) with a warm session'
+    )
+    input_group.add_argument(
+        '--watch',
+        type=str,
+        metavar='FILE',
+        help='Keep rechecking the usernames in FILE and report when they free up'
+    )
+    input_group.add_argument(
+        '--autotune',
+        action='store_true',
+        help='Calibrate workers and request rate, then save them as the default profile'
+    )
+    
+    parser.add_argument(
+        '--start-line',
+        type=int,
+        help='Start --file at this 1-based line number, like tail -n +N (same as the start_line API); '
+             'uses a cached line index'
+    )
+    parser.add_argument(
+        '--shard',
+        type=str,
+        help='Check only shard i of k of --file, split by byte range at line boundaries (e.g. 2/8)'
+    )
+    parser.add_argument(
+        '--validate-only',
+        action='store_true',
+        help='Validate, lowercase and deduplicate --file offline (no network), then exit'
+    )
+    parser.add_argument(
+        '--clean-output',
+        type=str,
+        help='Cleaned wordlist path for --validate-only (default: <file>.clean.txt)'
+    )
+    parser.add_argument(
+        '--processes',
+        type=int,
+        help='Worker processes for --validate-only (default: CPU count)'
+    )
+    parser.add_argument(
+        '--no-dedupe',
+        action='store_true',
+        help='Keep repeated names in --validate-only output (no dedupe spill on disk)'
+    )
     
     parser.add_argument(
         '--count', '-c',
@@ -83,22 +144,258 @@ Examples:
     parser.add_argument(
         '--workers', '-w',
         type=int,
-        default=3,
-        help='Maximum concurrent threads (default: 3)'
+        help='Maximum concurrent threads (default: 3, or the autotuned profile)'
     )
     parser.add_argument(
         '--min-delay',
         type=float,
-        default=2.0,
         help='Minimum delay between requests in seconds (default: 2.0)'
     )
     parser.add_argument(
         '--max-delay',
         type=float,
-        default=5.0,
         help='Maximum delay between requests in seconds (default: 5.0)'
     )
     
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Two-stage check: fast first pass, then confirm available/unclear names with the other method'
+    )
+    parser.add_argument(
+        '--confirm-workers',
+        type=int,
+        default=2,
+        help='Concurrent confirmation checks in --pipeline mode (default: 2)'
+    )
+    parser.add_argument(
+        '--priority-file',
+        type=str,
+        help='Usernames to check before all others, most important first (one per line)'
+    )
+    parser.add_argument(
+        '--history',
+        nargs='+',
+        metavar='PATH',
+        help='Results CSVs (or directories of them) whose verdicts steer the check order'
+    )
+    parser.add_argument(
+        '--stale-after',
+        type=float,
+        default=24.0,
+        help='Hours after which a cached verdict is fully stale for --history (default: 24)'
+    )
+    parser.add_argument(
+        '--max-checks',
+        type=int,
+        help='Check only the N most valuable usernames'
+    )
+    parser.add_argument(
+        '--request-budget',
+        type=int,
+        help='Stop handing out usernames once this many HTTP requests were sent'
+    )
+    
+    parser.add_argument(
+        '--deadline',
+        type=float,
+        default=30.0,
+        help='Total seconds allowed per username before it is marked timed out (default: 30)'
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=2,
+        help='Immediate retries within one attempt, e.g. after a rejected CSRF token (default: 2)'
+    )
+    parser.add_argument(
+        '--attempts',
+        type=int,
+        default=3,
+        help='Attempts per username; failed ones are deferred and retried after the rest (default: 3)'
+    )
+    parser.add_argument(
+        '--retry-backoff',
+        type=float,
+        default=2.0,
+        help='Seconds before the first deferred retry, doubling per attempt (default: 2)'
+    )
+    parser.add_argument(
+        '--connect-timeout',
+        type=float,
+        default=5.0,
+        help='Connection timeout in seconds (default: 5)'
+    )
+    parser.add_argument(
+        '--read-timeout',
+        type=float,
+        default=10.0,
+        help='Read timeout in seconds (default: 10)'
+    )
+    parser.add_argument(
+        '--parse-processes',
+        type=int,
+        default=0,
+        help='Classify large response bodies in this many worker processes (default: 0, inline)'
+    )
+    parser.add_argument(
+        '--parse-offload-bytes',
+        type=int,
+        default=64 * 1024,
+        help='Bodies at least this large go to the parse processes (default: 65536)'
+    )
+    parser.add_argument(
+        '--rate',
+        type=float,
+        help='Shared request budget in requests/second (replaces fixed delays; default 1 for --serve/--watch)'
+    )
+    
+    parser.add_argument(
+        '--record',
+        type=str,
+        metavar='CASSETTE',
+        help='Record all HTTP exchanges to a cassette file (.json or .json.gz)'
+    )
+    parser.add_argument(
+        '--replay',
+        type=str,
+        metavar='CASSETTE',
+        help='Replay HTTP exchanges from a cassette offline, without delays'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        type=str,
+        help='Throughput profile file to load or save (default: ~/.config/instagram_checker/profile.json)'
+    )
+    parser.add_argument(
+        '--no-profile',
+        action='store_true',
+        help='Ignore the saved autotuned profile'
+    )
+    parser.add_argument(
+        '--tune-local',
+        action='store_true',
+        help='Calibrate against a local stand-in server instead of Instagram'
+    )
+    parser.add_argument(
+        '--max-requests',
+        type=int,
+        default=300,
+        help='Request cap for the whole --autotune calibration (default: 300)'
+    )
+    parser.add_argument(
+        '--max-429-rate',
+        type=float,
+        default=0.02,
+        help='Highest acceptable share of throttled responses for --autotune (default: 0.02)'
+    )
+    parser.add_argument(
+        '--tune-start-rate',
+        type=float,
+        default=0.5,
+        help='First request rate tried by --autotune in requests/second (default: 0.5)'
+    )
+    
+    parser.add_argument(
+        '--host',
+        type=str,
+        default='127.0.0.1',
+        help='Interface for --serve (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Port for --serve (default: 8765)'
+    )
+    parser.add_argument(
+        '--socket',
+        type=str,
+        help='Unix socket path for --serve (overrides --host/--port)'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=300.0,
+        help='Seconds --serve answers a repeated username from cache (default: 300)'
+    )
+    
+    parser.add_argument(
+        '--state',
+        type=str,
+        help='Schedule state file for --watch (default: <watch file>.state.json)'
+    )
+    parser.add_argument(
+        '--events',
+        type=str,
+        help='Append availability events from --watch to this JSON-lines file'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=300.0,
+        help='Starting recheck interval for --watch in seconds (default: 300)'
+    )
+    parser.add_argument(
+        '--min-interval',
+        type=float,
+        default=60.0,
+        help='Recheck interval for flagged names and after errors (default: 60)'
+    )
+    parser.add_argument(
+        '--max-interval',
+        type=float,
+        default=21600.0,
+        help='Longest backed-off recheck interval for --watch (default: 21600)'
+    )
+    parser.add_argument(
+        '--flagged',
+        nargs='+',
+        default=[],
+        help='Usernames to recheck at --min-interval in --watch mode'
+    )
+    
+    parser.add_argument(
+        '--notify-command',
+        type=str,
+        help='Run this command for every available name (event JSON on stdin, $IG_USERNAME set)'
+    )
+    parser.add_argument(
+        '--notify-socket',
+        type=str,
+        help='Send available-name events as JSON lines to this Unix socket'
+    )
+    parser.add_argument(
+        '--notify-webhook',
+        type=str,
+        help='POST available-name events as JSON to this URL'
+    )
+    parser.add_argument(
+        '--notify-file',
+        type=str,
+        help='Append available-name events as JSON lines to this file'
+    )
+    parser.add_argument(
+        '--notify-queue',
+        type=int,
+        default=1000,
+        help='Events buffered per notification sink before new ones are dropped (default: 1000)'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        type=str,
+        metavar='FILE',
+        help='Record a per-thread timeline and write it as Chrome trace JSON (open in ui.perfetto.dev)'
+    )
+    parser.add_argument(
+        '--trace-buffer',
+        type=int,
+        default=100_000,
+        help='Most recent spans kept by --trace (default: 100000)'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         type=str,
@@ -139,6 +436,255 @@ def validate_proxy(proxy: str) -> bool:
     return any(proxy.startswith(prefix) for prefix in valid_prefixes)
 
 
+def run_autotune(args):
+    """Run the throughput calibration and save the tuned profile"""
+    from autotune import AutoTuner, save_profile, DEFAULT_PROFILE_PATH
+    from checker import INSTAGRAM_URL
+    from mock_server import MockInstagramServer
+    
+    if args.tune_start_rate <= 0:
+        print_colored_message("❌ --tune-start-rate must be greater than 0", "red")
+        sys.exit(1)
+    
+    mock = MockInstagramServer().start() if args.tune_local else None
+    tuner = AutoTuner(
+        base_url=mock.base_url if mock else INSTAGRAM_URL,
+        proxy=args.proxy,
+        max_requests=args.max_requests,
+        max_throttle_rate=args.max_429_rate,
+        start_rate=args.tune_start_rate
+    )
+    
+    print_colored_message(f"🎛️  Calibrating against {tuner.base_url} (cap: {args.max_requests} requests)", "cyan")
+    try:
+        profile = tuner.tune()
+    except RuntimeError as e:
+        print_colored_message(f"❌ {e}", "red")
+        sys.exit(1)
+    finally:
+        if mock:
+            mock.stop()
+    
+    print_colored_message(f"\n✅ Tuned: {profile['workers']} workers at {profile['rate']} requests/second "
+                          f"(~{profile['measured_checks_per_minute']} checks/min measured)", "green")
+    
+    if mock and not args.profile:
+        print_colored_message("💡 Local calibration is not saved as the default profile; pass --profile to keep it", "yellow")
+        return
+    
+    path = args.profile or DEFAULT_PROFILE_PATH
+    save_profile(profile, path)
+    print_colored_message(f"💾 Saved profile to: {path}", "cyan")
+
+
+def apply_profile(args):
+    """Fill unset throughput options from the autotuned profile, then from defaults"""
+    if not args.no_profile:
+        from autotune import load_profile
+        profile = load_profile(args.profile)
+        if profile and (args.profile or profile.get('target') == 'instagram'):
+            if args.workers is None and profile.get('workers'):
+                args.workers = profile['workers']
+            if args.rate is None and args.min_delay is None and args.max_delay is None and profile.get('rate'):
+                args.rate = profile['rate']
+            if not args.quiet:
+                print_colored_message(f"🎛️  Using tuned profile: {args.workers} workers, {args.rate} requests/second", "blue")
+    
+    if args.workers is None:
+        args.workers = 3
+    if args.min_delay is None:
+        args.min_delay = 2.0
+    if args.max_delay is None:
+        args.max_delay = 5.0
+
+
+def save_trace(tracer, path: str, quiet: bool = False):
+    """Write the --trace timeline (registered to run at exit)"""
+    try:
+        kept = tracer.export(path)
+    except OSError as e:
+        print_colored_message(f"❌ Error writing trace: {e}", "red")
+        return
+    if not quiet:
+        dropped = tracer.recorded - kept
+        note = f", {dropped} oldest spans overwritten" if dropped else ""
+        print_colored_message(f"🧵 Trace with {kept} spans{note} saved to: {path} (open in ui.perfetto.dev)", "cyan")
+
+
+def save_recording(checker: InstagramUsernameChecker, args):
+    """Write the recorded cassette when --record is active"""
+    if not args.record:
+        return
+    try:
+        checker.transport.save()
+        print_colored_message(f"📼 Saved recorded exchanges to: {args.record}", "cyan")
+    except Exception as e:
+        print_colored_message(f"❌ Error saving cassette: {e}", "red")
+
+
+def check_while_typing(checker: InstagramUsernameChecker, use_api: bool = True) -> List[str]:
+    """
+    Read usernames interactively, checking each one in the background as soon as it is entered
+    
+    Results are printed above the input prompt as they arrive; console logging
+    is paused while the prompt is open (the log file still gets everything).
+    Returns once input ends and every submitted name has been checked.
+    
+    Args:
+        checker: Checker whose warm session is reused
+        use_api: Whether to use API method
+    
+    Returns:
+        List of usernames entered
+    """
+    prompt = {'text': "Username: "}
+    background = BackgroundChecker(
+        checker,
+        use_api=use_api,
+        on_result=lambda result: print_above_prompt(*describe_result(result), prompt=prompt['text'])
+    )
+    checker.echo = False
+    try:
+        # Log lines from the workers would be written over the line being typed
+        with console_logging_paused():
+            usernames = get_user_input_usernames(on_username=background.submit)
+        prompt['text'] = ""
+        if background.pending():
+            print_colored_message(f"⏳ Waiting for {background.pending()} remaining checks...", "blue")
+        background.join()
+    finally:
+        background.close()
+        checker.echo = True
+    return usernames
+
+
+def build_scheduler(checker: InstagramUsernameChecker, args):
+    """Priority scheduler from --priority-file/--history/--max-checks/--request-budget, or None"""
+    if not (args.priority_file or args.history or args.max_checks or args.request_budget):
+        return None
+    from scheduler import PriorityScheduler, ValueScorer, VerdictHistory
+    
+    priority = []
+    if args.priority_file:
+        with open(args.priority_file, 'r', encoding='utf-8') as f:
+            priority = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    history = VerdictHistory.from_paths(args.history or [])
+    
+    should_stop = None
+    if args.request_budget:
+        budget = args.request_budget
+        should_stop = lambda: checker.requests_sent() >= budget
+    
+    if not args.quiet:
+        print_colored_message(f"🎯 Priority order: {len(priority)} priority names, {len(history)} cached verdicts", "cyan")
+    return PriorityScheduler(ValueScorer(history, priority, stale_after=args.stale_after * 3600),
+                             limit=args.max_checks, should_stop=should_stop)
+
+
+def run_pipeline(checker: InstagramUsernameChecker, usernames: List[str], args, scheduler=None):
+    """Check usernames with the two-stage triage pipeline"""
+    from pipeline import TriagePipeline
+    from tqdm import tqdm
+    
+    total = len(usernames)
+    if scheduler is not None:
+        scheduler.extend(usernames)
+        usernames, total = scheduler, scheduler.expected()
+    
+    pipeline = TriagePipeline(checker, confirm_workers=args.confirm_workers)
+    results = list(tqdm(pipeline.run(usernames, use_api=not args.no_api),
+                        total=total, desc="Progress", colour="blue"))
+    if not args.quiet:
+        pipeline.print_summary()
+    return results
+
+
+def run_wordlist(checker: InstagramUsernameChecker, args):
+    """Stream --file from a line or shard through the checker with byte-based progress"""
+    from tqdm import tqdm
+    from wordlist import Wordlist, parse_shard
+    
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as e:
+        print_colored_message(f"❌ {e}", "red")
+        sys.exit(1)
+    
+    with Wordlist(args.file) as wordlist:
+        start, end = wordlist.shard(*shard) if shard else (0, wordlist.size)
+        if args.start_line and args.start_line > 1:
+            start = max(start, wordlist.line_offset(args.start_line - 1))
+        if not args.quiet:
+            print_colored_message(f"📂 Streaming {args.file} (bytes {start:,}-{end:,} of {wordlist.size:,})", "cyan")
+        
+        skipped = 0
+        
+        def valid_names(names):
+            nonlocal skipped
+            for name in names:
+                if validate_username(name):
+                    yield name
+                else:
+                    skipped += 1
+        
+        with tqdm(total=end - start, unit='B', unit_scale=True, desc="Progress", colour="blue") as bar:
+            names = valid_names(wordlist.iter_names(start, end, on_progress=bar.update, block_size=64 * 1024))
+            if args.pipeline:
+                from pipeline import TriagePipeline
+                pipeline = TriagePipeline(checker, confirm_workers=args.confirm_workers)
+                for _ in pipeline.run(names, use_api=not args.no_api):
+                    pass
+            else:
+                for _ in checker.iter_check(names, use_api=not args.no_api):
+                    pass
+        
+        if args.pipeline and not args.quiet:
+            pipeline.print_summary()
+        if skipped and not args.quiet:
+            print_colored_message(f"⚠️  Skipped {skipped} invalid usernames", "yellow")
+
+
+def run_validate(args):
+    """Clean --file offline into a valid (by default deduplicated) wordlist and a JSON report"""
+    import json
+    from tqdm import tqdm
+    from wordlist import validate_wordlist
+    
+    if not os.path.exists(args.file):
+        print_colored_message(f"❌ File not found: {args.file}", "red")
+        sys.exit(1)
+    
+    root, _ = os.path.splitext(args.file)
+    output_path = args.clean_output or f"{root}.clean.txt"
+    report_path = f"{os.path.splitext(output_path)[0]}.report.json"
+    if os.path.abspath(output_path) == os.path.abspath(args.file):
+        print_colored_message("❌ --clean-output must differ from --file", "red")
+        sys.exit(1)
+    
+    with open(output_path, 'wb') as output, \
+            tqdm(total=os.path.getsize(args.file), unit='B', unit_scale=True, desc="Validating",
+                 colour="blue", disable=args.quiet) as bar:
+        report = validate_wordlist(args.file, output, processes=args.processes, dedupe=not args.no_dedupe,
+                                   on_progress=bar.update)
+    report['output'] = output_path
+    
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    
+    if args.quiet:
+        return
+    print_colored_message(f"\n✅ {report['valid']:,} valid of {report['names']:,} names "
+                          f"({report['names_per_second']:,.0f} names/s)", "green")
+    if report['duplicates'] is not None:
+        print_colored_message(f"🔁 Duplicates dropped: {report['duplicates']:,}", "cyan")
+    print_colored_message(f"🚫 Rejected: {report['rejected']:,}", "yellow")
+    for rule, count in report['rejected_by_rule'].items():
+        if count:
+            print_colored_message(f"   {rule}: {count:,}", "yellow")
+    print_colored_message(f"💾 Clean wordlist: {output_path}", "green")
+    print_colored_message(f"📋 Report: {report_path}", "green")
+
+
 def main():
     """Main execution function"""
     args = parse_arguments()
@@ -157,19 +703,111 @@ def main():
         print_colored_message(f"💡 Now you can run: python {sys.argv[0]} --file {filename}", "cyan")
         return
     
+    if args.autotune:
+        run_autotune(args)
+        return
+    
+    apply_profile(args)
+    
+    if (args.start_line or args.shard) and not args.file:
+        print_colored_message("❌ --start-line and --shard require --file", "red")
+        sys.exit(1)
+    
+    if (args.start_line or args.shard) and (args.priority_file or args.history or args.max_checks or args.request_budget):
+        print_colored_message("❌ Priority scheduling needs the whole list; it cannot be combined with --start-line/--shard", "red")
+        sys.exit(1)
+    
+    if args.validate_only:
+        if not args.file:
+            print_colored_message("❌ --validate-only requires --file", "red")
+            sys.exit(1)
+        run_validate(args)
+        return
+    
+    if args.rate is not None and args.rate <= 0:
+        print_colored_message("❌ --rate must be greater than 0", "red")
+        sys.exit(1)
+    
+    if args.watch and not os.path.exists(args.watch):
+        print_colored_message(f"❌ File not found: {args.watch}", "red")
+        sys.exit(1)
+    
+    if (args.serve or args.watch) and args.rate is None:
+        # Long-lived modes pace requests with the shared budget, never a post-check delay
+        args.rate = 1.0
+    
+    if args.record and args.replay:
+        print_colored_message("❌ Use either --record or --replay, not both", "red")
+        sys.exit(1)
+    
     try:
+        transport = create_transport(record=args.record, replay=args.replay)
+        notifier = create_notifier(command=args.notify_command, socket_path=args.notify_socket,
+                                   webhook=args.notify_webhook, file=args.notify_file,
+                                   queue_size=args.notify_queue)
         checker = InstagramUsernameChecker(
             proxy=args.proxy,
             max_workers=args.workers,
             min_delay=args.min_delay,
             max_delay=args.max_delay,
-            verbose=args.verbose and not args.quiet
+            verbose=args.verbose and not args.quiet,
+            rate_limiter=RateLimiter(args.rate, burst=args.workers) if args.rate else None,
+            transport=transport,
+            deadline=args.deadline,
+            max_retries=args.retries,
+            max_attempts=args.attempts,
+            retry_backoff=args.retry_backoff,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+            notifier=notifier,
+            parse_processes=args.parse_processes,
+            parse_offload_bytes=args.parse_offload_bytes,
+            tracer=Tracer(args.trace_buffer) if args.trace else None
         )
     except Exception as e:
         print_colored_message(f"❌ Failed to initialize checker: {e}", "red")
         sys.exit(1)
     
+    if notifier is not None:
+        # Flush queued notifications on every exit path (serve, watch, interrupts)
+        atexit.register(notifier.close)
+    if args.parse_processes:
+        atexit.register(checker.close)
+    if checker.tracer is not None:
+        atexit.register(save_trace, checker.tracer, args.trace, args.quiet)
+    
+    if args.serve:
+        from server import serve
+        try:
+            serve(checker, host=args.host, port=args.port, socket_path=args.socket, cache_ttl=args.cache_ttl)
+        except OSError as e:
+            print_colored_message(f"❌ Could not start server: {e}", "red")
+            sys.exit(1)
+        finally:
+            save_recording(checker, args)
+        return
+    
+    if args.watch:
+        from watcher import Watchlist
+        watchlist = Watchlist(
+            checker,
+            state_file=args.state or f"{args.watch}.state.json",
+            base_interval=args.interval,
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            events_file=args.events
+        )
+        with open(args.watch, 'r', encoding='utf-8') as f:
+            watchlist.add(line.strip() for line in f if line.strip() and not line.startswith('#'))
+        watchlist.add(args.flagged, flagged=True)
+        try:
+            watchlist.run()
+        finally:
+            save_recording(checker, args)
+        return
+    
     usernames = []
+    already_checked = False
     
     if args.usernames:
         usernames = args.usernames
@@ -181,14 +819,24 @@ def main():
             print_colored_message(f"❌ File not found: {args.file}", "red")
             sys.exit(1)
         
-        try:
-            with open(args.file, 'r', encoding='utf-8') as f:
-                usernames = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            if not args.quiet:
-                print_colored_message(f"📂 Loaded {len(usernames)} usernames from {args.file}", "cyan")
-        except Exception as e:
-            print_colored_message(f"❌ Error reading file: {e}", "red")
-            sys.exit(1)
+        if args.start_line or args.shard:
+            try:
+                run_wordlist(checker, args)
+            except KeyboardInterrupt:
+                print_colored_message("\n\n⚠️  Process interrupted by user", "yellow")
+            finally:
+                save_recording(checker, args)
+            already_checked = True
+        
+        else:
+            try:
+                with open(args.file, 'r', encoding='utf-8') as f:
+                    usernames = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                if not args.quiet:
+                    print_colored_message(f"📂 Loaded {len(usernames)} usernames from {args.file}", "cyan")
+            except Exception as e:
+                print_colored_message(f"❌ Error reading file: {e}", "red")
+                sys.exit(1)
     
     elif args.generate:
         if not validate_username(args.generate):
@@ -202,10 +850,14 @@ def main():
     elif args.interactive:
         if not args.quiet:
             print_colored_message("🔄 Interactive mode - Enter usernames manually", "cyan")
-        usernames = get_user_input_usernames()
+        try:
+            usernames = check_while_typing(checker, use_api=not args.no_api)
+        finally:
+            save_recording(checker, args)
         if not usernames:
             print_colored_message("❌ No valid usernames entered", "yellow")
             sys.exit(0)
+        already_checked = True
     
     valid_usernames = []
     invalid_count = 0
@@ -218,30 +870,37 @@ def main():
             if not args.quiet:
                 print_colored_message(f"⚠️  Skipping invalid username: {username}", "yellow")
     
-    if not valid_usernames:
+    if not valid_usernames and not already_checked:
         print_colored_message("❌ No valid usernames to check", "red")
         sys.exit(1)
     
     if invalid_count > 0 and not args.quiet:
         print_colored_message(f"⚠️  Skipped {invalid_count} invalid usernames", "yellow")
     
-    if not args.quiet:
+    if not args.quiet and not already_checked:
         print_colored_message(f"\n🚀 Starting check for {len(valid_usernames)} usernames...", "green")
         if args.proxy:
             print_colored_message(f"🔒 Using proxy: {args.proxy}", "blue")
         if args.no_api:
             print_colored_message("⚠️  API method disabled - using profile checking only", "yellow")
     
-    try:
-        results = checker.check_usernames_list(valid_usernames, use_api=not args.no_api)
-    except KeyboardInterrupt:
-        print_colored_message("\n\n⚠️  Process interrupted by user", "yellow")
-        if not args.quiet:
-            stats = checker.get_stats()
-            print_colored_message(f"📊 Partial results: {stats}", "blue")
-    except Exception as e:
-        print_colored_message(f"\n❌ Error during checking: {e}", "red")
-        sys.exit(1)
+    if not already_checked:
+        try:
+            scheduler = build_scheduler(checker, args)
+            if args.pipeline:
+                results = run_pipeline(checker, valid_usernames, args, scheduler=scheduler)
+            else:
+                results = checker.check_usernames_list(valid_usernames, use_api=not args.no_api, scheduler=scheduler)
+        except KeyboardInterrupt:
+            print_colored_message("\n\n⚠️  Process interrupted by user", "yellow")
+            if not args.quiet:
+                stats = checker.get_stats()
+                print_colored_message(f"📊 Partial results: {stats}", "blue")
+        except Exception as e:
+            print_colored_message(f"\n❌ Error during checking: {e}", "red")
+            sys.exit(1)
+        finally:
+            save_recording(checker, args)
     
     if not args.quiet:
         stats = checker.get_stats()
@@ -251,6 +910,17 @@ def main():
         print_colored_message(f"   Unavailable: {stats['unavailable']}", "red")
         print_colored_message(f"   Errors: {stats['errors']}", "yellow")
         print_colored_message(f"   Success Rate: {stats['success_rate']:.1f}%", "blue")
+        latency = checker.get_latency_stats()
+        if latency['count']:
+            print_colored_message(f"   Latency p50/p90/p99/max: {latency['p50']:.2f}s / {latency['p90']:.2f}s / "
+                                  f"{latency['p99']:.2f}s / {latency['max']:.2f}s", "magenta")
+        traffic = checker.get_traffic_stats()
+        if traffic['bytes_up'] or traffic['bytes_down']:
+            print_colored_message(f"   Traffic: {format_bytes(traffic['bytes_up'] + traffic['bytes_down'])} total, "
+                                  f"{format_bytes(traffic['bytes_per_username'])} per username", "magenta")
+        if checker.notifier is not None:
+            checker.notifier.close()
+            checker.notifier.print_summary()
     
     if not args.no_save:
         try:
@@ -267,6 +937,16 @@ def main():
 def interactive_menu():
     """Interactive menu for advanced usage"""
     display_banner()
+    checker = None
+    
+    def warm_checker() -> InstagramUsernameChecker:
+        """One checker (and HTTP session) shared by every menu action"""
+        nonlocal checker
+        if checker is None:
+            checker = InstagramUsernameChecker(verbose=True)
+        else:
+            checker.clear_results(announce=False)
+        return checker
     
     while True:
         print_colored_message("\n" + "="*50, "white")
@@ -283,17 +963,13 @@ def interactive_menu():
             choice = input("\nSelect option (1-6): ").strip()
             
             if choice == '1':
-                usernames = get_user_input_usernames()
-                if usernames:
-                    checker = InstagramUsernameChecker(verbose=True)
-                    checker.check_usernames_list(usernames)
+                if check_while_typing(warm_checker()):
                     checker.save_results()
             
             elif choice == '2':
                 filename = input("Enter filename: ").strip()
                 if os.path.exists(filename):
-                    checker = InstagramUsernameChecker(verbose=True)
-                    checker.check_usernames_from_file(filename)
+                    warm_checker().check_usernames_from_file(filename)
                     checker.save_results()
                 else:
                     print_colored_message(f"File not found: {filename}", "red")
@@ -302,8 +978,7 @@ def interactive_menu():
                 base = input("Enter base username: ").strip()
                 if validate_username(base):
                     count = int(input("Number of variations (default 10): ") or "10")
-                    checker = InstagramUsernameChecker(verbose=True)
-                    variations = checker.generate_username_variations(base, count)
+                    variations = warm_checker().generate_username_variations(base, count)
                     checker.check_usernames_list(variations)
                     checker.save_results()
                 else:
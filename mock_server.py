@@ -0,0 +1,159 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """Clients that hang up mid-response (early-stopping downloads) are not errors"""
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockInstagramServer:
+    """
+    Local stand-in for the endpoints the checker uses
+
+    Serves the homepage (CSRF cookie), the signup check API and profile pages
+    with configurable latency and a server-side rate limit that answers 429
+    when exceeded, so throughput settings and engine changes can be measured
+    without touching Instagram.
+    """
+
+    def __init__(self, capacity: float = 20.0, burst: int = 5, latency: float = 0.05,
+                 taken_ratio: float = 0.9, profile_size: int = 200_000, port: int = 0,
+                 late_markers: bool = False):
+        """
+        Args:
+            capacity: Requests per second served before answering 429
+            burst: Requests allowed back to back
+            latency: Seconds added to every response
+            taken_ratio: Share of usernames reported as taken (stable per name)
+            profile_size: Bytes of padding in taken profile pages
+            port: Port to bind (0 picks a free one)
+            late_markers: Put the user data after the padding, as on real pages, so
+                classifying a taken page means scanning all of it
+        """
+        self.capacity = capacity
+        self.burst = burst
+        self.latency = latency
+        self.taken_ratio = taken_ratio
+        self.profile_size = profile_size
+        self.late_markers = late_markers
+        self.requests_served = 0
+        self.requests_throttled = 0
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+        handler = type('BoundMockHandler', (_MockHandler,), {'mock': self})
+        self.httpd = _QuietHTTPServer(('127.0.0.1', port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def is_taken(self, username: str) -> bool:
+        """Deterministic verdict per username"""
+        return (zlib.crc32(username.encode('utf-8')) % 1000) < self.taken_ratio * 1000
+
+    def admit(self) -> bool:
+        """Server-side token bucket; False means the request gets a 429"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.capacity)
+            self._last = now
+            self.requests_served += 1
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.requests_throttled += 1
+            return False
+
+    def profile_page(self, username: str) -> bytes:
+        head = f'<html><head><title>@{username}</title></head><body>'
+        data = (f'<script>{{"graphql":{{"user":{{"id":"1","username":"{username}","full_name":"Mock",'
+                f'"biography":"","profile_pic_url":"x"}}}}}}</script>')
+        padding = '<div class="post"></div>' * max(0, (self.profile_size - len(head) - len(data)) // 24)
+        if self.late_markers:
+            return (head + padding + data + '</body></html>').encode('utf-8')
+        return (head + data + padding + '</body></html>').encode('utf-8')
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'requests': self.requests_served, 'throttled': self.requests_throttled}
+
+    def start(self) -> 'MockInstagramServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'MockInstagramServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    mock: MockInstagramServer = None
+
+    def _reply(self, status: int, body: bytes, content_type: str = 'text/html', cookies: Optional[Dict] = None):
+        if self.mock.latency:
+            time.sleep(self.mock.latency)
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (cookies or {}).items():
+            self.send_header('Set-Cookie', f'{name}={value}; Path=/')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _throttled(self):
+        body = json.dumps({'message': 'Please wait a few minutes before you try again.', 'status': 'fail'})
+        self._reply(429, body.encode('utf-8'), 'application/json')
+
+    def do_GET(self):
+        if not self.mock.admit():
+            return self._throttled()
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            return self._reply(200, b'<html><body>mock</body></html>', cookies={'csrftoken': 'mocktoken'})
+        username = path.strip('/').lower()
+        if username and self.mock.is_taken(username):
+            return self._reply(200, self.mock.profile_page(username))
+        return self._reply(404, b"<html><body>Sorry, this page isn't available.</body></html>")
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        form = parse_qs(self.rfile.read(length).decode('utf-8'))
+        if not self.mock.admit():
+            return self._throttled()
+        if self.path.split('?', 1)[0] != '/api/v1/users/check_username/':
+            return self._reply(404, b'{}', 'application/json')
+        username = form.get('username', [''])[0].lower()
+        if self.mock.is_taken(username):
+            payload = {'available': False, 'errors': {'username': ['A user with that username already exists.']}}
+        else:
+            payload = {'available': True, 'status': 'ok'}
+        self._reply(200, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,281 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import logging
+import os
+import queue
+import shlex
+import socket
+import subprocess
+import threading
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+from results import CheckResult
+from utils import print_colored_message, summarize_latencies
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationSink:
+    """
+    Destination for availability events
+
+    send() raises on failure so the dispatcher can retry it.
+    """
+
+    kind = 'sink'
+
+    def __init__(self, target: str, timeout: float = 5.0):
+        """
+        Args:
+            target: Command, socket path, URL or file path
+            timeout: Seconds one delivery may take
+        """
+        self.target = target
+        self.timeout = timeout
+
+    def send(self, event: Dict, line: bytes):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.target}"
+
+
+class CommandSink(NotificationSink):
+    """Run a local command per event; the JSON line goes to stdin, the username to $IG_USERNAME"""
+
+    kind = 'command'
+
+    def __init__(self, target: str, timeout: float = 5.0):
+        super().__init__(target, timeout)
+        self.argv = shlex.split(target)
+
+    def send(self, event: Dict, line: bytes):
+        env = dict(os.environ, IG_USERNAME=event['username'], IG_STATUS=event['status'])
+        subprocess.run(self.argv, input=line, env=env, timeout=self.timeout, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class UnixSocketSink(NotificationSink):
+    """Write each event as a JSON line to a listening Unix stream socket"""
+
+    kind = 'socket'
+
+    def __init__(self, target: str, timeout: float = 5.0):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise ValueError("Unix sockets are not supported on this platform")
+        super().__init__(target, timeout)
+
+    def send(self, event: Dict, line: bytes):
+        # A fresh connection per event survives listener restarts
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.target)
+            sock.sendall(line)
+
+
+class WebhookSink(NotificationSink):
+    """POST each event as JSON to a (local) webhook URL"""
+
+    kind = 'webhook'
+
+    def __init__(self, target: str, timeout: float = 5.0):
+        super().__init__(target, timeout)
+        # Separate from the checker's session: no proxy, no Instagram headers
+        self.session = requests.Session()
+
+    def send(self, event: Dict, line: bytes):
+        response = self.session.post(self.target, data=line, timeout=self.timeout,
+                                     headers={'Content-Type': 'application/json'})
+        response.raise_for_status()
+
+    def close(self):
+        self.session.close()
+
+
+class FileSink(NotificationSink):
+    """Append each event as a JSON line to a file, flushed immediately"""
+
+    kind = 'file'
+
+    def __init__(self, target: str, timeout: float = 5.0):
+        super().__init__(target, timeout)
+        self._file = None
+
+    def send(self, event: Dict, line: bytes):
+        if self._file is None:
+            self._file = open(self.target, 'ab')
+        self._file.write(line)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _Dispatcher(threading.Thread):
+    """Delivery thread and bounded queue for one sink"""
+
+    def __init__(self, sink: NotificationSink, queue_size: int, max_attempts: int, retry_delay: float):
+        super().__init__(name=f"notify-{sink.kind}", daemon=True)
+        self.sink = sink
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.latencies = array('d')
+        self.sent = self.failed = self.retried = self.dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def offer(self, item: tuple):
+        """Queue an event without blocking; a full queue drops it"""
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.sink.close()
+                return
+            self._deliver(*item)
+
+    def _deliver(self, event: Dict, line: bytes, detected_at: float):
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self.sink.send(event, line)
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    self.failed += 1
+                    logger.error(f"Notification to {self.sink} failed for {event['username']}: {e}")
+                    return
+                self.retried += 1
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+                continue
+            self.latencies.append((time.time() - detected_at) * 1000)
+            self.sent += 1
+            return
+
+
+class Notifier:
+    """
+    Non-blocking fan-out of availability events to notification sinks
+
+    Each sink has its own dispatcher thread and bounded queue, so a slow or
+    failing sink only delays (and at worst drops) its own events; the
+    checking threads only ever enqueue. Failed deliveries are retried with
+    exponential backoff. Latency is measured from the moment the verdict
+    was produced (CheckResult.checked_at) to a successful delivery.
+    """
+
+    def __init__(self, sinks: List[NotificationSink], queue_size: int = 1000,
+                 max_attempts: int = 3, retry_delay: float = 0.5):
+        """
+        Args:
+            sinks: Destinations for every event
+            queue_size: Events buffered per sink before new ones are dropped
+            max_attempts: Delivery attempts per event and sink
+            retry_delay: Seconds before the first retry (doubles per attempt)
+        """
+        self._dispatchers = [_Dispatcher(sink, queue_size, max_attempts, retry_delay) for sink in sinks]
+        self._closed = False
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+    def notify(self, result: CheckResult):
+        """Queue an availability event for every sink (never blocks)"""
+        if self._closed:
+            return
+        event = {
+            'event': 'available',
+            'username': result.username,
+            'status': result.status,
+            'method': result.method.label,
+            'detected_at': datetime.fromtimestamp(result.checked_at).isoformat()
+        }
+        line = json.dumps(event, ensure_ascii=False).encode('utf-8') + b"\n"
+        for dispatcher in self._dispatchers:
+            dispatcher.offer((event, line, result.checked_at))
+
+    def close(self, timeout: float = 10.0):
+        """Deliver what is queued (within timeout) and stop the dispatchers"""
+        if self._closed:
+            return
+        self._closed = True
+        deadline = time.monotonic() + timeout
+        for dispatcher in self._dispatchers:
+            try:
+                dispatcher.queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                continue
+        for dispatcher in self._dispatchers:
+            dispatcher.join(max(0.0, deadline - time.monotonic()))
+
+    def get_stats(self) -> Dict:
+        """
+        Delivery counts and detection-to-notification latency per sink
+
+        Returns:
+            Dictionary keyed by sink ("kind:target") with sent, failed,
+            retried, dropped, queued and latency_ms
+        """
+        return {
+            str(d.sink): {
+                'sent': d.sent,
+                'failed': d.failed,
+                'retried': d.retried,
+                'dropped': d.dropped,
+                'queued': d.queue.qsize(),
+                'latency_ms': summarize_latencies(d.latencies)
+            }
+            for d in self._dispatchers
+        }
+
+    def print_summary(self):
+        for sink, stats in self.get_stats().items():
+            latency = stats['latency_ms']
+            line = f"   Notify {sink}: {stats['sent']} sent"
+            if stats['failed'] or stats['dropped']:
+                line += f", {stats['failed']} failed, {stats['dropped']} dropped"
+            if latency['count']:
+                line += f" | latency p50/p99/max: {latency['p50']:.1f} / {latency['p99']:.1f} / {latency['max']:.1f} ms"
+            print_colored_message(line, "magenta")
+
+
+def create_notifier(command: Optional[str] = None, socket_path: Optional[str] = None,
+                    webhook: Optional[str] = None, file: Optional[str] = None,
+                    timeout: float = 5.0, **kwargs) -> Optional[Notifier]:
+    """
+    Build a notifier for the given sinks
+
+    Args:
+        command: Command line run per event
+        socket_path: Unix socket to write JSON lines to
+        webhook: URL to POST JSON events to
+        file: File to append JSON lines to
+        timeout: Seconds one delivery may take
+        **kwargs: Passed to Notifier (queue_size, max_attempts, retry_delay)
+
+    Returns:
+        Notifier to pass to InstagramUsernameChecker, or None when no sink is set
+    """
+    sinks = []
+    if command:
+        sinks.append(CommandSink(command, timeout))
+    if socket_path:
+        sinks.append(UnixSocketSink(socket_path, timeout))
+    if webhook:
+        sinks.append(WebhookSink(webhook, timeout))
+    if file:
+        sinks.append(FileSink(file, timeout))
+    return Notifier(sinks, **kwargs) if sinks else None
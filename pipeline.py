@@ -0,0 +1,190 @@
+# By Moh0py dev github.com/Moh0py
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+from checker import InstagramUsernameChecker
+from profile_parser import UNCLEAR_STATUS
+from results import CheckResult, Method, Verdict
+from utils import print_colored_message
+
+
+class TriagePipeline:
+    """
+    Two-stage checking: a cheap, wide first pass and a strict confirmation
+
+    Stage one checks every name with a single method and no fallback. Taken
+    verdicts are final, which covers almost every name in a typical sweep;
+    transient errors are retried in stage one through the deferred retry
+    queue. Available, unclear and still-failing names go to stage two, which
+    checks them again with the other method on its own, smaller worker pool.
+    A name is only reported available when stage two does not contradict
+    stage one.
+    """
+
+    def __init__(self, checker: InstagramUsernameChecker, triage_workers: Optional[int] = None,
+                 confirm_workers: int = 2):
+        """
+        Args:
+            checker: Checker whose session, budgets and result store are used
+            triage_workers: Concurrent first-stage checks (default: checker.max_workers)
+            confirm_workers: Concurrent confirmation checks
+        """
+        self.checker = checker
+        self.triage_workers = triage_workers or checker.max_workers
+        self.confirm_workers = confirm_workers
+        self.stats = {'triaged': 0, 'confirmed': 0, 'overturned': 0, 'unconfirmed': 0}
+
+    def _triage(self, username: str, use_api: bool) -> CheckResult:
+        return self.checker._check_username(username, use_api=use_api, fallback=False)
+
+    def _confirm(self, username: str, use_api: bool) -> CheckResult:
+        # The other method than the first stage, again without fallback
+        return self.checker._check_username(username, use_api=not use_api, fallback=False)
+
+    def needs_confirmation(self, result: CheckResult) -> bool:
+        """Whether a first-stage result must be double-checked"""
+        return result.verdict != Verdict.TAKEN and result.method != Method.VALIDATION
+
+    def combine(self, first: CheckResult, second: CheckResult) -> CheckResult:
+        """
+        Final result from a first-stage result and its confirmation
+
+        Args:
+            first: First-stage result (available, unclear or error)
+            second: Confirmation with the other method
+
+        Returns:
+            Taken when either stage found the account, available when the
+            confirmation agrees (or is the only verdict and not a weak one),
+            otherwise an unconfirmed error
+        """
+        username = first.username
+        if second.verdict == Verdict.TAKEN:
+            if first.verdict == Verdict.AVAILABLE:
+                self.stats['overturned'] += 1
+            return second
+
+        if second.verdict == Verdict.AVAILABLE:
+            first_strong = first.verdict == Verdict.AVAILABLE and first.status != UNCLEAR_STATUS
+            second_strong = second.status != UNCLEAR_STATUS
+            if first_strong or second_strong:
+                self.stats['confirmed'] += 1
+                if first.verdict != Verdict.AVAILABLE:
+                    return second
+                return CheckResult(username, Verdict.AVAILABLE, f"{first.status} + {second.status}", second.method)
+
+        self.stats['unconfirmed'] += 1
+        return CheckResult(username, Verdict.ERROR, f"Unconfirmed: {first.status}; {second.status}", second.method)
+
+    def run(self, usernames: Iterable[str], use_api: bool = True,
+            on_result: Optional[Callable[[CheckResult], Any]] = None) -> Iterator[CheckResult]:
+        """
+        Check usernames through both stages, yielding final results as they settle
+
+        Args:
+            usernames: Any iterable of usernames (consumed lazily)
+            use_api: First stage uses the API (profile confirms); False swaps the methods
+            on_result: Called with every final result before it is yielded
+
+        Yields:
+            Recorded CheckResult records in completion order
+        """
+        checker = self.checker
+        source = iter(usernames)
+        exhausted = False
+        triage_retries = checker.new_retry_queue()
+        confirm_retries = checker.new_retry_queue()
+        backlog: Deque[Tuple[str, CheckResult, int]] = deque()
+        parked: Dict[str, CheckResult] = {}
+
+        def next_wait() -> Optional[float]:
+            waits = [w for w in (triage_retries.wait_time(), confirm_retries.wait_time()) if w is not None]
+            return min(waits) if waits else None
+        triage_pending = {}
+        confirm_pending = {}
+        max_triage = self.triage_workers * 2
+        max_confirm = self.confirm_workers * 2
+
+        triage_pool = ThreadPoolExecutor(max_workers=self.triage_workers)
+        confirm_pool = ThreadPoolExecutor(max_workers=self.confirm_workers)
+
+        def confirm(username: str, first: CheckResult, attempt: int):
+            future = confirm_pool.submit(self._confirm, username, use_api)
+            confirm_pending[future] = (username, first, attempt)
+
+        try:
+            while True:
+                # A growing confirmation backlog holds back the first stage
+                while (not exhausted and len(triage_pending) < max_triage
+                       and len(backlog) < max_confirm * 2):
+                    try:
+                        username = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    triage_pending[triage_pool.submit(self._triage, username, use_api)] = (username, 1)
+
+                while exhausted and len(triage_pending) < max_triage:
+                    due = triage_retries.pop_due()
+                    if due is None:
+                        break
+                    triage_pending[triage_pool.submit(self._triage, due[0], use_api)] = due
+
+                while backlog and len(confirm_pending) < max_confirm:
+                    confirm(*backlog.popleft())
+                while len(confirm_pending) < max_confirm:
+                    due = confirm_retries.pop_due()
+                    if due is None:
+                        break
+                    confirm(due[0], parked[due[0]], due[1])
+
+                if not triage_pending and not confirm_pending:
+                    wait_time = next_wait()
+                    if wait_time is None:
+                        break
+                    with checker._span('retry_backoff', 'sleep'):
+                        time.sleep(wait_time)
+                    continue
+
+                with checker._span('wait_results', 'sleep', pending=len(triage_pending) + len(confirm_pending)):
+                    done, _ = wait(list(triage_pending) + list(confirm_pending),
+                                   timeout=next_wait(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in triage_pending:
+                        username, attempt = triage_pending.pop(future)
+                        first = checker._outcome(future, username)
+                        if triage_retries.should_retry(first, attempt):
+                            triage_retries.push(username, attempt)
+                            continue
+                        self.stats['triaged'] += 1
+                        if self.needs_confirmation(first):
+                            backlog.append((first.username, first, 1))
+                            continue
+                        yield checker._finish(first, on_result)
+                    else:
+                        username, first, attempt = confirm_pending.pop(future)
+                        second = checker._outcome(future, username)
+                        if confirm_retries.should_retry(second, attempt):
+                            parked[username] = first
+                            confirm_retries.push(username, attempt)
+                            continue
+                        yield checker._finish(self.combine(first, second), on_result)
+        finally:
+            for future in list(triage_pending) + list(confirm_pending):
+                future.cancel()
+            triage_pool.shutdown(wait=True)
+            confirm_pool.shutdown(wait=True)
+
+    def requests_per_username(self) -> float:
+        """HTTP requests sent (including failed ones) per final result"""
+        checked = self.checker.results.total()
+        return self.checker.requests_sent() / checked if checked else 0.0
+
+    def print_summary(self):
+        stats = self.stats
+        print_colored_message(
+            f"🔀 Pipeline: {stats['triaged']} triaged, {stats['confirmed']} confirmed, "
+            f"{stats['overturned']} overturned, {stats['unconfirmed']} unconfirmed | "
+            f"{self.requests_per_username():.2f} requests/username", "magenta")
@@ -0,0 +1,106 @@
+# By Moh0py dev github.com/Moh0py
+from typing import Optional, Tuple
+
+NOT_FOUND_INDICATORS = (
+    b"sorry, this page isn't available",
+    b"the link you followed may be broken",
+    b"page not found",
+    b'"graphql":{"user":null}',
+    b"this page isn't available"
+)
+
+# Verdict given when a page shows neither user data nor a "not found" marker
+UNCLEAR_STATUS = "Available (unclear - small page)"
+
+TAKEN_INDICATORS = (
+    b'"id":"',
+    b'"edge_owner_to_timeline_media":{',
+    b'"biography":',
+    b'"profile_pic_url":'
+)
+
+
+class ProfileScanner:
+    """
+    Incremental classifier for profile page HTML
+
+    Chunks are fed as they arrive so the download can stop as soon as the
+    page is decisive: a "not found" marker means available, and the page's
+    own "username":"<name>" entry means taken. Otherwise the verdict is made
+    from the markers seen once the page (or the byte cap) ends, with the same
+    rules as the full-page check.
+    """
+
+    def __init__(self, username: str):
+        """
+        Args:
+            username: Username the profile page belongs to
+        """
+        self.username_marker = f'"username":"{username.lower()}"'.encode('utf-8')
+        self._markers = (self.username_marker,) + TAKEN_INDICATORS + NOT_FOUND_INDICATORS + (
+            b'"user":{"id"', b'"username"', b'"full_name"')
+        self._overlap = max(len(m) for m in self._markers) - 1
+        self._tail = b''
+        self.seen = set()
+        self.bytes_scanned = 0
+
+    def feed(self, chunk: bytes) -> Optional[Tuple[bool, str]]:
+        """
+        Scan the next chunk of the page
+
+        Args:
+            chunk: Decoded (decompressed) response bytes
+
+        Returns:
+            (availability_status, status_message) once decisive, else None
+        """
+        self.bytes_scanned += len(chunk)
+        window = self._tail + chunk.lower()
+        for marker in self._markers:
+            if marker not in self.seen and marker in window:
+                self.seen.add(marker)
+        self._tail = window[-self._overlap:]
+
+        if any(m in self.seen for m in NOT_FOUND_INDICATORS):
+            return True, "Available (not found page)"
+        if self.username_marker in self.seen:
+            return False, "Taken (Profile)"
+        return None
+
+    def finish(self, truncated: bool = False) -> Tuple[Optional[bool], str]:
+        """
+        Verdict from everything scanned so far
+
+        Args:
+            truncated: The page was cut short (byte cap), so the absence of
+                user data proves nothing and no "unclear" availability is given
+
+        Returns:
+            (availability_status, status_message); status None when truncated and undecided
+        """
+        seen = self.seen
+        if any(m in seen for m in NOT_FOUND_INDICATORS):
+            return True, "Available (not found page)"
+        if self.username_marker in seen or any(m in seen for m in TAKEN_INDICATORS):
+            return False, "Taken (Profile)"
+        if b'"user":{"id"' in seen or (b'"username"' in seen and b'"full_name"' in seen):
+            return False, "Taken (JSON user)"
+        if truncated:
+            return None, f"Profile truncated at {self.bytes_scanned} bytes"
+        return True, UNCLEAR_STATUS
+
+
+def classify_profile_content(content: bytes, username: str, truncated: bool = False) -> Tuple[Optional[bool], str]:
+    """
+    Classify a profile page
+
+    Args:
+        content: Page body
+        username: Username the page belongs to
+        truncated: content is only the start of the page (see ProfileScanner.finish)
+
+    Returns:
+        Tuple of (availability_status, status_message)
+    """
+    scanner = ProfileScanner(username)
+    return scanner.feed(content) or scanner.finish(truncated)
@@ -0,0 +1,214 @@
+# By Moh0py dev github.com/Moh0py
+import threading
+import time
+from array import array
+from datetime import datetime
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional
+
+RESULT_FIELDS = ['username', 'available', 'status', 'method', 'timestamp']
+
+
+class Verdict(IntEnum):
+    """Outcome of a username check"""
+    AVAILABLE = 0
+    TAKEN = 1
+    ERROR = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class Method(IntEnum):
+    """How a verdict was reached"""
+    API = 0
+    PROFILE = 1
+    VALIDATION = 2
+    TIMEOUT = 3
+    ERROR = 4
+
+    @property
+    def label(self) -> str:
+        return _METHOD_LABELS[self]
+
+    @classmethod
+    def from_label(cls, label: str) -> 'Method':
+        return _METHODS_BY_LABEL[label]
+
+
+_METHOD_LABELS = {
+    Method.API: 'API',
+    Method.PROFILE: 'Profile',
+    Method.VALIDATION: 'validation',
+    Method.TIMEOUT: 'timeout',
+    Method.ERROR: 'error'
+}
+_METHODS_BY_LABEL = {label: method for method, label in _METHOD_LABELS.items()}
+
+
+class CheckResult(dict):
+    """
+    Result of one username check
+
+    A real dict holding the historical five keys (username, available,
+    status, method, timestamp), so callers can json.dump it, write it with
+    csv.DictWriter or compare it to a dict as before. Typed verdict,
+    method and checked_at attributes sit alongside the keys. ResultStore
+    keeps results column-wise and only builds these records when they are
+    read.
+    """
+
+    __slots__ = ('verdict', 'method', 'checked_at')
+
+    def __init__(self, username: str, verdict: Verdict, status: str, method: Method,
+                 checked_at: Optional[float] = None):
+        """
+        Args:
+            username: Checked username
+            verdict: Availability verdict
+            status: Human readable status message
+            method: Method that produced the verdict
+            checked_at: Epoch timestamp (defaults to now)
+        """
+        checked_at = time.time() if checked_at is None else checked_at
+        super().__init__(
+            username=username,
+            available=verdict == Verdict.AVAILABLE,
+            status=status,
+            method=method.label,
+            timestamp=datetime.fromtimestamp(checked_at).isoformat()
+        )
+        self.verdict = verdict
+        self.method = method
+        self.checked_at = checked_at
+
+    @property
+    def username(self) -> str:
+        return self['username']
+
+    @property
+    def status(self) -> str:
+        return self['status']
+
+    @property
+    def available(self) -> bool:
+        return self.verdict == Verdict.AVAILABLE
+
+    @property
+    def timestamp(self) -> str:
+        return self['timestamp']
+
+    def __repr__(self) -> str:
+        return (f"CheckResult({self.username!r}, {self.verdict.name}, {self.status!r}, "
+                f"{self.method.name}, {self.checked_at})")
+
+    def to_dict(self) -> Dict:
+        """Return the result as a plain five-key dictionary"""
+        return dict(self)
+
+
+class ResultStore:
+    """
+    Thread-safe, array-backed storage for check results
+
+    Results are kept column-wise (usernames plus byte/int/float arrays, with
+    status messages interned in a lookup table), and per-verdict counters are
+    maintained on append so statistics are O(1).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._usernames: List[str] = []
+        self._verdicts = bytearray()
+        self._methods = bytearray()
+        self._statuses = array('I')
+        self._checked_at = array('d')
+        self._status_table: List[str] = []
+        self._status_index: Dict[str, int] = {}
+        self._counts = [0, 0, 0]
+
+    def add(self, result: CheckResult) -> CheckResult:
+        """
+        Record a result
+
+        Args:
+            result: Result to store
+
+        Returns:
+            The same result, for chaining
+        """
+        with self._lock:
+            status_id = self._status_index.get(result.status)
+            if status_id is None:
+                status_id = len(self._status_table)
+                self._status_table.append(result.status)
+                self._status_index[result.status] = status_id
+
+            self._usernames.append(result.username)
+            self._verdicts.append(result.verdict)
+            self._methods.append(result.method)
+            self._statuses.append(status_id)
+            self._checked_at.append(result.checked_at)
+            self._counts[result.verdict] += 1
+        return result
+
+    def tally(self, result: CheckResult) -> CheckResult:
+        """Count a result without storing it (long-lived watch and serve processes)"""
+        with self._lock:
+            self._counts[result.verdict] += 1
+        return result
+
+    def _materialize(self, index: int) -> CheckResult:
+        return CheckResult(
+            self._usernames[index],
+            Verdict(self._verdicts[index]),
+            self._status_table[self._statuses[index]],
+            Method(self._methods[index]),
+            self._checked_at[index]
+        )
+
+    def __len__(self) -> int:
+        return len(self._usernames)
+
+    def __getitem__(self, index: int) -> CheckResult:
+        with self._lock:
+            return self._materialize(index)
+
+    def __iter__(self) -> Iterator[CheckResult]:
+        return iter(self.snapshot())
+
+    def snapshot(self) -> List[CheckResult]:
+        """All results in insertion order"""
+        with self._lock:
+            return [self._materialize(i) for i in range(len(self._usernames))]
+
+    def by_verdict(self, verdict: Verdict) -> List[CheckResult]:
+        """Results with the given verdict, in insertion order"""
+        with self._lock:
+            code = int(verdict)
+            return [self._materialize(i) for i, v in enumerate(self._verdicts) if v == code]
+
+    def total(self) -> int:
+        """Results counted so far, stored or only tallied"""
+        return sum(self._counts)
+
+    def count(self, verdict: Verdict) -> int:
+        return self._counts[verdict]
+
+    def counts(self) -> Dict[str, int]:
+        """Per-verdict counters, read atomically"""
+        with self._lock:
+            available, taken, errors = self._counts
+        return {'available': available, 'unavailable': taken, 'errors': errors}
+
+    def clear(self):
+        with self._lock:
+            self._usernames.clear()
+            del self._verdicts[:]
+            del self._methods[:]
+            del self._statuses[:]
+            del self._checked_at[:]
+            self._status_table.clear()
+            self._status_index.clear()
+            self._counts = [0, 0, 0]
@@ -0,0 +1,200 @@
+# By Moh0py dev github.com/Moh0py
+import csv
+import glob
+import heapq
+import itertools
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from results import CheckResult, Verdict
+
+PRIORITY_WEIGHT = 100.0
+UNKNOWN_WEIGHT = 10.0
+ERROR_WEIGHT = 8.0
+STALE_WEIGHT = 5.0
+
+
+class VerdictHistory:
+    """Latest known verdict and check time per username"""
+
+    def __init__(self):
+        self.entries: Dict[str, Tuple[Verdict, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, username: str) -> Optional[Tuple[Verdict, float]]:
+        """(verdict, epoch checked_at) of the newest known result, or None"""
+        return self.entries.get(username.strip().lower())
+
+    def record(self, username: str, verdict: Verdict, checked_at: float):
+        """Remember a verdict unless a newer one is already known"""
+        username = username.strip().lower()
+        known = self.entries.get(username)
+        if known is None or known[1] <= checked_at:
+            self.entries[username] = (verdict, checked_at)
+
+    def update(self, result: CheckResult):
+        """Record a fresh check result (usable as an on_result callback)"""
+        self.record(result.username, result.verdict, result.checked_at)
+
+    def load_csv(self, path: str) -> int:
+        """
+        Load a results CSV written by save_results
+
+        Returns:
+            Number of rows loaded
+        """
+        loaded = 0
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                try:
+                    checked_at = datetime.fromisoformat(row['timestamp']).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if row.get('available') == 'True':
+                    verdict = Verdict.AVAILABLE
+                elif (row.get('status') or '').startswith('Taken'):
+                    verdict = Verdict.TAKEN
+                else:
+                    verdict = Verdict.ERROR
+                self.record(row.get('username') or '', verdict, checked_at)
+                loaded += 1
+        return loaded
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> 'VerdictHistory':
+        """
+        Build a history from results CSV files or directories holding them
+
+        Args:
+            paths: CSV files, or directories searched for *_results.csv
+        """
+        history = cls()
+        for path in paths:
+            files = sorted(glob.glob(os.path.join(path, '*_results.csv'))) if os.path.isdir(path) else [path]
+            for file in files:
+                history.load_csv(file)
+        return history
+
+
+class ValueScorer:
+    """
+    Default scoring function: how much checking a username is worth now
+
+    A name scores PRIORITY_WEIGHT when it is on the priority list (earlier
+    entries slightly more), UNKNOWN_WEIGHT when no verdict is cached and
+    ERROR_WEIGHT when its last check errored. Cached verdicts add up to
+    STALE_WEIGHT as they age towards `stale_after`, so the oldest verdicts
+    are refreshed first and fresh ones last.
+    """
+
+    def __init__(self, history: Optional[VerdictHistory] = None, priority: Sequence[str] = (),
+                 stale_after: float = 86400.0, now: Optional[float] = None):
+        """
+        Args:
+            history: Cached verdicts (none means every name is unknown)
+            priority: Usernames that matter most, most important first
+            stale_after: Seconds after which a cached verdict counts as fully stale
+            now: Reference time for ages (default: time of each call)
+        """
+        self.history = history or VerdictHistory()
+        self.stale_after = stale_after
+        self.now = now
+        self._priority: Dict[str, int] = {}
+        for name in priority:
+            name = name.strip().lower()
+            if name:
+                self._priority.setdefault(name, len(self._priority))
+        self._priority_count = max(1, len(self._priority))
+
+    def __call__(self, username: str) -> float:
+        score = 0.0
+        rank = self._priority.get(username)
+        if rank is not None:
+            score += PRIORITY_WEIGHT + (self._priority_count - rank) / self._priority_count
+
+        known = self.history.get(username)
+        if known is None:
+            return score + UNKNOWN_WEIGHT
+        verdict, checked_at = known
+        if verdict == Verdict.ERROR:
+            score += ERROR_WEIGHT
+        age = (self.now or time.time()) - checked_at
+        return score + STALE_WEIGHT * min(1.0, max(0.0, age) / self.stale_after)
+
+
+class PriorityScheduler:
+    """
+    Heap-backed check queue that hands out the most valuable username first
+
+    Iterating the scheduler pops names in descending score order, so it can
+    be passed to iter_check or the pipeline wherever a list of names was
+    used. Those consume their input lazily, so names pushed during a run
+    still jump ahead of lower-scored ones. Iteration ends when the queue is
+    empty, after `limit` names, or as soon as `should_stop()` returns True.
+    """
+
+    def __init__(self, score: Optional[Callable[[str], float]] = None, limit: Optional[int] = None,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        """
+        Args:
+            score: Value of checking a username, higher first (default: ValueScorer())
+            limit: Most names handed out (a check budget)
+            should_stop: Stop condition polled before each name is handed out
+        """
+        self.score = score or ValueScorer()
+        self.limit = limit
+        self.should_stop = should_stop
+        self.handed_out = 0
+        self._heap: List[Tuple[float, int, str]] = []
+        self._queued = set()
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, username: str, score: Optional[float] = None):
+        """Queue a username (names already queued are ignored)"""
+        username = username.strip().lower()
+        if not username or username in self._queued:
+            return
+        self._queued.add(username)
+        value = self.score(username) if score is None else score
+        # Ties keep insertion order
+        heapq.heappush(self._heap, (-value, next(self._order), username))
+
+    def extend(self, usernames: Iterable[str]):
+        for username in usernames:
+            self.push(username)
+
+    def pop(self) -> Optional[str]:
+        """Most valuable queued username, or None when the queue is empty"""
+        if not self._heap:
+            return None
+        _, _, username = heapq.heappop(self._heap)
+        self._queued.discard(username)
+        return username
+
+    def exhausted(self) -> bool:
+        """Whether the budget or stop condition ends the run"""
+        if self.limit is not None and self.handed_out >= self.limit:
+            return True
+        return self.should_stop is not None and self.should_stop()
+
+    def expected(self) -> int:
+        """Names that will be handed out if the stop condition never fires"""
+        remaining = len(self._heap)
+        if self.limit is not None:
+            remaining = min(remaining, max(0, self.limit - self.handed_out))
+        return remaining
+
+    def __iter__(self) -> Iterator[str]:
+        while not self.exhausted():
+            username = self.pop()
+            if username is None:
+                return
+            self.handed_out += 1
+            yield username
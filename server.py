@@ -0,0 +1,271 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from checker import InstagramUsernameChecker, get_verdict
+from utils import print_colored_message
+
+
+class CheckService:
+    """
+    Long-lived checking service shared by every API client
+
+    Features:
+    - One warm checker (session, connections, CSRF token) for all requests
+    - Identical concurrent requests for a username are merged into one check
+    - Recent verdicts are answered from an in-memory cache
+    - In-flight checks and cached verdicts are keyed by (username, use_api)
+    - All clients share the checker's rate budget
+    - Constant memory: results are counted, not stored (see retain_recent)
+    """
+
+    def __init__(self, checker: InstagramUsernameChecker, cache_ttl: float = 300.0):
+        """
+        Initialize the checking service
+
+        Args:
+            checker: Checker instance reused for every request
+            cache_ttl: Seconds a definitive verdict is served from cache (0 disables)
+        """
+        self.checker = checker
+        self.cache_ttl = cache_ttl
+        # The daemon runs indefinitely: keep counters, not every result
+        checker.retain_recent()
+        self.executor = ThreadPoolExecutor(max_workers=checker.max_workers)
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, bool], Future] = {}
+        # Insertion order is expiry order, since every entry lives cache_ttl seconds
+        self._cache: 'OrderedDict[Tuple[str, bool], tuple]' = OrderedDict()
+        self.cache_hits = 0
+        self.merged_requests = 0
+
+    def submit(self, username: str, use_api: bool = True) -> Future:
+        """
+        Get a future for a username check, reusing cached or in-flight work
+
+        Args:
+            username: Username to check
+            use_api: Whether to use API method first
+
+        Returns:
+            Future resolving to the result dictionary
+        """
+        # A profile-only request must not be answered with an API verdict
+        key = (username.strip().lower(), bool(use_api))
+
+        with self._lock:
+            self._evict_expired()
+            cached = self._cache.get(key)
+            if cached:
+                self.cache_hits += 1
+                future = Future()
+                future.set_result(cached[1])
+                return future
+
+            future = self._inflight.get(key)
+            if future is not None:
+                self.merged_requests += 1
+                return future
+
+            future = self.checker.submit_check(self.executor, key[0], use_api)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future
+
+    def _finish(self, key: Tuple[str, bool], future: Future):
+        """Drop a finished check from the in-flight table and cache its verdict"""
+        with self._lock:
+            self._inflight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            result = future.result()
+            if self.cache_ttl > 0 and get_verdict(result) != 'error':
+                self._cache.pop(key, None)
+                self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+            self._evict_expired()
+
+    def _evict_expired(self):
+        """Drop cached verdicts whose TTL has passed (caller holds the lock)"""
+        now = time.monotonic()
+        while self._cache:
+            key, (expires_at, _) = next(iter(self._cache.items()))
+            if expires_at > now:
+                break
+            del self._cache[key]
+
+    def check_many(self, usernames: List[str], use_api: bool = True) -> Iterator[Dict]:
+        """
+        Check usernames and yield results as soon as each one completes
+
+        Args:
+            usernames: Usernames to check
+            use_api: Whether to use API method first
+
+        Yields:
+            One result dictionary per requested username (repeats included), in completion order
+        """
+        # Repeated names share a merged or cached future, so each future
+        # remembers every request entry it answers
+        requested: Dict[Future, List[str]] = {}
+        for username in usernames:
+            requested.setdefault(self.submit(username, use_api), []).append(username)
+        for future in as_completed(requested):
+            for username in requested[future]:
+                try:
+                    yield future.result()
+                except Exception as e:
+                    yield {
+                        'username': username,
+                        'available': False,
+                        'status': f'Thread error: {str(e)}',
+                        'method': 'error',
+                        'timestamp': None
+                    }
+
+    def get_stats(self) -> Dict:
+        """Checker statistics plus service-level counters"""
+        stats = self.checker.get_stats()
+        stats['latency_seconds'] = self.checker.get_latency_stats()
+        stats['traffic'] = self.checker.get_traffic_stats()
+        if self.checker.notifier is not None:
+            stats['notifications'] = self.checker.notifier.get_stats()
+        with self._lock:
+            self._evict_expired()
+            stats.update({
+                'in_flight': len(self._inflight),
+                'cached': len(self._cache),
+                'cache_hits': self.cache_hits,
+                'merged_requests': self.merged_requests
+            })
+        return stats
+
+    def shutdown(self):
+        """Stop accepting work and wait for running checks"""
+        self.executor.shutdown(wait=True)
+
+
+class CheckRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON API handler
+
+    Endpoints:
+    - POST /check  {"usernames": [...], "use_api": true} -> NDJSON stream of results
+    - GET /health  -> {"status": "ok"}
+    - GET /stats   -> service statistics
+    """
+
+    service: CheckService = None
+
+    def _send_json(self, status: int, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/stats':
+            self._send_json(200, self.service.get_stats())
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path != '/check':
+            self._send_json(404, {'error': 'not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            usernames = payload.get('usernames') or []
+            if payload.get('username'):
+                usernames = [payload['username']] + list(usernames)
+            use_api = bool(payload.get('use_api', True))
+        except (ValueError, AttributeError) as e:
+            self._send_json(400, {'error': f'invalid request: {e}'})
+            return
+
+        if not isinstance(usernames, list) or not all(isinstance(u, str) for u in usernames):
+            self._send_json(400, {'error': 'usernames must be a list of strings'})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        try:
+            for result in self.service.check_many(usernames, use_api):
+                self.wfile.write(json.dumps(dict(result), ensure_ascii=False).encode('utf-8') + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.service.checker.logger.debug("Client disconnected before all results were sent")
+
+    def log_message(self, format, *args):
+        self.service.checker.logger.debug("API: " + format % args)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server bound to a Unix domain socket"""
+    daemon_threads = True
+
+
+def _is_socket(path: str) -> bool:
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
+def serve(checker: InstagramUsernameChecker, host: str = "127.0.0.1", port: int = 8765,
+          socket_path: Optional[str] = None, cache_ttl: float = 300.0):
+    """
+    Run the JSON API until interrupted
+
+    Args:
+        checker: Checker instance kept warm for the lifetime of the server
+        host: Interface to bind for TCP mode
+        port: Port to bind for TCP mode
+        socket_path: Unix socket path; overrides host/port when set
+        cache_ttl: Seconds a verdict is served from cache
+    """
+    service = CheckService(checker, cache_ttl=cache_ttl)
+    handler = type('BoundCheckRequestHandler', (CheckRequestHandler,), {'service': service})
+
+    if socket_path:
+        if os.path.exists(socket_path):
+            if not _is_socket(socket_path):
+                raise FileExistsError(f"{socket_path} exists and is not a socket")
+            # A stale socket left by a previous server
+            os.unlink(socket_path)
+        httpd = ThreadingUnixHTTPServer(socket_path, handler)
+        address = f"unix:{socket_path}"
+    else:
+        httpd = ThreadingHTTPServer((host, port), handler)
+        address = f"http://{host}:{port}"
+
+    print_colored_message(f"🌐 Serving checks on {address} (POST /check, GET /stats)", "green")
+    checker.logger.info(f"API server listening on {address}")
+
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print_colored_message("\n⚠️  Server stopped by user", "yellow")
+    finally:
+        httpd.server_close()
+        service.shutdown()
+        if socket_path and _is_socket(socket_path):
+            os.unlink(socket_path)
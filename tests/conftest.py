@@ -0,0 +1,14 @@
+# By Moh0py dev github.com/Moh0py
+import os
+import sys
+
+import pytest
+
+# The checker's modules live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cwd(tmp_path, monkeypatch):
+    """Run every test in a scratch directory so logs and result files stay out of the repo"""
+    monkeypatch.chdir(tmp_path)
@@ -0,0 +1,70 @@
+# By Moh0py dev github.com/Moh0py
+import pytest
+
+from autotune import AutoTuner, load_profile, save_profile
+
+
+def scripted(tuner, results, requests_per_check=3):
+    """Replace run_trial with canned (checks_per_minute, throttle_rate) results"""
+    calls = []
+    outcomes = iter(results)
+
+    def run_trial(workers, rate, checks):
+        calls.append((workers, rate, checks))
+        checks_per_minute, throttle_rate = next(outcomes)
+        tuner.requests_used += 1 + checks * requests_per_check
+        trial = {'workers': workers, 'rate': rate, 'checks_per_minute': checks_per_minute,
+                 'throttle_rate': throttle_rate, 'round_trip': 1.0}
+        tuner.trials.append(trial)
+        return trial
+
+    tuner.run_trial = run_trial
+    return calls
+
+
+def test_rate_doubles_until_throttling_and_keeps_the_last_good_trial():
+    tuner = AutoTuner(base_url='http://127.0.0.1:1', max_requests=10_000, start_rate=1.0, safety_margin=0.5)
+    calls = scripted(tuner, [(60, 0.0), (120, 0.0), (240, 0.01), (300, 0.2)])
+    profile = tuner.tune()
+    assert [rate for _, rate, _ in calls] == [1.0, 2.0, 4.0, 8.0]
+    assert profile['rate'] == 2.0 and profile['measured_checks_per_minute'] == 240
+    assert profile['target'] == 'local'
+
+
+def test_stops_when_throughput_stops_improving():
+    tuner = AutoTuner(max_requests=10_000, start_rate=1.0)
+    calls = scripted(tuner, [(60, 0.0), (120, 0.0), (124, 0.0)])
+    assert tuner.tune()['measured_checks_per_minute'] == 120
+    assert len(calls) == 3
+
+
+def test_stops_at_the_worker_limit():
+    tuner = AutoTuner(max_requests=10_000, start_rate=8.0, max_workers=4)
+    calls = scripted(tuner, [(60, 0.0)])
+    assert tuner.tune()['workers'] == 4
+    assert calls == [(4, 8.0, 30)]
+
+
+def test_request_cap_is_never_exceeded():
+    for cap in (16, 50, 97, 300):
+        tuner = AutoTuner(max_requests=cap, start_rate=1.0, trial_checks=30, max_workers=1000)
+        scripted(tuner, [(60 * 2 ** i, 0.0) for i in range(50)])
+        try:
+            tuner.tune()
+        except RuntimeError:
+            pass
+        assert tuner.requests_used <= cap
+
+
+def test_no_trial_under_the_threshold_is_an_error():
+    tuner = AutoTuner(max_requests=10_000)
+    scripted(tuner, [(60, 0.5)])
+    with pytest.raises(RuntimeError):
+        tuner.tune()
+
+
+def test_profile_round_trip(tmp_path):
+    path = str(tmp_path / 'nested' / 'profile.json')
+    assert load_profile(path) == {}
+    save_profile({'workers': 3, 'rate': 1.5}, path)
+    assert load_profile(path) == {'workers': 3, 'rate': 1.5}
@@ -0,0 +1,77 @@
+# By Moh0py dev github.com/Moh0py
+import os
+
+import pytest
+
+import benchmarks
+
+# Tiers above this size are left to `python benchmarks.py`; they take too long for a test run
+GATE_MAX_SIZE = 100_000
+
+
+def test_compare_flags_throughput_drop_and_memory_growth():
+    baseline = {'a[10]': {'items_per_second': 1000.0, 'peak_memory_bytes': 1_000_000}}
+
+    assert benchmarks.compare({'a[10]': {'items_per_second': 800.0, 'peak_memory_bytes': 1_000_000}},
+                              baseline, 0.25) == []
+
+    regressions = benchmarks.compare({'a[10]': {'items_per_second': 700.0, 'peak_memory_bytes': 1_300_000}},
+                                     baseline, 0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith('a[10]: 700/s')
+    assert 'peak memory' in regressions[1]
+
+
+def test_compare_skips_unknown_keys_and_small_memory_noise():
+    baseline = {'a[10]': {'items_per_second': 1000.0, 'peak_memory_bytes': 1000}}
+    results = {
+        'a[10]': {'items_per_second': 1000.0, 'peak_memory_bytes': 40_000},
+        'b[10]': {'items_per_second': 1.0, 'peak_memory_bytes': None}
+    }
+    assert benchmarks.compare(results, baseline, 0.25) == []
+
+
+def test_parse_key():
+    assert benchmarks.parse_key('validate_username[100000]') == ('validate_username', 100_000)
+
+
+def test_no_regression_against_baseline():
+    """
+    Regression gate: re-measure every stored tier up to GATE_MAX_SIZE
+
+    Uses $BENCH_BASELINE (default benchmarks_baseline.json) and $BENCH_TOLERANCE
+    (default 0.25). Skipped when no baseline was recorded on this machine.
+    """
+    path = os.environ.get('BENCH_BASELINE') or benchmarks.BASELINE_PATH
+    stored = benchmarks.load_baseline(path)
+    if stored is None:
+        pytest.skip(f"No benchmark baseline at {path}; record one with: python benchmarks.py --save-baseline")
+    if not benchmarks.same_machine(stored):
+        pytest.skip("Benchmark baseline was recorded on another machine or Python; "
+                    "re-record it with: python benchmarks.py --save-baseline")
+
+    def measure(key):
+        name, size = benchmarks.parse_key(key)
+        memory = stored['results'][key].get('peak_memory_bytes') is not None
+        return benchmarks.measure(name, size, repeat=3, memory=memory)
+
+    keys = []
+    for key in stored.get('results', {}):
+        name, size = benchmarks.parse_key(key)
+        if name in benchmarks.BENCHMARKS and size <= GATE_MAX_SIZE:
+            keys.append(key)
+    if not keys:
+        pytest.skip(f"Benchmark baseline has no tiers up to {GATE_MAX_SIZE:,} names")
+    results = {key: measure(key) for key in keys}
+
+    tolerance = float(os.environ.get('BENCH_TOLERANCE', 0.25))
+    for _ in range(2):
+        flagged = [key for key in results if benchmarks.compare({key: results[key]}, stored['results'], tolerance)]
+        # A busy machine can slow a single run down; only a repeatable slowdown fails the gate
+        for key in flagged:
+            again = measure(key)
+            if again['items_per_second'] > results[key]['items_per_second']:
+                results[key] = again
+
+    regressions = benchmarks.compare(results, stored['results'], tolerance)
+    assert not regressions, "Benchmark regressions:\n" + "\n".join(regressions)
@@ -0,0 +1,199 @@
+# By Moh0py dev github.com/Moh0py
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from checker import InstagramUsernameChecker, classify_api_body
+from mock_server import MockInstagramServer
+from results import CheckResult, Method, Verdict
+
+
+class TrickleHandler(BaseHTTPRequestHandler):
+    """Profile page that sends a small chunk every 50 ms and never decides"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(1024 * 200))
+        self.end_headers()
+        try:
+            for _ in range(200):
+                self.wfile.write(b'x' * 1024)
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def trickle_url():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), TrickleHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_slow_profile_download_stops_at_the_deadline(trickle_url):
+    checker = InstagramUsernameChecker(base_url=trickle_url, min_delay=0, max_delay=0, deadline=0.5,
+                                       read_timeout=5.0)
+    checker.echo = False
+    started = time.monotonic()
+    result = checker._check_username('someone', use_api=False)
+    assert time.monotonic() - started < 1.5
+    assert result.verdict == Verdict.ERROR
+    assert result.method == Method.TIMEOUT
+    assert result.status == "Timed out after 0.5s deadline"
+
+
+@pytest.mark.parametrize('body, expected', [
+    (b'{"available": true}', (True, "Available (API ✅)")),
+    (b'{"available": false}', (False, "Taken (API ❌)")),
+    (b'{"errors": {"username": ["taken"]}}', (False, "Taken (API error ❌)")),
+    (b'{"status": "ok"}', (None, "Unclear API response: {'status': 'ok'}")),
+    (b'[1]', (None, "Unclear API response: [1]")),
+    (b'<html>', (None, "JSON decode failed: <html>")),
+])
+def test_classify_api_body(body, expected):
+    assert classify_api_body(body) == expected
+
+
+class FakePool:
+    def __init__(self, broken=False):
+        self.broken = broken
+        self.submitted = []
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        if self.broken:
+            raise BrokenProcessPool("worker died")
+        self.submitted.append(len(args[0]))
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_only_bodies_above_the_threshold_are_offloaded():
+    checker = InstagramUsernameChecker(parse_processes=2, parse_offload_bytes=100)
+    checker._parse_pool = pool = FakePool()
+    small = b'{"available": true}'
+    large = b'{"available": false, "pad": "' + b'x' * 200 + b'"}'
+    assert checker._parse(classify_api_body, small, budget=checker.new_budget()) == (True, "Available (API ✅)")
+    assert checker._parse(classify_api_body, large, budget=checker.new_budget()) == (False, "Taken (API ❌)")
+    assert pool.submitted == [len(large)]
+
+
+def test_parse_pool_classifies_in_a_worker_process():
+    checker = InstagramUsernameChecker(parse_processes=1, parse_offload_bytes=1)
+    try:
+        assert checker._parse(classify_api_body, b'{"available": true}', budget=checker.new_budget()) == (
+            True, "Available (API ✅)")
+        assert checker._parse_pool is not None
+    finally:
+        checker.close()
+
+
+def test_broken_parse_pool_is_disabled_after_one_warning(caplog):
+    checker = InstagramUsernameChecker(parse_processes=2, parse_offload_bytes=1)
+    checker._parse_pool = pool = FakePool(broken=True)
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            assert checker._parse(classify_api_body, b'{"available": false}', budget=checker.new_budget()) == (
+                False, "Taken (API ❌)")
+    assert pool.shut_down
+    assert checker.parse_processes == 0 and checker._parse_pool is None
+    assert [r.getMessage() for r in caplog.records if 'Parse pool' in r.getMessage()] == [
+        "Parse pool failed, parsing inline from now on: worker died"]
+
+
+def test_request_counters_are_read_under_the_metrics_lock():
+    with MockInstagramServer(taken_ratio=0.5, profile_size=10_000, latency=0.0) as mock:
+        checker = InstagramUsernameChecker(base_url=mock.base_url, min_delay=0, max_delay=0)
+        checker.echo = False
+        for username in ('alpha1', 'beta2'):
+            checker.check_single_username(username)
+        served = mock.stats()['requests']
+    counts = checker.get_http_status_counts()
+    assert checker.requests_sent() == sum(counts.values()) == served
+    counts['network_error'] += 5
+    assert checker.requests_sent() == served
+
+
+@pytest.fixture
+def instant_checker(monkeypatch):
+    checker = InstagramUsernameChecker(max_workers=2)
+    checker.echo = False
+    monkeypatch.setattr(checker, '_check_username', lambda username, use_api=True: CheckResult(
+        username, Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE))
+    return checker
+
+
+def slow_source(first, delay):
+    yield first
+    time.sleep(delay)
+    yield 'late'
+
+
+def test_iter_check_yields_finished_results_while_the_source_blocks(instant_checker):
+    started = time.monotonic()
+    results = instant_checker.iter_check(slow_source('early', 0.5))
+    assert next(results).username == 'early'
+    assert time.monotonic() - started < 0.3
+    assert [r.username for r in results] == ['late']
+
+
+def test_iter_check_calls_on_result_for_every_name(instant_checker):
+    seen = []
+    results = list(instant_checker.iter_check(iter(['a1', 'b2', 'c3']), on_result=lambda r: seen.append(r.username)))
+    assert sorted(seen) == sorted(r.username for r in results) == ['a1', 'b2', 'c3']
+    assert instant_checker.get_stats()['total_checked'] == 3
+
+
+async def async_source(names, delay):
+    for name in names:
+        yield name
+        await asyncio.sleep(delay)
+
+
+def test_aiter_check_yields_finished_results_while_the_async_source_waits(instant_checker):
+    async def first_result():
+        started = time.monotonic()
+        results = instant_checker.aiter_check(async_source(['early', 'late'], 0.5))
+        first = await results.__anext__()
+        elapsed = time.monotonic() - started
+        rest = [r.username async for r in results]
+        return first.username, elapsed, rest
+
+    first, elapsed, rest = asyncio.run(first_result())
+    assert first == 'early' and elapsed < 0.3
+    assert rest == ['late']
+
+
+@pytest.mark.parametrize('source', [['a1', 'b2', 'c3'], 'async'])
+def test_aiter_check_awaits_coroutine_and_plain_callbacks(instant_checker, source):
+    awaited, called = [], []
+
+    async def on_result(result):
+        await asyncio.sleep(0)
+        awaited.append(result.username)
+
+    async def collect(callback):
+        names = async_source(['a1', 'b2', 'c3'], 0) if source == 'async' else source
+        return [r.username async for r in instant_checker.aiter_check(names, on_result=callback)]
+
+    assert sorted(asyncio.run(collect(on_result))) == sorted(awaited) == ['a1', 'b2', 'c3']
+    assert sorted(asyncio.run(collect(lambda r: called.append(r.username)))) == sorted(called) == ['a1', 'b2', 'c3']
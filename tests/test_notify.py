@@ -0,0 +1,91 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import threading
+import time
+
+from notify import NotificationSink, Notifier, create_notifier
+from results import CheckResult, Method, Verdict
+
+
+def available(username):
+    return CheckResult(username, Verdict.AVAILABLE, 'Available (API ✅)', Method.API)
+
+
+class FlakySink(NotificationSink):
+    """Fails the first `failures` deliveries, then records every event"""
+
+    kind = 'flaky'
+
+    def __init__(self, failures=0, block=None):
+        super().__init__('test')
+        self.failures = failures
+        self.block = block
+        self.delivered = []
+
+    def send(self, event, line):
+        if self.block is not None:
+            self.block.wait(5)
+        if self.failures:
+            self.failures -= 1
+            raise OSError("sink down")
+        self.delivered.append(json.loads(line))
+
+
+def test_file_sink_receives_one_json_line_per_event(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    notifier = create_notifier(file=str(path))
+    notifier.notify(available('alpha1'))
+    notifier.notify(available('beta2'))
+    notifier.close()
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [e['username'] for e in events] == ['alpha1', 'beta2']
+    assert events[0]['event'] == 'available' and events[0]['method'] == 'API'
+    stats = notifier.get_stats()[f'file:{path}']
+    assert stats['sent'] == 2 and stats['latency_ms']['count'] == 2
+
+
+def test_failed_deliveries_are_retried_with_backoff():
+    sink = FlakySink(failures=2)
+    notifier = Notifier([sink], max_attempts=3, retry_delay=0.01)
+    notifier.notify(available('alpha1'))
+    notifier.close()
+    assert [e['username'] for e in sink.delivered] == ['alpha1']
+    stats = notifier.get_stats()['flaky:test']
+    assert (stats['sent'], stats['retried'], stats['failed']) == (1, 2, 0)
+
+
+def test_delivery_gives_up_after_max_attempts():
+    sink = FlakySink(failures=5)
+    notifier = Notifier([sink], max_attempts=2, retry_delay=0.01)
+    notifier.notify(available('alpha1'))
+    notifier.close()
+    stats = notifier.get_stats()['flaky:test']
+    assert sink.delivered == [] and stats['failed'] == 1 and stats['retried'] == 1
+
+
+def test_a_stalled_sink_drops_events_instead_of_blocking_the_checker():
+    release = threading.Event()
+    stalled, healthy = FlakySink(block=release), FlakySink()
+    healthy.kind = 'healthy'
+    notifier = Notifier([stalled, healthy], queue_size=5)
+    for i in range(10):
+        started = time.monotonic()
+        notifier.notify(available(f'name{i}'))
+        assert time.monotonic() - started < 0.1
+        time.sleep(0.01)
+
+    release.set()
+    notifier.close()
+    stats = notifier.get_stats()
+    assert len(healthy.delivered) == stats['healthy:test']['sent'] == 10
+    # One event was taken off the queue before the sink stalled, five more fit in the queue
+    assert stats['flaky:test']['sent'] == 6 and stats['flaky:test']['dropped'] == 4
+
+
+def test_events_after_close_are_ignored():
+    sink = FlakySink()
+    notifier = Notifier([sink])
+    notifier.close()
+    notifier.notify(available('late1'))
+    assert sink.delivered == []
+    assert create_notifier() is None
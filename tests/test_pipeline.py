@@ -0,0 +1,69 @@
+# By Moh0py dev github.com/Moh0py
+import pytest
+
+from checker import InstagramUsernameChecker
+from pipeline import TriagePipeline
+from profile_parser import UNCLEAR_STATUS
+from results import CheckResult, Method, Verdict
+
+API_AVAILABLE = CheckResult('name1', Verdict.AVAILABLE, 'Available (API ✅)', Method.API)
+API_ERROR = CheckResult('name1', Verdict.ERROR, 'HTTP 429 (API)', Method.API)
+PROFILE_AVAILABLE = CheckResult('name1', Verdict.AVAILABLE, 'Available (Profile 404)', Method.PROFILE)
+PROFILE_UNCLEAR = CheckResult('name1', Verdict.AVAILABLE, UNCLEAR_STATUS, Method.PROFILE)
+PROFILE_TAKEN = CheckResult('name1', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE)
+PROFILE_ERROR = CheckResult('name1', Verdict.ERROR, 'Network error', Method.PROFILE)
+
+
+@pytest.fixture
+def pipeline():
+    return TriagePipeline(InstagramUsernameChecker())
+
+
+def test_taken_confirmation_overturns_an_available_first_stage(pipeline):
+    assert pipeline.combine(API_AVAILABLE, PROFILE_TAKEN) is PROFILE_TAKEN
+    assert pipeline.stats['overturned'] == 1
+
+
+def test_agreeing_stages_are_confirmed_with_both_statuses(pipeline):
+    result = pipeline.combine(API_AVAILABLE, PROFILE_AVAILABLE)
+    assert result.verdict == Verdict.AVAILABLE
+    assert result.status == 'Available (API ✅) + Available (Profile 404)'
+    assert pipeline.combine(API_AVAILABLE, PROFILE_UNCLEAR).verdict == Verdict.AVAILABLE
+    assert pipeline.stats['confirmed'] == 2
+
+
+def test_a_strong_confirmation_stands_alone_after_a_first_stage_error(pipeline):
+    assert pipeline.combine(API_ERROR, PROFILE_AVAILABLE) is PROFILE_AVAILABLE
+
+
+@pytest.mark.parametrize('first, second', [
+    (API_ERROR, PROFILE_UNCLEAR),
+    (API_ERROR, PROFILE_ERROR),
+    (API_AVAILABLE, PROFILE_ERROR),
+    (PROFILE_UNCLEAR, CheckResult('name1', Verdict.AVAILABLE, UNCLEAR_STATUS, Method.API)),
+])
+def test_weak_or_missing_evidence_is_unconfirmed(pipeline, first, second):
+    result = pipeline.combine(first, second)
+    assert result.verdict == Verdict.ERROR
+    assert result.status == f"Unconfirmed: {first.status}; {second.status}"
+    assert pipeline.stats['unconfirmed'] == 1
+
+
+def test_run_only_confirms_names_the_first_stage_did_not_rule_out(monkeypatch):
+    checker = InstagramUsernameChecker(max_workers=2)
+    checker.echo = False
+    calls = []
+
+    def check(username, use_api=True, fallback=True):
+        calls.append((username, use_api))
+        if username.startswith('taken'):
+            return CheckResult(username, Verdict.TAKEN, 'Taken (API ❌)', Method.API)
+        method = Method.API if use_api else Method.PROFILE
+        return CheckResult(username, Verdict.AVAILABLE, f'Available ({method.label})', method)
+
+    monkeypatch.setattr(checker, '_check_username', check)
+    pipeline = TriagePipeline(checker, confirm_workers=1)
+    results = {r.username: r for r in pipeline.run(['taken1', 'free1', 'taken2'])}
+    assert results['free1'].verdict == Verdict.AVAILABLE and results['taken1'].verdict == Verdict.TAKEN
+    assert sorted(calls) == [('free1', False), ('free1', True), ('taken1', True), ('taken2', True)]
+    assert pipeline.stats == {'triaged': 3, 'confirmed': 1, 'overturned': 0, 'unconfirmed': 0}
@@ -0,0 +1,76 @@
+# By Moh0py dev github.com/Moh0py
+import pytest
+
+from checker import InstagramUsernameChecker
+from mock_server import MockInstagramServer
+from profile_parser import UNCLEAR_STATUS, ProfileScanner, classify_profile_content
+from results import Verdict
+
+PADDING = b'<script>' + b'x' * 4000 + b'</script>'
+
+
+def test_not_found_page_is_decided_early():
+    scanner = ProfileScanner('someone')
+    assert scanner.feed(b'<html><head>' + PADDING) is None
+    assert scanner.feed(b"<h2>Sorry, this page isn't available.</h2>") == (True, "Available (not found page)")
+
+
+def test_username_marker_is_decided_early():
+    scanner = ProfileScanner('Some.One')
+    assert scanner.feed(PADDING) is None
+    assert scanner.feed(b'{"username":"some.one","full_name":"x"}') == (False, "Taken (Profile)")
+
+
+def test_markers_split_across_chunks_are_found():
+    page = PADDING + b'{"username":"some.one"}' + PADDING
+    split = page.index(b'some.one') + 4
+    scanner = ProfileScanner('some.one')
+    assert scanner.feed(page[:split]) is None
+    assert scanner.feed(page[split:]) == (False, "Taken (Profile)")
+
+    page = PADDING + b'"graphql":{"user":null}'
+    scanner = ProfileScanner('ghost')
+    assert scanner.feed(page[:-8]) is None
+    assert scanner.feed(page[-8:]) == (True, "Available (not found page)")
+
+
+@pytest.mark.parametrize('body, expected', [
+    (b'"biography":"hello"', (False, "Taken (Profile)")),
+    (b'"user":{"id"', (False, "Taken (JSON user)")),
+    (b'"username":"other","full_name":"x"', (False, "Taken (JSON user)")),
+    (b'"username":"other"', (True, UNCLEAR_STATUS)),
+    (b'<html></html>', (True, UNCLEAR_STATUS)),
+])
+def test_finish_applies_the_full_page_rules(body, expected):
+    scanner = ProfileScanner('target')
+    for i in range(0, len(body), 3):
+        scanner.feed(body[i:i + 3])
+    assert scanner.finish() == expected
+
+
+def test_classify_profile_content_matches_chunked_scan():
+    for body in (PADDING, PADDING + b'"profile_pic_url":"x"', PADDING + b'Page Not Found', b''):
+        scanner = ProfileScanner('target')
+        verdict = None
+        for i in range(0, len(body), 512):
+            verdict = verdict or scanner.feed(body[i:i + 512])
+        assert classify_profile_content(body, 'target') == (verdict or scanner.finish())
+
+
+def test_truncated_page_without_markers_is_an_error():
+    scanner = ProfileScanner('target')
+    scanner.feed(PADDING)
+    assert scanner.finish(truncated=True) == (None, f"Profile truncated at {len(PADDING)} bytes")
+    assert classify_profile_content(PADDING, 'target', truncated=True)[0] is None
+    assert classify_profile_content(PADDING + b'page not found', 'target', truncated=True) == (
+        True, "Available (not found page)")
+
+
+def test_late_marker_page_beyond_the_cap_is_not_reported_available():
+    with MockInstagramServer(taken_ratio=1.0, profile_size=300_000, late_markers=True, latency=0.0) as mock:
+        checker = InstagramUsernameChecker(base_url=mock.base_url, min_delay=0, max_delay=0,
+                                           profile_max_bytes=64 * 1024)
+        checker.echo = False
+        result = checker._check_username('someone', use_api=False)
+    assert result.verdict == Verdict.ERROR
+    assert result.status == f"Profile truncated at {64 * 1024} bytes"
@@ -0,0 +1,90 @@
+# By Moh0py dev github.com/Moh0py
+import csv
+import glob
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from checker import InstagramUsernameChecker
+from results import RESULT_FIELDS, CheckResult, Method, ResultStore, Verdict
+
+CHECKED_AT = datetime(2024, 5, 1, 12, 30, 15, 250000).timestamp()
+
+
+@pytest.fixture
+def store():
+    store = ResultStore()
+    store.add(CheckResult('free.name', Verdict.AVAILABLE, 'Available (API ✅)', Method.API, CHECKED_AT))
+    store.add(CheckResult('taken_name', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE, CHECKED_AT))
+    store.add(CheckResult('slow.name', Verdict.ERROR, 'Timed out after 30s deadline', Method.TIMEOUT, CHECKED_AT))
+    store.add(CheckResult('also_taken', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE, CHECKED_AT))
+    return store
+
+
+def test_result_is_the_historical_dict():
+    result = CheckResult('free.name', Verdict.AVAILABLE, 'Available (API ✅)', Method.API, CHECKED_AT)
+    expected = {
+        'username': 'free.name',
+        'available': True,
+        'status': 'Available (API ✅)',
+        'method': 'API',
+        'timestamp': '2024-05-01T12:30:15.250000'
+    }
+    assert result == expected
+    assert result.to_dict() == expected
+    assert type(result.to_dict()) is dict
+    assert list(result) == RESULT_FIELDS
+    assert json.loads(json.dumps(result)) == expected
+    assert (result.verdict, result.method, result.checked_at) == (Verdict.AVAILABLE, Method.API, CHECKED_AT)
+
+
+def test_store_round_trips_results_and_counts(store):
+    assert len(store) == store.total() == 4
+    assert store.counts() == {'available': 1, 'unavailable': 2, 'errors': 1}
+    assert [r.username for r in store.by_verdict(Verdict.TAKEN)] == ['taken_name', 'also_taken']
+    first = store[0]
+    assert first == CheckResult('free.name', Verdict.AVAILABLE, 'Available (API ✅)', Method.API, CHECKED_AT)
+    assert first.method == Method.API and first.checked_at == CHECKED_AT
+
+
+def test_tally_counts_without_storing():
+    store = ResultStore()
+    store.add(CheckResult('kept', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE))
+    store.tally(CheckResult('counted', Verdict.AVAILABLE, 'Available (API ✅)', Method.API))
+    assert len(store) == 1
+    assert store.total() == 2
+    assert store.count(Verdict.AVAILABLE) == 1
+    assert [r.username for r in store] == ['kept']
+
+
+def test_clear_resets_rows_and_counters(store):
+    store.clear()
+    assert len(store) == store.total() == 0
+    assert store.snapshot() == []
+
+
+def test_save_results_writes_the_historical_formats(store, tmp_path):
+    checker = InstagramUsernameChecker()
+    for result in store:
+        checker.results.add(result)
+    checker.save_results(str(tmp_path))
+
+    with open(glob.glob(os.path.join(tmp_path, '*_results.csv'))[0], newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == RESULT_FIELDS
+        rows = list(reader)
+    assert rows[0] == {'username': 'free.name', 'available': 'True', 'status': 'Available (API ✅)',
+                       'method': 'API', 'timestamp': '2024-05-01T12:30:15.250000'}
+    assert [(r['username'], r['available'], r['method']) for r in rows[1:]] == [
+        ('taken_name', 'False', 'Profile'), ('also_taken', 'False', 'Profile'), ('slow.name', 'False', 'timeout')]
+
+    with open(glob.glob(os.path.join(tmp_path, '*_available.txt'))[0], encoding='utf-8') as f:
+        assert f.read().splitlines()[-1] == 'free.name - Available (API ✅) (API)'
+
+    with open(glob.glob(os.path.join(tmp_path, '*_summary.json'))[0], encoding='utf-8') as f:
+        summary = json.load(f)
+    assert (summary['total_checked'], summary['available_count'], summary['unavailable_count'],
+            summary['error_count']) == (4, 1, 2, 1)
+    assert summary['error_usernames'] == ['slow.name']
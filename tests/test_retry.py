@@ -0,0 +1,146 @@
+# By Moh0py dev github.com/Moh0py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from checker import InstagramUsernameChecker, RetryQueue, RetryTimer
+from results import CheckResult, Method, Verdict
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = {'now': 100.0}
+    monkeypatch.setattr('checker.time.monotonic', lambda: clock['now'])
+    return clock
+
+
+def error(username='name'):
+    return CheckResult(username, Verdict.ERROR, 'HTTP 429 (API)', Method.API)
+
+
+def test_backoff_doubles_within_jitter_and_is_capped():
+    queue = RetryQueue(base_delay=2.0, max_delay=10.0)
+    for attempt, delay in ((1, 2.0), (2, 4.0), (3, 8.0), (4, 10.0), (8, 10.0)):
+        for _ in range(50):
+            assert delay / 2 <= queue.backoff(attempt) <= delay
+
+
+def test_should_retry_only_transient_errors_within_attempts():
+    queue = RetryQueue(max_attempts=3)
+    assert queue.should_retry(error(), 1)
+    assert queue.should_retry(error(), 2)
+    assert not queue.should_retry(error(), 3)
+    assert not queue.should_retry(CheckResult('name', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE), 1)
+    assert not queue.should_retry(CheckResult('na..me', Verdict.ERROR, 'Invalid format', Method.VALIDATION), 1)
+
+
+def test_names_come_back_in_due_order(clock, monkeypatch):
+    monkeypatch.setattr('checker.random.uniform', lambda low, high: 0.0)
+    queue = RetryQueue(base_delay=2.0)
+    queue.push('third', 3)   # 8 s backoff -> 4 s without jitter
+    queue.push('first', 1)   # 2 s -> 1 s
+    queue.push('second', 2)  # 4 s -> 2 s
+    assert len(queue) == 3
+    assert queue.pop_due() is None
+    assert queue.wait_time() == pytest.approx(1.0)
+
+    clock['now'] += 2.0
+    assert queue.pop_due() == ('first', 2)
+    assert queue.pop_due() == ('second', 3)
+    assert queue.pop_due() is None
+    assert queue.wait_time() == pytest.approx(2.0)
+
+    clock['now'] += 2.0
+    assert queue.pop_due() == ('third', 4)
+    assert queue.wait_time() is None
+
+
+def test_single_name_check_retries_transient_errors(monkeypatch):
+    checker = InstagramUsernameChecker(max_attempts=3, retry_backoff=0.0)
+    checker.echo = False
+    outcomes = iter([error('name'), error('name'), CheckResult('name', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE)])
+    monkeypatch.setattr(checker, '_check_username', lambda username, use_api=True: next(outcomes))
+
+    result = checker.check_single_username('name')
+    assert result.verdict == Verdict.TAKEN
+    assert checker.get_stats()['total_checked'] == 1
+
+
+def test_single_name_check_gives_up_after_max_attempts(monkeypatch):
+    checker = InstagramUsernameChecker(max_attempts=2, retry_backoff=0.0)
+    checker.echo = False
+    calls = []
+    monkeypatch.setattr(checker, '_check_username', lambda username, use_api=True: calls.append(username) or error())
+
+    assert checker.check_single_username('name').verdict == Verdict.ERROR
+    assert len(calls) == 2
+
+
+def test_iter_check_defers_failed_names_behind_fresh_ones(monkeypatch):
+    checker = InstagramUsernameChecker(max_workers=1, max_attempts=2, retry_backoff=0.0)
+    checker.echo = False
+    failed_once = set()
+
+    def check(username, use_api=True):
+        if username == 'flaky' and username not in failed_once:
+            failed_once.add(username)
+            return error(username)
+        return CheckResult(username, Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE)
+
+    monkeypatch.setattr(checker, '_check_username', check)
+    order = [result.username for result in checker.iter_check(['flaky', 'a1', 'b2', 'c3'], max_pending=1)]
+    assert order == ['a1', 'b2', 'c3', 'flaky']
+    assert checker.get_stats()['errors'] == 0
+
+
+def test_retry_timer_runs_callbacks_in_due_order():
+    timer = RetryTimer()
+    ran = []
+    done = threading.Event()
+    timer.call_later(0.15, lambda: (ran.append('late'), done.set()))
+    timer.call_later(0.0, lambda: ran.append('now'))
+    timer.call_later(0.05, lambda: ran.append('soon'))
+    assert done.wait(2)
+    assert ran == ['now', 'soon', 'late']
+    assert len(timer) == 0
+
+
+def test_pool_retries_free_the_worker_during_the_backoff(monkeypatch):
+    checker = InstagramUsernameChecker(max_attempts=2, retry_backoff=0.6)
+    checker.echo = False
+    failed_once = set()
+    finished = {}
+
+    def check(username, use_api=True):
+        if username == 'flaky' and username not in failed_once:
+            failed_once.add(username)
+            return error(username)
+        return CheckResult(username, Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE)
+
+    monkeypatch.setattr(checker, '_check_username', check)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        started = time.monotonic()
+        flaky = checker.submit_check(executor, 'flaky')
+        flaky.add_done_callback(lambda f: finished.setdefault('flaky', time.monotonic() - started))
+        time.sleep(0.05)
+        other = checker.submit_check(executor, 'other')
+        assert other.result(2).verdict == Verdict.TAKEN
+        assert time.monotonic() - started < 0.25
+        assert not flaky.done()
+        assert flaky.result(2).verdict == Verdict.TAKEN
+    assert finished['flaky'] >= 0.3
+    assert checker.get_stats()['total_checked'] == 2 and checker.get_stats()['errors'] == 0
+
+
+def test_pool_retry_gives_the_last_error_when_the_pool_shuts_down(monkeypatch):
+    checker = InstagramUsernameChecker(max_attempts=3, retry_backoff=0.2)
+    checker.echo = False
+    monkeypatch.setattr(checker, '_check_username', lambda username, use_api=True: error(username))
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = checker.submit_check(executor, 'name', record=False)
+    time.sleep(0.05)
+    executor.shutdown(wait=True)
+    assert future.result(2).status == 'HTTP 429 (API)'
+    assert checker.get_stats()['total_checked'] == 0
@@ -0,0 +1,72 @@
+# By Moh0py dev github.com/Moh0py
+from checker import InstagramUsernameChecker
+from results import CheckResult, Method, Verdict
+from scheduler import PriorityScheduler, ValueScorer, VerdictHistory
+
+NOW = 1_700_000_000.0
+DAY = 86400.0
+
+
+def test_priority_then_unknown_then_error_then_stale():
+    history = VerdictHistory()
+    history.record('fresh', Verdict.TAKEN, NOW - 60)
+    history.record('old', Verdict.TAKEN, NOW - 2 * DAY)
+    history.record('half', Verdict.TAKEN, NOW - DAY / 2)
+    history.record('failed', Verdict.ERROR, NOW - 60)
+    history.record('vip', Verdict.TAKEN, NOW - 60)
+    scheduler = PriorityScheduler(ValueScorer(history, priority=['vip', 'vip2'], now=NOW))
+    scheduler.extend(['fresh', 'half', 'old', 'failed', 'unknown', 'vip2', 'vip'])
+    assert list(scheduler) == ['vip2', 'vip', 'unknown', 'failed', 'old', 'half', 'fresh']
+
+
+def test_ties_keep_insertion_order_and_duplicates_are_dropped():
+    scheduler = PriorityScheduler()
+    scheduler.extend(['b', 'a', 'B ', 'c', 'a'])
+    assert len(scheduler) == 3
+    assert list(scheduler) == ['b', 'a', 'c']
+
+
+def test_limit_and_stop_condition():
+    scheduler = PriorityScheduler(limit=2)
+    scheduler.extend(['a', 'b', 'c'])
+    assert scheduler.expected() == 2
+    assert list(scheduler) == ['a', 'b']
+    assert len(scheduler) == 1
+
+    stop = {'now': False}
+    scheduler = PriorityScheduler(should_stop=lambda: stop['now'])
+    scheduler.extend(['a', 'b', 'c'])
+    handed = []
+    for name in scheduler:
+        handed.append(name)
+        stop['now'] = True
+    assert handed == ['a']
+
+
+def test_names_pushed_during_iteration_jump_ahead():
+    scheduler = PriorityScheduler()
+    for name, score in (('low1', 1.0), ('low2', 1.0), ('low3', 1.0)):
+        scheduler.push(name, score)
+    order = []
+    for name in scheduler:
+        order.append(name)
+        if name == 'low1':
+            scheduler.push('urgent', 50.0)
+    assert order == ['low1', 'urgent', 'low2', 'low3']
+
+
+def test_history_loads_saved_results(tmp_path):
+    checker = InstagramUsernameChecker()
+    checker.results.add(CheckResult('free', Verdict.AVAILABLE, 'Available (API ✅)', Method.API, NOW - 10))
+    checker.results.add(CheckResult('gone', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE, NOW - 20))
+    checker.results.add(CheckResult('flaky', Verdict.ERROR, 'HTTP 429 (API)', Method.API, NOW - 30))
+    checker.save_results(str(tmp_path))
+
+    history = VerdictHistory.from_paths([str(tmp_path)])
+    assert len(history) == 3
+    assert history.get('free') == (Verdict.AVAILABLE, NOW - 10)
+    assert history.get('GONE') == (Verdict.TAKEN, NOW - 20)
+    assert history.get('flaky') == (Verdict.ERROR, NOW - 30)
+
+    history.record('gone', Verdict.AVAILABLE, NOW - 100)
+    assert history.get('gone')[0] == Verdict.TAKEN
@@ -0,0 +1,105 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import threading
+import time
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from checker import InstagramUsernameChecker
+from results import CheckResult, Method, Verdict
+from server import CheckRequestHandler, CheckService, serve
+
+
+@pytest.fixture
+def service(monkeypatch):
+    checker = InstagramUsernameChecker(max_workers=4)
+    checker.echo = False
+    calls = []
+    release = threading.Event()
+    release.set()
+
+    def check(username, use_api=True):
+        calls.append((username, use_api))
+        release.wait(5)
+        if '..' in username:
+            return CheckResult(username, Verdict.ERROR, 'Invalid format', Method.VALIDATION)
+        return CheckResult(username, Verdict.TAKEN, 'Taken (Profile)', Method.API if use_api else Method.PROFILE)
+
+    monkeypatch.setattr(checker, '_check_username', check)
+    service = CheckService(checker, cache_ttl=60.0)
+    service.calls, service.release = calls, release
+    yield service
+    release.set()
+    service.shutdown()
+
+
+def test_concurrent_requests_for_a_name_share_one_check(service):
+    service.release.clear()
+    futures = [service.submit(name) for name in ('alpha1', 'Alpha1 ', 'alpha1')]
+    assert futures[0] is futures[1] is futures[2]
+    service.release.set()
+    assert futures[0].result(5).username == 'alpha1'
+    assert service.calls == [('alpha1', True)]
+    assert service.get_stats()['merged_requests'] == 2
+
+
+def test_verdicts_are_cached_per_method(service):
+    service.submit('alpha1').result(5)
+    assert service.submit('alpha1').result(5).method == Method.API
+    assert service.submit('alpha1', use_api=False).result(5).method == Method.PROFILE
+    assert service.calls == [('alpha1', True), ('alpha1', False)]
+    stats = service.get_stats()
+    assert stats['cache_hits'] == 1 and stats['cached'] == 2
+
+
+def test_errors_are_not_cached_and_expired_verdicts_are_evicted(service):
+    service.submit('bad..name').result(5)
+    service.submit('bad..name').result(5)
+    assert len(service.calls) == 2
+
+    service.cache_ttl = 0.05
+    service.submit('alpha1').result(5)
+    time.sleep(0.1)
+    assert service.get_stats()['cached'] == 0
+    service.submit('alpha1').result(5)
+    assert service.calls.count(('alpha1', True)) == 2
+
+
+def test_check_many_answers_every_requested_entry(service):
+    results = list(service.check_many(['alpha1', 'beta2', 'alpha1', 'bad..name']))
+    assert sorted(r['username'] for r in results) == ['alpha1', 'alpha1', 'bad..name', 'beta2']
+    assert len(service.calls) == 3
+
+
+def test_http_api_streams_one_ndjson_line_per_name(service):
+    handler = type('Handler', (CheckRequestHandler,), {'service': service})
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        body = json.dumps({'usernames': ['alpha1', 'beta2', 'alpha1', 'bad..name']}).encode()
+        with urllib.request.urlopen(urllib.request.Request(f"{url}/check", data=body, method='POST')) as response:
+            assert response.headers['Content-Type'] == 'application/x-ndjson'
+            lines = [json.loads(line) for line in response.read().splitlines()]
+        assert sorted(line['username'] for line in lines) == ['alpha1', 'alpha1', 'bad..name', 'beta2']
+        assert set(lines[0]) == {'username', 'available', 'status', 'method', 'timestamp'}
+
+        with urllib.request.urlopen(f"{url}/stats") as response:
+            assert json.load(response)['cached'] == 2
+        request = urllib.request.Request(f"{url}/check", data=b'{"usernames": "alpha1"}', method='POST')
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == 400
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_serve_refuses_to_replace_a_regular_file(tmp_path):
+    path = tmp_path / 'not-a-socket'
+    path.write_text('keep me')
+    with pytest.raises(FileExistsError):
+        serve(InstagramUsernameChecker(), socket_path=str(path))
+    assert path.read_text() == 'keep me'
@@ -0,0 +1,50 @@
+# By Moh0py dev github.com/Moh0py
+import json
+import threading
+
+from checker import InstagramUsernameChecker
+from mock_server import MockInstagramServer
+from tracer import Tracer
+
+
+def test_ring_buffer_keeps_only_the_most_recent_spans():
+    tracer = Tracer(capacity=3)
+    assert tracer.recorded == 0
+    for i in range(5):
+        with tracer.span(f'span{i}', 'io', index=i):
+            pass
+    assert len(tracer) == 3 and tracer.recorded == 5
+    events = [e for e in tracer.to_chrome_trace()['traceEvents'] if e['ph'] == 'X']
+    assert [e['name'] for e in events] == ['span2', 'span3', 'span4']
+    assert events[0]['cat'] == 'io' and events[0]['args'] == {'index': 2}
+    assert all(e['dur'] >= 0 for e in events)
+
+
+def test_export_writes_chrome_trace_with_one_track_per_thread(tmp_path):
+    tracer = Tracer()
+    tracer.record('main_span', 'check', 0, 1000)
+    worker = threading.Thread(target=lambda: tracer.record('worker_span', 'check', 0, 2000), name='worker-1')
+    worker.start()
+    worker.join()
+
+    path = tmp_path / 'trace.json'
+    assert tracer.export(str(path)) == 2
+    trace = json.loads(path.read_text())
+    spans = {e['name']: e for e in trace['traceEvents'] if e['ph'] == 'X'}
+    threads = {e['tid']: e['args']['name'] for e in trace['traceEvents'] if e['name'] == 'thread_name'}
+    assert spans['main_span']['tid'] != spans['worker_span']['tid']
+    assert threads[spans['worker_span']['tid']] == 'worker-1'
+    assert spans['worker_span']['dur'] == 2.0
+    assert trace['otherData'] == {'spans_recorded': 2, 'spans_kept': 2}
+
+
+def test_checker_records_request_and_check_spans():
+    tracer = Tracer()
+    with MockInstagramServer(latency=0.0, profile_size=1_000) as mock:
+        checker = InstagramUsernameChecker(base_url=mock.base_url, min_delay=0, max_delay=0, tracer=tracer)
+        checker.echo = False
+        checker.check_single_username('alpha1')
+    events = [e for e in tracer.to_chrome_trace()['traceEvents'] if e['ph'] == 'X']
+    checks = [e for e in events if e['name'] == 'check']
+    assert len(checks) == 1 and checks[0]['args']['username'] == 'alpha1'
+    assert len(events) > 1
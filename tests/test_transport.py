@@ -0,0 +1,61 @@
+# By Moh0py dev github.com/Moh0py
+import pytest
+import requests
+
+from checker import InstagramUsernameChecker
+from mock_server import MockInstagramServer
+from results import Verdict
+from transport import Cassette, ReplayAdapter, create_transport
+
+NAMES = ['alpha1', 'beta2', 'gamma3', 'delta4']
+
+
+def run(transport, base_url, names=NAMES, use_api=True):
+    checker = InstagramUsernameChecker(base_url=base_url, transport=transport, min_delay=0, max_delay=0)
+    checker.echo = False
+    return {name: checker.check_single_username(name, use_api=use_api) for name in names}
+
+
+@pytest.mark.parametrize('filename', ['session.json', 'session.json.gz'])
+def test_replay_reproduces_recorded_verdicts_offline(tmp_path, filename):
+    path = str(tmp_path / filename)
+    with MockInstagramServer(taken_ratio=0.5, profile_size=5_000, latency=0.0, capacity=1000) as mock:
+        recorder = create_transport(record=path)
+        recorded = run(recorder, mock.base_url)
+        base_url = mock.base_url
+    recorder.save()
+
+    replayed = run(create_transport(replay=path), base_url)
+    assert {name: r.status for name, r in replayed.items()} == {name: r.status for name, r in recorded.items()}
+    assert {r.verdict for r in replayed.values()} <= {Verdict.AVAILABLE, Verdict.TAKEN}
+
+
+def test_unrecorded_request_fails_like_a_dead_network(tmp_path):
+    path = str(tmp_path / 'session.json')
+    with MockInstagramServer(latency=0.0, profile_size=1_000) as mock:
+        recorder = create_transport(record=path)
+        run(recorder, mock.base_url, names=['alpha1'], use_api=False)
+        base_url = mock.base_url
+    recorder.save()
+
+    result = run(create_transport(replay=path), base_url, names=['unknown9'], use_api=False)['unknown9']
+    assert result.verdict == Verdict.ERROR
+
+
+def test_repeated_requests_replay_in_order_then_repeat_the_last(tmp_path):
+    cassette = Cassette(str(tmp_path / 'c.json'))
+    cassette.exchanges = [
+        {'method': 'GET', 'url': 'http://x/a', 'request_body': '', 'status': status, 'headers': {}, 'body': body}
+        for status, body in ((429, 'slow down'), (200, 'ok'))
+    ]
+    cassette.save()
+    session = requests.Session()
+    session.mount('http://', ReplayAdapter(Cassette(cassette.path).load()))
+    assert [(r.status_code, r.text) for r in (session.get('http://x/a') for _ in range(3))] == [
+        (429, 'slow down'), (200, 'ok'), (200, 'ok')]
+
+
+def test_record_and_replay_are_exclusive(tmp_path):
+    with pytest.raises(ValueError):
+        create_transport(record=str(tmp_path / 'a.json'), replay=str(tmp_path / 'b.json'))
+    assert create_transport() is None
@@ -0,0 +1,87 @@
+# By Moh0py dev github.com/Moh0py
+import io
+import logging
+import random
+import string
+
+import pytest
+
+from utils import (USERNAME_RULES, RateLimiter, console_logging_paused, summarize_latencies, username_rejection,
+                   validate_username)
+from wordlist import VALIDATE_LINE
+
+EDGE_CASES = [
+    '', 'a', 'a' * 30, 'a' * 31, 'valid_user', 'valid.user', 'user123', '_user', 'user_', '.user', 'user.',
+    'us..er', 'us__er', 'us._er', 'user-name', 'user name', 'ünïcode', 'a.b', 'a_b', '1', '_', '.', '..'
+]
+
+
+def random_names(count, seed=3):
+    rng = random.Random(seed)
+    alphabet = string.ascii_letters + string.digits + '._-!'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 33))) for _ in range(count)]
+
+
+@pytest.mark.parametrize('name', EDGE_CASES)
+def test_validate_username_agrees_with_username_rejection(name):
+    assert validate_username(name) == (username_rejection(name) is None)
+
+
+def test_username_rejection_names_the_first_broken_rule():
+    assert username_rejection('') == 'empty'
+    assert username_rejection(None) == 'empty'
+    assert username_rejection('a' * 31) == 'length'
+    assert username_rejection('bad-name') == 'characters'
+    assert username_rejection('_name') == 'leading_trailing'
+    assert username_rejection('na..me') == 'consecutive'
+    assert username_rejection('na.me') is None
+    assert set(USERNAME_RULES) >= {username_rejection(n) for n in random_names(2000)} - {None}
+
+
+def test_wordlist_fast_path_never_accepts_an_invalid_name():
+    """The offline cleaner's bytes regex must only shortcut names the shared rules accept"""
+    for name in EDGE_CASES + random_names(5000):
+        match = VALIDATE_LINE.search(name.encode('utf-8'))
+        if match and match.group(1) is not None:
+            assert username_rejection(match.group(1).decode('ascii')) is None, name
+
+
+def test_summarize_latencies_percentiles():
+    stats = summarize_latencies([float(i) for i in range(1, 101)])
+    assert stats['count'] == 100
+    assert (stats['p50'], stats['p90'], stats['p99'], stats['max']) == (50.0, 90.0, 99.0, 100.0)
+    assert summarize_latencies([])['count'] == 0
+
+
+def test_rate_limiter_allows_burst_then_paces(monkeypatch):
+    clock = {'now': 0.0}
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock['now'] += seconds
+
+    monkeypatch.setattr('utils.time.monotonic', lambda: clock['now'])
+    monkeypatch.setattr('utils.time.sleep', sleep)
+    limiter = RateLimiter(2.0, burst=2)
+    for _ in range(3):
+        limiter.acquire()
+    assert sleeps == [pytest.approx(0.5)]
+
+
+def test_console_logging_paused_silences_only_console_handlers(tmp_path):
+    root = logging.getLogger()
+    console, file = logging.StreamHandler(io.StringIO()), logging.FileHandler(tmp_path / 'check.log')
+    root.addHandler(console)
+    root.addHandler(file)
+    try:
+        with console_logging_paused():
+            root.warning("Retrying alpha1")
+        root.warning("after")
+    finally:
+        root.removeHandler(console)
+        root.removeHandler(file)
+        file.close()
+    assert console.stream.getvalue() == "after\n"
+    assert (tmp_path / 'check.log').read_text() == "Retrying alpha1\nafter\n"
+    assert console.level == logging.NOTSET
@@ -0,0 +1,97 @@
+# By Moh0py dev github.com/Moh0py
+import json
+
+import pytest
+
+from checker import InstagramUsernameChecker
+from results import CheckResult, Method, Verdict
+from watcher import Watchlist
+
+TAKEN = CheckResult('name', Verdict.TAKEN, 'Taken (Profile)', Method.PROFILE)
+AVAILABLE = CheckResult('name', Verdict.AVAILABLE, 'Available (API ✅)', Method.API)
+ERROR = CheckResult('name', Verdict.ERROR, 'HTTP 429 (API)', Method.API)
+
+
+class RecordingNotifier:
+    def __init__(self):
+        self.notified = []
+
+    def notify(self, result):
+        self.notified.append(result.username)
+
+
+@pytest.fixture
+def watchlist(tmp_path):
+    checker = InstagramUsernameChecker()
+    events = []
+    watchlist = Watchlist(checker, state_file=str(tmp_path / 'watch.json'), base_interval=100.0,
+                          min_interval=10.0, max_interval=300.0, backoff=2.0, on_event=events.append)
+    watchlist.events = events
+    return watchlist
+
+
+def test_interval_backs_off_while_taken_and_resets_on_change(watchlist):
+    watchlist.add(['name'])
+    entry = watchlist.entries['name']
+    intervals = []
+    for result in (TAKEN, TAKEN, TAKEN, TAKEN, ERROR, TAKEN, AVAILABLE, TAKEN):
+        watchlist._reschedule('name', result)
+        intervals.append(round(entry['next_check'] - entry['last_checked']))
+    assert intervals == [100, 200, 300, 300, 10, 300, 10, 100]
+    assert entry['last_verdict'] == 'taken'
+
+
+def test_flagged_names_use_the_minimum_interval(watchlist):
+    watchlist.add(['name'])
+    watchlist.add(['name'], flagged=True)
+    entry = watchlist.entries['name']
+    assert entry['flagged'] and entry['interval'] == 10.0
+    for _ in range(3):
+        watchlist._reschedule('name', TAKEN)
+        assert round(entry['next_check'] - entry['last_checked']) == 10
+
+
+def test_availability_is_announced_once_per_change(watchlist):
+    watchlist.checker.notifier = RecordingNotifier()
+    watchlist.add(['name'])
+    for result in (TAKEN, AVAILABLE, AVAILABLE, ERROR, AVAILABLE, TAKEN, AVAILABLE):
+        watchlist._reschedule('name', result)
+    assert [event['previous_verdict'] for event in watchlist.events] == ['taken', 'taken']
+    assert watchlist.checker.notifier.notified == ['name', 'name']
+
+
+def test_state_round_trips_through_the_state_file(watchlist):
+    watchlist.add(['alpha', 'beta'])
+    watchlist.add(['gamma'], flagged=True)
+    watchlist._reschedule('alpha', TAKEN)
+    watchlist._reschedule('alpha', TAKEN)
+    watchlist.save_state()
+    with open(watchlist.state_file, encoding='utf-8') as f:
+        assert set(json.load(f)['entries']) == {'alpha', 'beta', 'gamma'}
+
+    restored = Watchlist(watchlist.checker, state_file=watchlist.state_file)
+    assert restored.entries == watchlist.entries
+    due = []
+    while True:
+        username = restored._pop_due(float('inf'))
+        if username is None:
+            break
+        due.append(username)
+    assert due[-1] == 'alpha' and sorted(due) == ['alpha', 'beta', 'gamma']
+
+
+def test_run_rechecks_due_names_without_per_check_notifications(watchlist, monkeypatch):
+    watchlist.checker.notifier = RecordingNotifier()
+    calls = []
+
+    def check(username, use_api=True):
+        calls.append(username)
+        return CheckResult(username, Verdict.AVAILABLE, 'Available (API ✅)', Method.API)
+
+    monkeypatch.setattr(watchlist.checker, '_check_username', check)
+    watchlist.add(['one', 'two'])
+    watchlist.run(max_checks=2, save_every=3600)
+    assert sorted(calls) == ['one', 'two']
+    # Only the watchlist's transition to available notifies, not the recorded check
+    assert sorted(watchlist.checker.notifier.notified) == ['one', 'two']
+    assert watchlist.checks_done == 2
@@ -0,0 +1,126 @@
+# By Moh0py dev github.com/Moh0py
+import io
+import os
+
+import pytest
+
+from wordlist import Wordlist, parse_shard, validate_wordlist
+
+
+@pytest.fixture
+def wordlist_path(tmp_path):
+    lines = ['# header', ''] + [f'name{i}' for i in range(2000)]
+    path = tmp_path / 'words.txt'
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path), lines
+
+
+def test_shards_are_contiguous_and_cover_every_name_once(wordlist_path):
+    path, lines = wordlist_path
+    expected = [line for line in lines if line and not line.startswith('#')]
+    with Wordlist(path) as wordlist:
+        for count in (1, 3, 7, 64):
+            shards = [wordlist.shard(i, count) for i in range(count)]
+            assert shards[0][0] == 0 and shards[-1][1] == wordlist.size
+            assert all(a[1] == b[0] for a, b in zip(shards, shards[1:]))
+            names = [name for start, end in shards for name in wordlist.iter_names(start, end, block_size=100)]
+            assert names == expected
+        with pytest.raises(ValueError):
+            wordlist.shard(3, 3)
+
+
+def test_line_offset_and_resume(wordlist_path):
+    path, lines = wordlist_path
+    with Wordlist(path, checkpoint_bytes=256) as wordlist:
+        assert wordlist.line_count == len(lines)
+        for line in (0, 1, 2, 3, 500, 1234, len(lines) - 1):
+            offset = wordlist.line_offset(line)
+            assert wordlist._mm[offset:offset + len(lines[line]) + 1] == (lines[line] + '\n').encode()
+        assert wordlist.line_offset(len(lines)) == wordlist.size
+        assert list(wordlist.iter_from_line(1500)) == lines[1500:]
+
+
+def test_index_is_cached_and_rebuilt_when_the_file_changes(wordlist_path, monkeypatch):
+    path, lines = wordlist_path
+    with Wordlist(path, checkpoint_bytes=256) as wordlist:
+        assert wordlist.line_count == len(lines)
+    assert os.path.exists(path + '.idx')
+
+    def fail():
+        raise AssertionError('index should have been loaded from the cache')
+
+    with Wordlist(path, checkpoint_bytes=256) as wordlist:
+        monkeypatch.setattr(wordlist, 'build_index', fail)
+        assert wordlist.line_count == len(lines)
+        assert wordlist.line_offset(1000) == wordlist._mm.find(b'name998\n')
+    monkeypatch.undo()
+
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('extra\nlast-without-newline')
+    with Wordlist(path, checkpoint_bytes=256) as wordlist:
+        assert wordlist.line_count == len(lines) + 2
+        assert list(wordlist.iter_from_line(len(lines))) == ['extra', 'last-without-newline']
+
+
+def test_iter_names_handles_crlf_and_empty_files(tmp_path):
+    path = tmp_path / 'crlf.txt'
+    path.write_bytes(b'one\r\n\r\n# skip\r\n  two  \r\nthree')
+    with Wordlist(str(path)) as wordlist:
+        assert list(wordlist.iter_names()) == ['one', 'two', 'three']
+        assert wordlist.line_count == 5
+
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    with Wordlist(str(empty)) as wordlist:
+        assert list(wordlist.iter_names()) == []
+        assert wordlist.line_count == 0
+
+
+def test_parse_shard():
+    assert parse_shard('1/1') == (0, 1)
+    assert parse_shard('2/8') == (1, 8)
+    for value in ('0/4', '5/4', '1/0', 'x/4', '3'):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_validate_wordlist_cleans_dedupes_and_reports(tmp_path):
+    path = tmp_path / 'raw.txt'
+    raw = ['# comment', '', 'Good.Name', 'good.name', 'bad..name', '_lead', 'has-dash', 'a' * 31,
+           'ok_1', '  spaced  ', 'ok_1'] * 50
+    path.write_text('\n'.join(raw), encoding='utf-8')
+    output = io.BytesIO()
+
+    report = validate_wordlist(str(path), output, processes=2, chunk_bytes=256)
+    assert output.getvalue().decode().splitlines() == ['good.name', 'ok_1', 'spaced']
+    assert report['valid'] == 3
+    assert report['names'] == 9 * 50
+    assert report['rejected_by_rule'] == {'length': 50, 'characters': 50, 'leading_trailing': 50, 'consecutive': 50}
+    assert report['duplicates'] == 9 * 50 - 200 - 3
+
+
+def test_partitioned_dedupe_matches_a_single_set(tmp_path):
+    path = tmp_path / 'repeats.txt'
+    names = [f'user{i % 700}' if i % 3 else f'Other_{i % 500}' for i in range(5000)]
+    path.write_text('\n'.join(names) + '\n', encoding='utf-8')
+    expected = list(dict.fromkeys(name.lower() for name in names))
+    spill = tmp_path / 'spill'
+    spill.mkdir()
+
+    for partition_bytes in (1 << 20, 4096, 97):
+        output = io.BytesIO()
+        report = validate_wordlist(str(path), output, processes=2, chunk_bytes=2048,
+                                   partition_bytes=partition_bytes, spill_dir=str(spill))
+        assert output.getvalue().decode().splitlines() == expected
+        assert report['duplicates'] == len(names) - len(expected)
+        assert report['dedupe_partitions'] == max(1, -(-path.stat().st_size // partition_bytes))
+    assert list(spill.iterdir()) == []
+
+
+def test_validate_wordlist_without_dedupe_keeps_repeats(tmp_path):
+    path = tmp_path / 'raw.txt'
+    path.write_text('b.name\na.name\nB.NAME\nbad..name\n', encoding='utf-8')
+    output = io.BytesIO()
+    report = validate_wordlist(str(path), output, processes=1, dedupe=False)
+    assert output.getvalue() == b'b.name\na.name\nb.name\n'
+    assert report['duplicates'] is None and report['valid'] == 3
@@ -0,0 +1,125 @@
+# By Moh0py dev github.com/Moh0py
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+DEFAULT_CAPACITY = 100_000
+
+
+class _Span:
+    """Context manager timing one span into the tracer's ring buffer"""
+
+    __slots__ = ('tracer', 'name', 'category', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, category: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> '_Span':
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.category, self.start, time.perf_counter_ns(), self.args)
+
+
+class Tracer:
+    """
+    Opt-in per-thread timeline of what every worker is doing
+
+    Spans (token fetch, API POST, profile GET, parse, sleeps, result writes)
+    are kept as plain tuples in a fixed-size ring buffer, so a long run costs
+    a bounded amount of memory and only the most recent `capacity` spans
+    survive. Appending to the buffer needs no lock. export() writes Chrome
+    trace JSON that chrome://tracing and ui.perfetto.dev open directly, with
+    one track per thread.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Most recent spans kept (older ones are overwritten)
+        """
+        self.capacity = capacity
+        self._spans = deque(maxlen=capacity)
+        self._thread_names: Dict[int, str] = {}
+        self._sequence = itertools.count(1)
+        self._origin = time.perf_counter_ns()
+
+    def span(self, name: str, category: str = 'check', **args) -> _Span:
+        """
+        Time a block as one span on the calling thread's track
+
+        Args:
+            name: Span name shown in the viewer
+            category: Span category (filterable in the viewer)
+            **args: Extra details shown when the span is selected
+        """
+        return _Span(self, name, category, args or None)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int,
+               args: Optional[Dict[str, Any]] = None):
+        """Add a finished span measured with time.perf_counter_ns()"""
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self._spans.append((name, category, start_ns, end_ns, thread_id, args, next(self._sequence)))
+
+    @property
+    def recorded(self) -> int:
+        """Spans recorded since the start, including overwritten ones"""
+        try:
+            return self._spans[-1][-1]
+        except IndexError:
+            return 0
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def to_chrome_trace(self) -> Dict:
+        """Spans as a Chrome trace event dictionary (complete "X" events, microseconds)"""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                   'args': {'name': 'instagram-checker'}}]
+        for thread_id, thread_name in list(self._thread_names.items()):
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id,
+                           'args': {'name': thread_name}})
+        for name, category, start_ns, end_ns, thread_id, args, _ in list(self._spans):
+            event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start_ns - self._origin) / 1000,
+                'dur': (end_ns - start_ns) / 1000,
+                'pid': pid,
+                'tid': thread_id
+            }
+            if args:
+                event['args'] = args
+            events.append(event)
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'spans_recorded': self.recorded, 'spans_kept': len(self._spans)}
+        }
+
+    def export(self, path: str) -> int:
+        """
+        Write the buffered spans as Chrome trace JSON
+
+        Args:
+            path: Output file (open it in ui.perfetto.dev or chrome://tracing)
+
+        Returns:
+            Number of spans written
+        """
+        trace = self.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+        return trace['otherData']['spans_kept']
@@ -0,0 +1,187 @@
+# By Moh0py dev github.com/Moh0py
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import cookiejar_from_dict
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Body is stored decoded, so transfer headers from the live response no longer apply
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+def _request_key(request: requests.PreparedRequest) -> Tuple[str, str, str]:
+    """Key used to match a request against recorded exchanges"""
+    body = request.body or ''
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    return request.method, request.url, body
+
+
+def _encode_body(content: bytes) -> Dict:
+    """Store text bodies as-is and binary bodies as base64"""
+    try:
+        return {'body': content.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_b64': base64.b64encode(content).decode('ascii')}
+
+
+def _decode_body(exchange: Dict) -> bytes:
+    if 'body_b64' in exchange:
+        return base64.b64decode(exchange['body_b64'])
+    return exchange.get('body', '').encode('utf-8')
+
+
+class Cassette:
+    """
+    Recorded HTTP exchanges stored in a JSON file (gzip-compressed for *.gz paths)
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Cassette file path
+        """
+        self.path = path
+        self.exchanges: List[Dict] = []
+
+    def load(self) -> 'Cassette':
+        opener = gzip.open if self.path.endswith('.gz') else open
+        with opener(self.path, 'rt', encoding='utf-8') as f:
+            self.exchanges = json.load(f).get('exchanges', [])
+        return self
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        opener = gzip.open if self.path.endswith('.gz') else open
+        with opener(self.path, 'wt', encoding='utf-8') as f:
+            json.dump({'version': 1, 'exchanges': self.exchanges}, f, ensure_ascii=False, separators=(',', ':'))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """
+    Real HTTP transport that also records every exchange into a cassette
+    """
+
+    offline = False
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        content = response.content
+        elapsed = time.perf_counter() - started
+        method, url, body = _request_key(request)
+        exchange = {
+            'method': method,
+            'url': url,
+            'request_body': body,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+            'cookies': response.cookies.get_dict(),
+            'elapsed': round(elapsed, 4)
+        }
+        exchange.update(_encode_body(content))
+        with self._lock:
+            self.cassette.exchanges.append(exchange)
+        return response
+
+    def save(self):
+        with self._lock:
+            self.cassette.save()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Offline transport answering requests from a cassette
+
+    Exchanges are replayed per (method, url, body) in recorded order; once a
+    request's recordings are used up the last one is repeated. Requests that
+    were never recorded fail with a ConnectionError, like a dead network.
+    """
+
+    offline = True
+
+    def __init__(self, cassette: Cassette, simulate_latency: bool = False):
+        """
+        Args:
+            cassette: Loaded cassette
+            simulate_latency: Sleep for each exchange's recorded duration
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.simulate_latency = simulate_latency
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str, str], deque] = {}
+        for exchange in cassette.exchanges:
+            key = (exchange['method'], exchange['url'], exchange.get('request_body', ''))
+            self._queues.setdefault(key, deque()).append(exchange)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = _request_key(request)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise requests.exceptions.ConnectionError(f"No recorded response for {key[0]} {key[1]}", request=request)
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+
+        if self.simulate_latency and exchange.get('elapsed'):
+            time.sleep(exchange['elapsed'])
+
+        response = requests.Response()
+        response.status_code = exchange['status']
+        response.reason = exchange.get('reason')
+        response.headers = CaseInsensitiveDict(exchange.get('headers', {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.cookies = cookiejar_from_dict(exchange.get('cookies', {}))
+        response._content = _decode_body(exchange)
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=exchange.get('elapsed', 0.0))
+        return response
+
+    def close(self):
+        pass
+
+    def save(self):
+        pass
+
+
+def create_transport(record: Optional[str] = None, replay: Optional[str] = None,
+                     simulate_latency: bool = False) -> Optional[BaseAdapter]:
+    """
+    Build a recording or replaying transport adapter
+
+    Args:
+        record: Cassette path to record into
+        replay: Cassette path to replay from
+        simulate_latency: When replaying, sleep for each recorded duration
+
+    Returns:
+        Adapter to pass to InstagramUsernameChecker, or None for plain HTTP
+    """
+    if record and replay:
+        raise ValueError("Cannot record and replay at the same time")
+    if record:
+        return RecordingAdapter(Cassette(record))
+    if replay:
+        return ReplayAdapter(Cassette(replay).load(), simulate_latency=simulate_latency)
+    return None
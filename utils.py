@@ -1,8 +1,12 @@
 # By Moh0py dev github.com/Moh0py
+import contextlib
 import logging
+import math
 import time
 import random
 import re
+import sys
+import threading
 from colorama import Fore, Style, init
 
 init(autoreset=True)
@@ -52,9 +56,93 @@ def random_delay(min_seconds=None, max_seconds=None, logger=None, default_min=2.
     time.sleep(delay)
 
 
-def validate_username(username):
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every worker that talks to Instagram
+    
+    Args:
+        rate: Requests allowed per second
+        burst: Maximum number of requests that may be issued back to back
+    """
+    
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request slot is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def summarize_latencies(samples):
+    """
+    Summarize a list of durations (or other samples, e.g. byte counts) as a tail distribution
+    
+    Args:
+        samples: Durations in seconds, or any numeric samples
+    
+    Returns:
+        Dictionary with count, mean, p50, p90, p99 and max (in the samples' unit)
+    """
+    if not samples:
+        return {'count': 0, 'mean': 0.0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+    
+    ordered = sorted(samples)
+    
+    def percentile(p):
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))
+        return round(ordered[index], 3)
+    
+    return {
+        'count': len(ordered),
+        'mean': round(sum(ordered) / len(ordered), 3),
+        'p50': percentile(50),
+        'p90': percentile(90),
+        'p99': percentile(99),
+        'max': round(ordered[-1], 3)
+    }
+
+
+def format_bytes(count):
     """
-    Validate Instagram username according to platform rules
+    Human readable byte count
+    
+    Args:
+        count: Number of bytes
+    
+    Returns:
+        String such as '12.3 KB'
+    """
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(count) < 1024 or unit == 'GB':
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+
+
+USERNAME_CHARS = re.compile(r'^[a-zA-Z0-9._]+$')
+
+# Rule names reported by username_rejection, in the order they are checked
+USERNAME_RULES = ('empty', 'length', 'characters', 'leading_trailing', 'consecutive')
+
+
+def username_rejection(username):
+    """
+    Name of the first Instagram username rule a username breaks
+    
+    This is the single source of the rules: validate_username and the
+    offline wordlist cleaner both decide through it.
     
     Instagram username rules:
     - 1-30 characters long
@@ -66,24 +154,32 @@ def validate_username(username):
         username: Username string to validate
     
     Returns:
-        bool: True if valid, False otherwise
+        One of USERNAME_RULES, or None when the username is valid
     """
     if not username or not isinstance(username, str):
-        return False
-    
+        return 'empty'
     if not (1 <= len(username) <= 30):
-        return False
-    
-    if not re.match(r'^[a-zA-Z0-9._]+$', username):
-        return False
-    
+        return 'length'
+    if not USERNAME_CHARS.match(username):
+        return 'characters'
     if username.startswith(('.', '_')) or username.endswith(('.', '_')):
-        return False
-    
+        return 'leading_trailing'
     if '..' in username or '__' in username:
-        return False
+        return 'consecutive'
+    return None
+
+
+def validate_username(username):
+    """
+    Validate Instagram username according to platform rules (see username_rejection)
     
-    return True
+    Args:
+        username: Username string to validate
+    
+    Returns:
+        bool: True if valid, False otherwise
+    """
+    return username_rejection(username) is None
 
 
 def print_colored_message(message, color):
@@ -109,7 +205,58 @@ def print_colored_message(message, color):
     print(f"{color_code}{message}{Style.RESET_ALL}")
 
 
-def format_results_summary(available_count, unavailable_count, error_count):
+_console_lock = threading.Lock()
+
+
+def print_above_prompt(message, color, prompt="Username: "):
+    """
+    Print a message from a background thread without breaking an active input prompt
+    
+    The current input line is cleared, the message printed, and the prompt
+    redrawn with whatever the user had typed so far (when readline is available).
+    
+    Args:
+        message: Message text to display
+        color: Color name
+        prompt: Prompt string being shown by input() (empty once input has ended)
+    """
+    try:
+        import readline
+        typed = readline.get_line_buffer()
+    except ImportError:
+        typed = ""
+    
+    with _console_lock:
+        sys.stdout.write("\r\033[K")
+        print_colored_message(message, color)
+        if prompt:
+            sys.stdout.write(prompt + typed)
+            sys.stdout.flush()
+
+
+@contextlib.contextmanager
+def console_logging_paused():
+    """
+    Silence the root logger's console handlers while an input prompt is open
+    
+    Worker threads log each check, warning and retry; written straight to the
+    terminal, those lines would land in the middle of the line being typed.
+    File handlers keep recording everything, and the previous levels are
+    restored on exit.
+    """
+    handlers = [handler for handler in logging.getLogger().handlers
+                if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)]
+    levels = [handler.level for handler in handlers]
+    for handler in handlers:
+        handler.setLevel(logging.CRITICAL + 1)
+    try:
+        yield
+    finally:
+        for handler, level in zip(handlers, levels):
+            handler.setLevel(level)
+
+
+def format_results_summary(available_count, unavailable_count, error_count, latency=None, traffic=None):
     """
     Format and display results summary with colors
     
@@ -117,6 +264,8 @@ def format_results_summary(available_count, unavailable_count, error_count):
         available_count: Number of available usernames
         unavailable_count: Number of unavailable usernames
         error_count: Number of errors encountered
+        latency: Optional distribution from summarize_latencies
+        traffic: Optional byte counters from InstagramUsernameChecker.get_traffic_stats
     """
     total = available_count + unavailable_count + error_count
     
@@ -132,6 +281,16 @@ def format_results_summary(available_count, unavailable_count, error_count):
         success_rate = ((available_count + unavailable_count) / total) * 100
         print_colored_message(f"🎯 Success Rate: {success_rate:.1f}%", "blue")
     
+    if latency and latency['count']:
+        print_colored_message(
+            f"⏱️  Check Latency: p50 {latency['p50']:.2f}s | p90 {latency['p90']:.2f}s | "
+            f"p99 {latency['p99']:.2f}s | max {latency['max']:.2f}s", "magenta")
+    
+    if traffic and (traffic['bytes_up'] or traffic['bytes_down']):
+        print_colored_message(
+            f"📶 Traffic: {format_bytes(traffic['bytes_up'])} up | {format_bytes(traffic['bytes_down'])} down | "
+            f"{format_bytes(traffic['bytes_per_username'])} per username", "magenta")
+    
     print_colored_message("="*60, "white")
 
 
@@ -176,10 +335,14 @@ def create_sample_usernames_file(filename="sample_usernames.txt", count=20):
     print_colored_message(f"Created sample file: {filename} with {min(count, len(sample_usernames))} usernames", "green")
 
 
-def get_user_input_usernames():
+def get_user_input_usernames(on_username=None):
     """
     Get usernames from user input (interactive mode)
     
+    Args:
+        on_username: Optional callback invoked with each valid username as soon
+            as it is entered (used to start checking while the user types)
+    
     Returns:
         List of usernames entered by user
     """
@@ -193,7 +356,10 @@ def get_user_input_usernames():
                 break
             if validate_username(username):
                 usernames.append(username)
-                print_colored_message(f"✅ Added: {username}", "green")
+                if on_username:
+                    on_username(username)
+                else:
+                    print_colored_message(f"✅ Added: {username}", "green")
             else:
                 print_colored_message(f"❌ Invalid username format: {username}", "red")
         except KeyboardInterrupt:
@@ -0,0 +1,248 @@
+# By Moh0py dev github.com/Moh0py
+import heapq
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from checker import InstagramUsernameChecker, get_verdict
+from utils import print_colored_message
+
+
+class Watchlist:
+    """
+    Recheck scheduler for a list of taken usernames
+
+    Features:
+    - Min-heap keyed by next check time, so only due names are rechecked
+    - Per-name intervals that back off while a name stays taken
+    - Tighter fixed interval for flagged names
+    - Schedule persisted to disk so restarts resume instantly
+    - Availability events emitted the moment they are detected, once per
+      change to available (also to the checker's notification sinks)
+    """
+
+    def __init__(self, checker: InstagramUsernameChecker, state_file: Optional[str] = None,
+                 base_interval: float = 300.0, min_interval: float = 60.0,
+                 max_interval: float = 21600.0, backoff: float = 1.5,
+                 events_file: Optional[str] = None,
+                 on_event: Optional[Callable[[Dict], None]] = None):
+        """
+        Initialize the watchlist
+
+        Args:
+            checker: Checker used for every recheck (its rate limiter is the global budget);
+                switched to retain_recent() so rechecks are counted, not stored
+            state_file: JSON file the schedule is loaded from and saved to
+            base_interval: Starting recheck interval in seconds
+            min_interval: Interval for flagged names and after errors
+            max_interval: Upper bound for backed-off intervals
+            backoff: Interval multiplier applied each time a name is still taken
+            events_file: Append-only JSON-lines file for availability events
+            on_event: Callback invoked with every availability event
+        """
+        self.checker = checker
+        # Rechecks never end: keep counters, not every result
+        checker.retain_recent()
+        self.state_file = state_file
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.events_file = events_file
+        self.on_event = on_event
+
+        self.entries: Dict[str, Dict] = {}
+        self._heap: List[tuple] = []
+        self.checks_done = 0
+
+        if state_file and os.path.exists(state_file):
+            self.load_state()
+
+    def add(self, usernames: Iterable[str], flagged: bool = False):
+        """
+        Add usernames to the watchlist; names already scheduled keep their state
+
+        Args:
+            usernames: Usernames to watch
+            flagged: Recheck these names at the minimum interval
+        """
+        now = time.time()
+        for username in usernames:
+            username = username.strip().lower()
+            if not username:
+                continue
+            entry = self.entries.get(username)
+            if entry is None:
+                entry = {
+                    'interval': self.min_interval if flagged else self.base_interval,
+                    'next_check': now,
+                    'last_verdict': None,
+                    'last_checked': None,
+                    'stable_checks': 0,
+                    'flagged': flagged
+                }
+                self.entries[username] = entry
+                heapq.heappush(self._heap, (entry['next_check'], username))
+            elif flagged and not entry['flagged']:
+                entry['flagged'] = True
+                entry['interval'] = self.min_interval
+                self._schedule(username, min(entry['next_check'], now + self.min_interval))
+
+    def _schedule(self, username: str, when: float):
+        """Push a name onto the heap; stale heap items are skipped when popped"""
+        self.entries[username]['next_check'] = when
+        heapq.heappush(self._heap, (when, username))
+
+    def _pop_due(self, now: float) -> Optional[str]:
+        """Pop the next username whose check time has passed"""
+        while self._heap and self._heap[0][0] <= now:
+            when, username = heapq.heappop(self._heap)
+            entry = self.entries.get(username)
+            if entry is not None and entry['next_check'] == when:
+                return username
+        return None
+
+    def _next_due_in(self, now: float) -> Optional[float]:
+        """Seconds until the earliest scheduled check"""
+        while self._heap:
+            when, username = self._heap[0]
+            entry = self.entries.get(username)
+            if entry is not None and entry['next_check'] == when:
+                return max(0.0, when - now)
+            heapq.heappop(self._heap)
+        return None
+
+    def _reschedule(self, username: str, result: Dict):
+        """Update a name's interval from its latest verdict and queue the next check"""
+        entry = self.entries[username]
+        verdict = get_verdict(result)
+        previous = entry['last_verdict']
+        now = time.time()
+
+        if verdict == 'error':
+            interval = self.min_interval
+        elif entry['flagged'] or verdict == 'available':
+            entry['stable_checks'] = 0
+            interval = self.min_interval
+        else:
+            if verdict == previous:
+                entry['stable_checks'] += 1
+                entry['interval'] = min(self.max_interval, entry['interval'] * self.backoff)
+            else:
+                entry['stable_checks'] = 0
+                entry['interval'] = self.base_interval
+            interval = entry['interval']
+
+        if verdict != 'error':
+            entry['last_verdict'] = verdict
+        entry['last_checked'] = now
+        self._schedule(username, now + interval)
+
+        if verdict == 'available' and previous != 'available':
+            self._emit({
+                'event': 'available',
+                'username': username,
+                'status': result['status'],
+                'method': result['method'],
+                'previous_verdict': previous,
+                'detected_at': datetime.fromtimestamp(now).isoformat()
+            })
+            # Sinks hear about the change once, not on every recheck while it stays available
+            if self.checker.notifier is not None:
+                self.checker.notifier.notify(result)
+
+    def _emit(self, event: Dict):
+        """Deliver an availability event to the console, events file and callback"""
+        print_colored_message(f"🔔 {event['username']} is now AVAILABLE ({event['status']})", "green")
+        self.checker.logger.info(f"Watch event: {event['username']} became available")
+
+        if self.events_file:
+            with open(self.events_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+        if self.on_event:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                self.checker.logger.error(f"Watch event callback failed: {e}")
+
+    def load_state(self):
+        """Load the persisted schedule and rebuild the heap"""
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self.checker.logger.error(f"Could not load watch state {self.state_file}: {e}")
+            return
+
+        self.entries = state.get('entries', {})
+        self._heap = [(entry['next_check'], username) for username, entry in self.entries.items()]
+        heapq.heapify(self._heap)
+        self.checker.logger.info(f"Loaded watch state for {len(self.entries)} usernames")
+
+    def save_state(self):
+        """Atomically write the schedule to the state file"""
+        if not self.state_file:
+            return
+        tmp_file = f"{self.state_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': time.time(), 'entries': self.entries}, f)
+        os.replace(tmp_file, self.state_file)
+
+    def run(self, max_checks: Optional[int] = None, save_every: float = 30.0):
+        """
+        Run the recheck loop until interrupted
+
+        Args:
+            max_checks: Stop after this many checks (None runs forever)
+            save_every: Seconds between state saves
+        """
+        workers = self.checker.max_workers
+        in_flight = {}
+        last_save = time.monotonic()
+        submitted = 0
+
+        print_colored_message(f"👀 Watching {len(self.entries)} usernames", "cyan")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            try:
+                while True:
+                    now = time.time()
+                    while len(in_flight) < workers and (max_checks is None or submitted < max_checks):
+                        username = self._pop_due(now)
+                        if username is None:
+                            break
+                        in_flight[self.checker.submit_check(executor, username, notify=False)] = username
+                        submitted += 1
+
+                    if not in_flight:
+                        if max_checks is not None and submitted >= max_checks:
+                            break
+                        next_due = self._next_due_in(time.time())
+                        if next_due is None:
+                            break
+                        time.sleep(min(next_due, save_every))
+                    else:
+                        next_due = self._next_due_in(time.time())
+                        timeout = None if next_due is None or len(in_flight) >= workers else next_due
+                        done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            username = in_flight.pop(future)
+                            try:
+                                self._reschedule(username, future.result())
+                            except Exception as e:
+                                self.checker.logger.error(f"Watch check failed for {username}: {e}")
+                                self._schedule(username, time.time() + self.min_interval)
+                            self.checks_done += 1
+
+                    if time.monotonic() - last_save >= save_every:
+                        self.save_state()
+                        last_save = time.monotonic()
+            except KeyboardInterrupt:
+                print_colored_message("\n⚠️  Watch stopped by user", "yellow")
+                for future in in_flight:
+                    future.cancel()
+            finally:
+                self.save_state()
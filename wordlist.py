@@ -0,0 +1,483 @@
+# By Moh0py dev github.com/Moh0py
+import mmap
+import os
+import re
+import struct
+import tempfile
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import compress
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from zlib import crc32
+
+from utils import USERNAME_RULES, username_rejection
+
+INDEX_MAGIC = b'IGWLIDX1'
+INDEX_HEADER = struct.Struct('<8sQQQQQ')
+READ_BLOCK = 1024 * 1024
+VALIDATE_CHUNK = 8 * 1024 * 1024
+# Input bytes per dedupe partition: roughly 5M short names, ~0.5 GB of set per process
+DEDUPE_PARTITION_BYTES = 64 * 1024 * 1024
+MAX_PARTITIONS = 0xFFFF
+
+# Bytes-level equivalent of validate_username for ASCII names
+VALID_NAME = rb'(?![._])(?!.*(?:\.\.|__))[A-Za-z0-9._]{1,30}(?<![._])'
+_LINE_SPACE = rb'[ \t\r\x0b\x0c]*'
+# One match per non-blank, non-comment line: group 1 is a valid stripped name,
+# group 2 is any other line, left for the exact (slow) check
+VALIDATE_LINE = re.compile(
+    rb'^' + _LINE_SPACE + rb'(?:(' + VALID_NAME + rb')' + _LINE_SPACE + rb'$|([^#\s].*)$)', re.M)
+
+
+class Wordlist:
+    """
+    Memory-mapped reader for large one-name-per-line wordlists
+
+    A sparse line index (a checkpoint every `checkpoint_bytes`) is built in
+    one pass and cached next to the file as `<file>.idx`. It is reused
+    while the file's size and mtime are unchanged. With it, seeking to any
+    line is a binary search plus a scan of at most one checkpoint, and the
+    total line count is known without reading the file. Byte-range shards
+    and byte-based progress need no index at all.
+    """
+
+    def __init__(self, path: str, use_index: bool = True, index_path: Optional[str] = None,
+                 checkpoint_bytes: int = 64 * 1024):
+        """
+        Args:
+            path: Wordlist file
+            use_index: Build or load the sidecar index when line positions are needed
+            index_path: Index location (default: path + '.idx')
+            checkpoint_bytes: Bytes between index checkpoints
+        """
+        self.path = path
+        self.use_index = use_index
+        self.index_path = index_path or f"{path}.idx"
+        self.checkpoint_bytes = checkpoint_bytes
+        self.size = os.path.getsize(path)
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        self._offsets: Optional[array] = None
+        self._lines: Optional[array] = None
+        self._line_count: Optional[int] = None
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> 'Wordlist':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Index
+
+    def _stat_key(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load_index(self) -> bool:
+        try:
+            with open(self.index_path, 'rb') as f:
+                magic, checkpoint, size, mtime_ns, line_count, entries = INDEX_HEADER.unpack(
+                    f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or checkpoint != self.checkpoint_bytes:
+                    return False
+                if (size, mtime_ns) != self._stat_key():
+                    return False
+                offsets, lines = array('Q'), array('Q')
+                offsets.fromfile(f, entries)
+                lines.fromfile(f, entries)
+        except (OSError, EOFError, struct.error):
+            return False
+        self._offsets, self._lines, self._line_count = offsets, lines, line_count
+        return True
+
+    def _save_index(self):
+        size, mtime_ns = self._stat_key()
+        tmp_path = f"{self.index_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, self.checkpoint_bytes, size, mtime_ns,
+                                          self._line_count, len(self._offsets)))
+                self._offsets.tofile(f)
+                self._lines.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            # Read-only location: keep the index in memory only
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def build_index(self):
+        """Scan the file once and record (byte offset, line number) checkpoints"""
+        offsets, lines = array('Q', [0]), array('Q', [0])
+        line = 0
+        previous = 0
+        boundary = self.checkpoint_bytes
+        while boundary < self.size:
+            offset = self.line_start_at_or_after(boundary)
+            if offset >= self.size:
+                break
+            line += self._mm[previous:offset].count(b'\n')
+            offsets.append(offset)
+            lines.append(line)
+            previous = offset
+            boundary = offset + self.checkpoint_bytes
+
+        line_count = line
+        if self.size:
+            line_count += self._mm[previous:].count(b'\n')
+            if self._mm[self.size - 1] != 0x0A:
+                line_count += 1
+        self._offsets, self._lines, self._line_count = offsets, lines, line_count
+
+    def ensure_index(self):
+        """Load the cached index, or build and cache it"""
+        if self._offsets is not None:
+            return
+        if self.use_index and self._load_index():
+            return
+        self.build_index()
+        if self.use_index:
+            self._save_index()
+
+    @property
+    def line_count(self) -> int:
+        """Physical lines in the file (including blank and comment lines)"""
+        self.ensure_index()
+        return self._line_count
+
+    # Positions
+
+    def line_start_at_or_after(self, offset: int) -> int:
+        """Byte offset of the first line starting at or after `offset`"""
+        if offset <= 0:
+            return 0
+        if offset >= self.size:
+            return self.size
+        if self._mm[offset - 1] == 0x0A:
+            return offset
+        newline = self._mm.find(b'\n', offset)
+        return self.size if newline < 0 else newline + 1
+
+    def line_offset(self, line: int) -> int:
+        """
+        Byte offset where a line starts
+
+        Args:
+            line: 0-based line number
+
+        Returns:
+            Offset of the line, or the file size when past the end
+        """
+        if line <= 0:
+            return 0
+        self.ensure_index()
+        if line >= self._line_count:
+            return self.size
+        checkpoint = bisect_right(self._lines, line) - 1
+        offset = self._offsets[checkpoint]
+        for _ in range(line - self._lines[checkpoint]):
+            offset = self._mm.find(b'\n', offset) + 1
+        return offset
+
+    def shard(self, index: int, count: int) -> Tuple[int, int]:
+        """
+        Byte range of one of `count` equal shards, aligned to line starts
+
+        Args:
+            index: 0-based shard number
+            count: Number of shards
+
+        Returns:
+            (start, end) byte offsets; shards are contiguous and non-overlapping
+        """
+        if not 0 <= index < count:
+            raise ValueError(f"Shard {index} out of range for {count} shards")
+        start = self.line_start_at_or_after(self.size * index // count)
+        end = self.line_start_at_or_after(self.size * (index + 1) // count)
+        return start, end
+
+    # Iteration
+
+    def iter_names(self, start: int = 0, end: Optional[int] = None,
+                   on_progress: Optional[Callable[[int], None]] = None,
+                   block_size: int = READ_BLOCK) -> Iterator[str]:
+        """
+        Stripped names from a byte range, skipping blank and '#' comment lines
+
+        The mapped file is split a block at a time, so no per-line reads or
+        file-object buffering is involved.
+
+        Args:
+            start: First byte (should be a line start)
+            end: End byte (default: end of file)
+            on_progress: Called with the number of bytes consumed after each block
+            block_size: Bytes split per block (smaller blocks give finer progress)
+
+        Yields:
+            Usernames as str
+        """
+        end = self.size if end is None else min(end, self.size)
+        position = start
+        while position < end:
+            block_end = min(end, position + block_size)
+            if block_end < end:
+                newline = self._mm.rfind(b'\n', position, block_end)
+                block_end = newline + 1 if newline >= position else self.line_start_at_or_after(block_end)
+            block = self._mm[position:block_end]
+            for raw in block.split(b'\n'):
+                raw = raw.strip()
+                if raw and not raw.startswith(b'#'):
+                    yield raw.decode('utf-8', errors='replace')
+            if on_progress is not None:
+                on_progress(block_end - position)
+            position = block_end
+
+    def iter_from_line(self, line: int, on_progress: Optional[Callable[[int], None]] = None) -> Iterator[str]:
+        """Names from a 0-based line index to the end of the file (line N is index N - 1)"""
+        return self.iter_names(self.line_offset(line), on_progress=on_progress)
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec such as '2/8' (1-based shard number over a count)
+
+    Returns:
+        (0-based index, count)
+    """
+    try:
+        number, count = (int(part) for part in value.split('/', 1))
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/k such as 2/8")
+    if count < 1 or not 1 <= number <= count:
+        raise ValueError(f"Invalid shard '{value}', expected 1 <= i <= k")
+    return number - 1, count
+
+
+def _validate_range(task: Tuple[str, int, int, bool, Optional[str], int]) -> Tuple[bytes, int, Counter, int, int]:
+    """
+    Validate one line-aligned byte range of a wordlist (runs in a worker process)
+
+    Without a spill path the valid names come back newline-joined. With one
+    (deduplicating runs) they are written there, grouped by dedupe partition,
+    and only their count comes back.
+
+    Returns:
+        (newline-joined valid names or b'', valid names, rejections per rule, candidate lines, bytes)
+    """
+    path, start, end, normalize, spill_path, partitions = task
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    if normalize:
+        # Case does not affect any rule, so the whole chunk is lowercased at once
+        data = data.lower()
+
+    valid = []
+    rejected = Counter()
+    candidates = 0
+    for name, other in VALIDATE_LINE.findall(data):
+        if name:
+            candidates += 1
+            valid.append(name)
+            continue
+        # Slow path: decide exactly as validate_username does on the decoded line
+        text = other.decode('utf-8', errors='replace').strip()
+        if not text or text.startswith('#'):
+            continue
+        candidates += 1
+        rule = username_rejection(text)
+        if rule is None:
+            valid.append(text.encode('utf-8'))
+        else:
+            rejected[rule] += 1
+
+    if spill_path is None:
+        return b'\n'.join(valid), len(valid), rejected, candidates, end - start
+    _write_spill(spill_path, valid, partitions)
+    return b'', len(valid), rejected, candidates, end - start
+
+
+def _spill_header(partitions: int) -> struct.Struct:
+    return struct.Struct(f'<{partitions + 1}Q')
+
+
+def _write_spill(spill_path: str, names: List[bytes], partitions: int):
+    """
+    Write a chunk's valid names grouped by dedupe partition (crc32 of the name)
+
+    Layout: the name count and each partition's segment length (uint64), the
+    partition of every name in file order (uint16), then every partition's
+    names newline-joined in file order.
+    """
+    parts = array('H')
+    groups = [[] for _ in range(partitions)]
+    if partitions == 1:
+        parts.frombytes(bytes(2 * len(names)))
+        groups[0] = names
+    else:
+        mark, appenders = parts.append, [group.append for group in groups]
+        for name in names:
+            part = crc32(name) % partitions
+            mark(part)
+            appenders[part](name)
+    segments = [b'\n'.join(group) for group in groups]
+    with open(spill_path, 'wb') as f:
+        f.write(_spill_header(partitions).pack(len(names), *map(len, segments)))
+        parts.tofile(f)
+        for segment in segments:
+            f.write(segment)
+
+
+def _dedupe_partition(task: Tuple[List[str], int, int, str]) -> List[int]:
+    """
+    Mark the first occurrence of every name of one partition (runs in a worker process)
+
+    The partition's segment of every chunk is read in file order. One flag
+    byte per name (1 = first occurrence) is written to the keep file.
+
+    Returns:
+        Offset of each chunk's flags in the keep file
+    """
+    spill_paths, partition, partitions, keep_path = task
+    header = _spill_header(partitions)
+    seen = set()
+    add = seen.add
+    offsets = []
+    with open(keep_path, 'wb') as keep:
+        for spill_path in spill_paths:
+            with open(spill_path, 'rb') as f:
+                count, *lengths = header.unpack(f.read(header.size))
+                f.seek(header.size + 2 * count + sum(lengths[:partition]))
+                segment = f.read(lengths[partition])
+            names = segment.split(b'\n') if segment else []
+            flags = bytearray(len(names))
+            for i, name in enumerate(names):
+                if name not in seen:
+                    add(name)
+                    flags[i] = 1
+            offsets.append(keep.tell())
+            keep.write(flags)
+    return offsets
+
+
+def _filter_chunk(task: Tuple[str, int, List[str], List[int]]) -> Tuple[bytes, int]:
+    """
+    Rebuild a chunk's first occurrences in file order (runs in a worker process)
+
+    Returns:
+        (newline-joined kept names, kept names)
+    """
+    spill_path, partitions, keep_paths, keep_offsets = task
+    header = _spill_header(partitions)
+    with open(spill_path, 'rb') as f:
+        count, *lengths = header.unpack(f.read(header.size))
+        parts = array('H')
+        parts.fromfile(f, count)
+        segments = [f.read(length) for length in lengths]
+
+    names, flags = [], []
+    for segment, keep_path, offset in zip(segments, keep_paths, keep_offsets):
+        group = segment.split(b'\n') if segment else []
+        names.append(iter(group))
+        with open(keep_path, 'rb') as keep:
+            keep.seek(offset)
+            flags.append(iter(keep.read(len(group))))
+
+    if partitions == 1:
+        kept = list(compress(names[0], flags[0]))
+    else:
+        kept = []
+        for part in parts:
+            name = next(names[part])
+            if next(flags[part]):
+                kept.append(name)
+    return b'\n'.join(kept), len(kept)
+
+
+def validate_wordlist(path: str, output: BinaryIO, processes: Optional[int] = None, normalize: bool = True,
+                      dedupe: bool = True, chunk_bytes: int = VALIDATE_CHUNK,
+                      partition_bytes: int = DEDUPE_PARTITION_BYTES, spill_dir: Optional[str] = None,
+                      on_progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    Validate, normalize and deduplicate a wordlist offline using all cores
+
+    The file is cut into line-aligned byte ranges that worker processes
+    validate with a compiled bytes pattern. Valid names are written to
+    `output` in file order, keeping the first occurrence of each.
+
+    Deduplication is split by a hash of the name into one partition per
+    `partition_bytes` of input. The workers spill their valid names to a
+    temporary directory, dedupe one partition each (so a process only holds
+    that partition's unique names), and then rebuild every chunk in file
+    order. Peak memory is about `processes` partitions' worth of names, and
+    the spill needs about the size of the valid names on disk.
+
+    Args:
+        path: Wordlist file
+        output: Binary stream receiving one valid name per line
+        processes: Worker processes (default: CPU count)
+        normalize: Lowercase names (Instagram usernames are case-insensitive)
+        dedupe: Drop repeated names
+        chunk_bytes: Approximate bytes per work unit
+        partition_bytes: Input bytes per dedupe partition
+        spill_dir: Directory for the dedupe spill (default: the system temp directory)
+        on_progress: Called with the bytes covered by each validated chunk
+
+    Returns:
+        Report with line, valid, duplicate and per-rule rejection counts
+    """
+    started = time.monotonic()
+    with Wordlist(path, use_index=False) as wordlist:
+        count = max(1, -(-wordlist.size // chunk_bytes))
+        ranges = [r for r in (wordlist.shard(i, count) for i in range(count)) if r[1] > r[0]]
+        partitions = max(1, min(MAX_PARTITIONS, -(-wordlist.size // partition_bytes))) if dedupe else 0
+
+    rejected = Counter({rule: 0 for rule in USERNAME_RULES if rule != 'empty'})
+    candidates = valid = written = 0
+
+    spill_context = tempfile.TemporaryDirectory(prefix='validate-', dir=spill_dir) if dedupe else nullcontext()
+    with ProcessPoolExecutor(max_workers=processes) as pool, spill_context as spill:
+        spill_paths = [os.path.join(spill, f'chunk{i}') if dedupe else None for i in range(len(ranges))]
+        tasks = [(path, start, end, normalize, spill_path, partitions)
+                 for (start, end), spill_path in zip(ranges, spill_paths)]
+        for names, chunk_valid, chunk_rejected, chunk_candidates, covered in pool.map(_validate_range, tasks):
+            rejected.update(chunk_rejected)
+            candidates += chunk_candidates
+            valid += chunk_valid
+            if names:
+                output.write(names + b'\n')
+                written += chunk_valid
+            if on_progress is not None:
+                on_progress(covered)
+
+        if dedupe:
+            keep_paths = [os.path.join(spill, f'keep{p}') for p in range(partitions)]
+            offsets = list(pool.map(_dedupe_partition, [(spill_paths, p, partitions, keep_paths[p])
+                                                        for p in range(partitions)]))
+            filter_tasks = [(spill_path, partitions, keep_paths, [chunk_offsets[i] for chunk_offsets in offsets])
+                            for i, spill_path in enumerate(spill_paths)]
+            for names, kept in pool.map(_filter_chunk, filter_tasks):
+                if kept:
+                    output.write(names + b'\n')
+                    written += kept
+
+    elapsed = time.monotonic() - started
+    return {
+        'file': path,
+        'names': candidates,
+        'valid': written,
+        'duplicates': valid - written if dedupe else None,
+        'rejected': sum(rejected.values()),
+        'rejected_by_rule': dict(rejected),
+        'normalized': normalize,
+        'dedupe_partitions': partitions if dedupe else None,
+        'elapsed_seconds': round(elapsed, 2),
+        'names_per_second': round(candidates / elapsed, 1) if elapsed else 0.0
+    }